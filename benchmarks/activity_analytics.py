@@ -0,0 +1,122 @@
+"""Benchmark the activity analytics on synthetic multi-month history.
+
+Usage: python benchmarks/activity_analytics.py [months] [state changes per day]
+
+Needs Home Assistant and numpy installed. compute_analytics is compared
+with a plain Python loop computing the hourly duty cycle, and the results
+must match.
+"""
+
+from datetime import datetime
+from pathlib import Path
+import sys
+from time import perf_counter
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from custom_components.remote_activity_monitor.activity_analytics import (  # noqa: E402
+    compute_analytics,
+)
+
+TIME_ZONE = ZoneInfo("Europe/Copenhagen")
+DAY_SECONDS = 86400
+
+
+# ------------------------------------------------------------------
+def synthetic_history(
+    months: int, changes_per_day: int
+) -> tuple[np.ndarray, np.ndarray, float, float]:
+    """Alternating on/off history, more activity in the daytime."""
+
+    rng = np.random.default_rng(1)
+    end: float = datetime(2026, 7, 1, tzinfo=TIME_ZONE).timestamp()
+    start: float = end - months * 30 * DAY_SECONDS
+    count: int = months * 30 * changes_per_day
+
+    # Short on periods and off gaps, with long gaps mostly at night
+    durations: np.ndarray = rng.exponential(
+        DAY_SECONDS / changes_per_day, size=count
+    )
+    timestamps: np.ndarray = start + np.cumsum(durations)
+    timestamps = timestamps[timestamps < end]
+    is_on: np.ndarray = np.arange(len(timestamps)) % 2 == 0
+    night: np.ndarray = ((timestamps % DAY_SECONDS) / 3600 < 6) & is_on
+    is_on[night & (rng.random(len(timestamps)) < 0.7)] = False
+
+    return timestamps, is_on, start, end
+
+
+# ------------------------------------------------------------------
+def hourly_duty_cycle_loop(
+    timestamps: np.ndarray, is_on: np.ndarray, start: float, end: float
+) -> list[float | None]:
+    """Hourly duty cycle with a plain Python loop over the state changes."""
+
+    on_time: list[float] = [0.0] * 24
+    total_time: list[float] = [0.0] * 24
+
+    def add(begin: float, finish: float, totals: list[float]) -> None:
+        while begin < finish:
+            local: datetime = datetime.fromtimestamp(begin, TIME_ZONE)
+            hour_end: float = min(
+                local.replace(minute=0, second=0, microsecond=0).timestamp() + 3600,
+                finish,
+            )
+            totals[local.hour] += hour_end - begin
+            begin = hour_end
+
+    add(start, end, total_time)
+    changes: list[tuple[float, bool]] = list(
+        zip(timestamps.tolist(), is_on.tolist(), strict=True)
+    )
+
+    for index, (timestamp, state) in enumerate(changes):
+        if state:
+            finish = changes[index + 1][0] if index + 1 < len(changes) else end
+            add(max(timestamp, start), min(finish, end), on_time)
+
+    return [
+        round(on / total, 4) if total > 0 else None
+        for on, total in zip(on_time, total_time, strict=True)
+    ]
+
+
+# ------------------------------------------------------------------
+def main() -> None:
+    """Run benchmark."""
+
+    months: int = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    changes_per_day: int = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    timestamps, is_on, start, end = synthetic_history(months, changes_per_day)
+    print(f"{months} months, {len(timestamps)} state changes")
+
+    begin: float = perf_counter()
+    analytics: dict = compute_analytics(
+        timestamps, is_on, start, end, TIME_ZONE, 3600, 90
+    )
+    print(f"compute_analytics {(perf_counter() - begin) * 1000:10.1f} ms")
+
+    begin = perf_counter()
+    hourly: list[float | None] = hourly_duty_cycle_loop(
+        timestamps, is_on, start, end
+    )
+    print(f"python loop       {(perf_counter() - begin) * 1000:10.1f} ms")
+
+    if not np.allclose(
+        np.array(analytics["hourly_duty_cycle"], dtype=float),
+        np.array(hourly, dtype=float),
+        atol=1e-3,
+        equal_nan=True,
+    ):
+        sys.exit("Hourly duty cycles differ from the python loop")
+
+    print(f"duty cycle {analytics['duty_cycle']}")
+    print(f"suggested wait {analytics['duration_wait_update']}")
+
+
+if __name__ == "__main__":
+    main()
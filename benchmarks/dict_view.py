@@ -0,0 +1,107 @@
+"""Benchmark DictView against DictToObject on a large nested payload.
+
+Usage: python benchmarks/dict_view.py
+
+Only needs orjson, json_ext is loaded from its file so Home Assistant is
+not imported.
+"""
+
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from time import perf_counter
+import tracemalloc
+
+JSON_EXT_PATH = (
+    Path(__file__).parents[1]
+    / "custom_components"
+    / "remote_activity_monitor"
+    / "hass_util"
+    / "json_ext.py"
+)
+ENTITIES = 5000
+ROUNDS = 20
+
+
+# ------------------------------------------------------------------
+def load_json_ext():
+    """Load json_ext without importing the integration."""
+
+    spec = spec_from_file_location("json_ext", JSON_EXT_PATH)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ------------------------------------------------------------------
+def payload() -> dict:
+    """Nested payload shaped like a get_states response."""
+
+    return {
+        "id": 1,
+        "type": "result",
+        "result": [
+            {
+                "entity_id": f"binary_sensor.sensor_{index}",
+                "state": "on" if index % 2 else "off",
+                "attributes": {
+                    "friendly_name": f"Sensor {index}",
+                    "device_class": "motion",
+                    "options": [{"value": value} for value in range(5)],
+                },
+                "context": {"id": f"{index:026d}", "parent_id": None},
+                "last_changed": "2026-01-01T00:00:00+00:00",
+            }
+            for index in range(ENTITIES)
+        ],
+    }
+
+
+# ------------------------------------------------------------------
+def measure(name: str, create, access) -> None:
+    """Print construction time, access time and allocated memory."""
+
+    start: float = perf_counter()
+
+    for _ in range(ROUNDS):
+        create()
+
+    construct_ms: float = (perf_counter() - start) * 1000 / ROUNDS
+
+    tracemalloc.start()
+    obj = create()
+    allocated, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = perf_counter()
+    value = access(obj)
+    access_ms: float = (perf_counter() - start) * 1000
+
+    print(
+        f"{name:<14} construct {construct_ms:9.3f} ms"
+        f"  access {access_ms:7.3f} ms  memory {allocated / 1024:9.1f} KiB"
+        f"  -> {value}"
+    )
+
+
+# ------------------------------------------------------------------
+def main() -> None:
+    """Run benchmark."""
+
+    json_ext = load_json_ext()
+    data: dict = payload()
+
+    print(f"{ENTITIES} entities, construction averaged over {ROUNDS} rounds")
+    measure(
+        "DictToObject",
+        lambda: json_ext.DictToObject(data),
+        lambda obj: obj.result[ENTITIES // 2].attributes.friendly_name,
+    )
+    measure(
+        "DictView",
+        lambda: json_ext.DictView(data),
+        lambda obj: obj.result[ENTITIES // 2].attributes.friendly_name,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark integration import time and guard the lazy hass_util imports.
+
+Usage: python benchmarks/import_time.py
+Per module breakdown: python -X importtime benchmarks/import_time.py
+
+Needs Home Assistant installed. Modules already loaded by Home Assistant
+itself are the baseline, the script fails if importing the integration
+loads any of the heavy hass_util or analytics dependencies on top of it.
+"""
+
+from importlib import import_module
+from pathlib import Path
+import sys
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+INTEGRATION = "custom_components.remote_activity_monitor"
+MODULES = (
+    INTEGRATION,
+    f"{INTEGRATION}.config_flow",
+    f"{INTEGRATION}.binary_sensor",
+    f"{INTEGRATION}.switch",
+)
+# Only loaded on first use of the hass_util helpers and services needing them
+LAZY_MODULES = (
+    "numpy",
+    "jsonpickle",
+    "aiofiles",
+    "orjson",
+    "homeassistant.components.frontend.storage",
+)
+
+
+# ------------------------------------------------------------------
+def main() -> None:
+    """Run benchmark."""
+
+    start: float = perf_counter()
+    import_module("homeassistant.core")
+    import_module("homeassistant.helpers.storage")
+    print(f"{'homeassistant baseline':<52} {(perf_counter() - start) * 1000:8.1f} ms")
+
+    baseline: set[str] = set(sys.modules)
+
+    for module in MODULES:
+        start = perf_counter()
+        import_module(module)
+        print(f"{module:<52} {(perf_counter() - start) * 1000:8.1f} ms")
+
+    loaded: list[str] = [
+        module
+        for module in LAZY_MODULES
+        if module in sys.modules and module not in baseline
+    ]
+
+    if len(loaded) > 0:
+        sys.exit(f"Loaded on integration import: {', '.join(loaded)}")
+
+    print("No lazy dependency loaded on import")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from asyncio import Event
+from dataclasses import dataclass, field
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
-from .const import CONF_COMPONENT_TYPE, ComponentType
+from .activity_history import history_path
+from .const import CONF_COMPONENT_TYPE, HOT_RELOAD_OPTIONS, ComponentType
+from .issue_manager import IssueManager, async_delete_legacy_issues
 from .shared import Shared
 
 
@@ -19,6 +22,9 @@ class CommonData:
     """Common data."""
 
     shared: Shared
+    issues: IssueManager
+    # Set when the entry is unloaded, stops pending retries
+    stop_event: Event = field(default_factory=Event)
 
 
 # The type alias needs to be suffixed with 'ConfigEntry'
@@ -29,9 +35,15 @@ type CommonConfigEntry = ConfigEntry[CommonData]
 async def async_setup_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> bool:
     """Set up Remote activity monitor from a config entry."""
 
-    entry.runtime_data = CommonData(Shared())
+    entry.runtime_data = CommonData(
+        Shared(entry.options), IssueManager(hass, entry.entry_id)
+    )
+
+    async_delete_legacy_issues(hass)
 
     entry.async_on_unload(entry.add_update_listener(config_update_listener))
+    entry.async_on_unload(entry.runtime_data.issues.async_cancel_deferred)
+    entry.async_on_unload(entry.runtime_data.stop_event.set)
 
     match entry.options[CONF_COMPONENT_TYPE]:
         case ComponentType.MAIN:
@@ -61,6 +73,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> b
             )
 
 
+# ------------------------------------------------------------------
+async def async_remove_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> None:
+    """Remove repair issues and activity history when a config entry is removed."""
+
+    IssueManager(hass, entry.entry_id).async_delete_all_issues()
+
+    await hass.async_add_executor_job(
+        history_path(hass, entry.entry_id).unlink, True
+    )
+
+
 # ------------------------------------------------------------------
 async def async_reload_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> None:
     """Reload config entry."""
@@ -73,10 +96,33 @@ async def config_update_listener(
     hass: HomeAssistant,
     config_entry: CommonConfigEntry,
 ) -> None:
-    """Reload on config entry update."""
+    """Reload on config entry update.
+
+    Options that don't change the transport are applied to the running
+    entities in place, so the websocket stays connected.
+    """
+
+    shared: Shared = config_entry.runtime_data.shared
+
+    if shared.supress_update_listener:
+        shared.supress_update_listener = False
+        shared.options = dict(config_entry.options)
+        return
 
-    if config_entry.runtime_data.shared.supress_update_listener:
-        config_entry.runtime_data.shared.supress_update_listener = False
+    changed_options: set[str] = {
+        key
+        for key in shared.options.keys() | config_entry.options.keys()
+        if shared.options.get(key) != config_entry.options.get(key)
+    }
+    shared.options = dict(config_entry.options)
+
+    if (
+        len(changed_options) > 0
+        and changed_options <= HOT_RELOAD_OPTIONS
+        and len(shared.options_listeners) > 0
+    ):
+        for options_listener in shared.options_listeners:
+            await options_listener()
         return
 
     await hass.config_entries.async_reload(config_entry.entry_id)
@@ -0,0 +1,240 @@
+"""Activity analytics over the recorder history.
+
+External imports: numpy
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, tzinfo
+
+import numpy as np
+
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.const import (
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+    STATE_ON,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+HOUR_SECONDS = 3600
+
+
+# ------------------------------------------------------
+def load_transitions(
+    hass: HomeAssistant, entity_id: str, start: datetime, end: datetime
+) -> tuple[np.ndarray, np.ndarray]:
+    """Load state changes as timestamp and on arrays, runs in the recorder executor.
+
+    The compressed minimal response is used, so no State objects or
+    attributes are created for the rows.
+    """
+
+    rows: list = history.get_significant_states(
+        hass,
+        start,
+        end,
+        [entity_id],
+        significant_changes_only=False,
+        minimal_response=True,
+        no_attributes=True,
+        compressed_state_format=True,
+    ).get(entity_id, [])
+
+    timestamps: np.ndarray = np.fromiter(
+        (
+            row.get(COMPRESSED_STATE_LAST_CHANGED, row[COMPRESSED_STATE_LAST_UPDATED])
+            for row in rows
+        ),
+        dtype=np.float64,
+        count=len(rows),
+    )
+    is_on: np.ndarray = np.fromiter(
+        (row[COMPRESSED_STATE_STATE] == STATE_ON for row in rows),
+        dtype=np.bool_,
+        count=len(rows),
+    )
+
+    return timestamps, is_on
+
+
+# ------------------------------------------------------
+def on_intervals(
+    timestamps: np.ndarray, is_on: np.ndarray, start: float, end: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Sorted on intervals clipped to start and end."""
+
+    timestamps = np.clip(timestamps, start, end)
+    next_timestamps: np.ndarray = np.append(timestamps[1:], end)
+    keep: np.ndarray = is_on & (next_timestamps > timestamps)
+
+    return timestamps[keep], next_timestamps[keep]
+
+
+# ------------------------------------------------------
+def cumulative_on(
+    on_starts: np.ndarray, on_ends: np.ndarray, points: np.ndarray
+) -> np.ndarray:
+    """Seconds on before each point.
+
+    The intervals don't overlap, so all intervals before the last one
+    starting before a point are complete and only the last one is partial.
+    """
+
+    if len(on_starts) == 0:
+        return np.zeros(len(points))
+
+    durations: np.ndarray = on_ends - on_starts
+    completed: np.ndarray = np.concatenate(([0.0], np.cumsum(durations)))
+    index: np.ndarray = np.searchsorted(on_starts, points, side="right")
+    last: np.ndarray = np.maximum(index - 1, 0)
+    partial: np.ndarray = np.where(
+        index > 0, np.clip(points - on_starts[last], 0.0, durations[last]), 0.0
+    )
+
+    return completed[last] + partial
+
+
+# ------------------------------------------------------
+def duty_cycles(on_time: np.ndarray, total_time: np.ndarray) -> list[float | None]:
+    """Duty cycles, None where nothing has been observed."""
+
+    return [
+        round(float(on / total), 4) if total > 0 else None
+        for on, total in zip(on_time, total_time, strict=True)
+    ]
+
+
+# ------------------------------------------------------
+def suggested_waits(
+    durations: np.ndarray, percentile: float
+) -> dict[str, float | int | None]:
+    """Percentiles of durations, in seconds."""
+
+    if len(durations) == 0:
+        return {"count": 0, "suggested": None, "median": None}
+
+    return {
+        "count": len(durations),
+        "suggested": round(float(np.percentile(durations, percentile)), 1),
+        "median": round(float(np.median(durations)), 1),
+    }
+
+
+# ------------------------------------------------------
+def compute_analytics(
+    timestamps: np.ndarray,
+    is_on: np.ndarray,
+    start: float,
+    end: float,
+    time_zone: tzinfo,
+    max_gap: float,
+    percentile: float,
+) -> dict:
+    """Hourly and weekday duty cycles and suggested wait durations.
+
+    The range is split into local hours. On time per hour is the
+    difference of the cumulative on time at the hour edges, so the cost is
+    a few array operations independent of the number of transitions per
+    hour. Short off gaps between activity are the ones a wait duration
+    bridges, the suggested wait is the given percentile of the gaps up to
+    max_gap.
+    """
+
+    on_starts, on_ends = on_intervals(timestamps, is_on, start, end)
+
+    first_edge: float = (
+        dt_util.utc_from_timestamp(start)
+        .astimezone(time_zone)
+        .replace(minute=0, second=0, microsecond=0)
+        .timestamp()
+    )
+    edges: np.ndarray = np.clip(
+        first_edge
+        + HOUR_SECONDS * np.arange(int((end - first_edge) // HOUR_SECONDS) + 2),
+        start,
+        end,
+    )
+    on_time: np.ndarray = np.diff(cumulative_on(on_starts, on_ends, edges))
+    total_time: np.ndarray = np.diff(edges)
+
+    # Offsets change only with daylight saving time, one lookup per hour is cheap
+    local_hours: list[datetime] = [
+        dt_util.utc_from_timestamp(edge).astimezone(time_zone) for edge in edges[:-1]
+    ]
+    hours: np.ndarray = np.fromiter(
+        (local.hour for local in local_hours), dtype=np.int64, count=len(local_hours)
+    )
+    weekdays: np.ndarray = np.fromiter(
+        (local.weekday() for local in local_hours),
+        dtype=np.int64,
+        count=len(local_hours),
+    )
+
+    gaps: np.ndarray = on_starts[1:] - on_ends[:-1]
+    gap_hours: np.ndarray = hours[
+        np.clip(
+            np.searchsorted(edges, on_ends[:-1], side="right") - 1,
+            0,
+            max(len(hours) - 1, 0),
+        )
+    ]
+    short_gaps: np.ndarray = (gaps > 0) & (gaps <= max_gap)
+
+    return {
+        "duty_cycle": round(float(on_time.sum() / total_time.sum()), 4)
+        if total_time.sum() > 0
+        else None,
+        "on_duration": round(float(on_time.sum()), 1),
+        "state_changes": len(timestamps),
+        "hourly_duty_cycle": duty_cycles(
+            np.bincount(hours, weights=on_time, minlength=24),
+            np.bincount(hours, weights=total_time, minlength=24),
+        ),
+        "weekday_duty_cycle": duty_cycles(
+            np.bincount(weekdays, weights=on_time, minlength=7),
+            np.bincount(weekdays, weights=total_time, minlength=7),
+        ),
+        "duration_wait_update": suggested_waits(gaps[short_gaps], percentile),
+        "hourly_duration_wait_update": [
+            suggested_waits(gaps[short_gaps & (gap_hours == hour)], percentile)[
+                "suggested"
+            ]
+            for hour in range(24)
+        ],
+    }
+
+
+# ------------------------------------------------------
+async def async_get_activity_analytics(
+    hass: HomeAssistant,
+    entity_id: str,
+    duration: timedelta,
+    max_gap: timedelta,
+    percentile: float,
+) -> dict:
+    """Load the history of an entity in bulk and compute analytics in the executor."""
+
+    end: datetime = dt_util.utcnow()
+    start: datetime = end - duration
+
+    timestamps, is_on = await get_instance(hass).async_add_executor_job(
+        load_transitions, hass, entity_id, start, end
+    )
+
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        **await hass.async_add_executor_job(
+            compute_analytics,
+            timestamps,
+            is_on,
+            start.timestamp(),
+            end.timestamp(),
+            dt_util.get_default_time_zone(),
+            max_gap.total_seconds(),
+            percentile,
+        ),
+    }
@@ -0,0 +1,272 @@
+"""Persistent activity history of the remote monitor.
+
+Transitions are kept as fixed width records in a memory mapped ring file
+under .storage, so range and duty cycle queries are answered by binary
+search without the recorder.
+"""
+
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+import struct
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import DOMAIN
+
+# magic, version, record size, capacity, start, count
+HISTORY_HEADER = struct.Struct("<4sHHIII12x")
+# utc timestamp, state
+HISTORY_RECORD = struct.Struct("<dB7x")
+HISTORY_MAGIC = b"RAMH"
+HISTORY_VERSION = 1
+
+
+# ------------------------------------------------------
+def history_path(hass: HomeAssistant, entry_id: str) -> Path:
+    """History file of a config entry."""
+
+    return Path(hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry_id}.history"))
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class ActivityHistory:
+    """Ring of state transitions in a memory mapped file.
+
+    Only state changes are written and timestamps never decrease, so the
+    records are sorted. Open, flush and close do file I/O and are run in
+    the executor, appends and queries only touch the mapped memory.
+    """
+
+    # ------------------------------------------------------
+    def __init__(self, path: Path, capacity: int, retention: float) -> None:
+        """Init."""
+
+        self.path: Path = path
+        self.capacity: int = capacity
+        self.retention: float = retention
+        self.start: int = 0
+        self.count: int = 0
+        self.mm: mmap.mmap | None = None
+
+    # ------------------------------------------------------
+    @property
+    def size(self) -> int:
+        """File size."""
+
+        return HISTORY_HEADER.size + self.capacity * HISTORY_RECORD.size
+
+    # ------------------------------------------------------
+    def open(self) -> None:
+        """Open or create the file, runs in the executor."""
+
+        records: list[tuple[float, bool]] = self._read_file()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self.path.open("a+b") as file:
+            file.truncate(self.size)
+            self.mm = mmap.mmap(file.fileno(), self.size)
+
+        self.start = 0
+        self.count = 0
+
+        for timestamp, is_on in records[-self.capacity :]:
+            self._write_record(self.count, timestamp, is_on)
+            self.count += 1
+
+        self._write_header()
+
+    # ------------------------------------------------------
+    def _read_file(self) -> list[tuple[float, bool]]:
+        """Read records of an existing file, an invalid file is discarded."""
+
+        if not self.path.is_file():
+            return []
+
+        data: bytes = self.path.read_bytes()
+
+        if len(data) < HISTORY_HEADER.size:
+            return []
+
+        magic, version, record_size, capacity, start, count = (
+            HISTORY_HEADER.unpack_from(data)
+        )
+
+        if (
+            magic != HISTORY_MAGIC
+            or version != HISTORY_VERSION
+            or record_size != HISTORY_RECORD.size
+            or count > capacity
+            or len(data) < HISTORY_HEADER.size + capacity * record_size
+        ):
+            return []
+
+        records: list[tuple[float, bool]] = []
+
+        for index in range(count):
+            timestamp, state = HISTORY_RECORD.unpack_from(
+                data,
+                HISTORY_HEADER.size + ((start + index) % capacity) * record_size,
+            )
+            records.append((timestamp, state == 1))
+
+        return records
+
+    # ------------------------------------------------------
+    def flush(self) -> None:
+        """Flush to disk, runs in the executor."""
+
+        if self.mm is not None:
+            self.mm.flush()
+
+    # ------------------------------------------------------
+    def close(self) -> None:
+        """Flush and close, runs in the executor."""
+
+        if self.mm is not None:
+            self.mm.flush()
+            self.mm.close()
+            self.mm = None
+
+    # ------------------------------------------------------
+    def _write_header(self) -> None:
+        """Write header."""
+
+        HISTORY_HEADER.pack_into(
+            self.mm,
+            0,
+            HISTORY_MAGIC,
+            HISTORY_VERSION,
+            HISTORY_RECORD.size,
+            self.capacity,
+            self.start,
+            self.count,
+        )
+
+    # ------------------------------------------------------
+    def _offset(self, index: int) -> int:
+        """File offset of the record at a logical index."""
+
+        return (
+            HISTORY_HEADER.size
+            + ((self.start + index) % self.capacity) * HISTORY_RECORD.size
+        )
+
+    # ------------------------------------------------------
+    def _write_record(self, index: int, timestamp: float, is_on: bool) -> None:
+        """Write record at a logical index."""
+
+        HISTORY_RECORD.pack_into(self.mm, self._offset(index), timestamp, is_on)
+
+    # ------------------------------------------------------
+    def record(self, index: int) -> tuple[float, bool]:
+        """Record at a logical index, oldest first."""
+
+        timestamp, state = HISTORY_RECORD.unpack_from(self.mm, self._offset(index))
+        return timestamp, state == 1
+
+    # ------------------------------------------------------
+    def timestamp(self, index: int) -> float:
+        """Timestamp of the record at a logical index."""
+
+        return struct.unpack_from("<d", self.mm, self._offset(index))[0]
+
+    # ------------------------------------------------------
+    def append(self, timestamp: float, is_on: bool) -> bool:
+        """Append a transition, returns if it has been written."""
+
+        if self.mm is None:
+            return False
+
+        if self.count > 0:
+            last_timestamp, last_is_on = self.record(self.count - 1)
+
+            if last_is_on == is_on:
+                return False
+
+            timestamp = max(timestamp, last_timestamp)
+
+        if self.count == self.capacity:
+            self.start = (self.start + 1) % self.capacity
+            self.count -= 1
+
+        self._write_record(self.count, timestamp, is_on)
+        self.count += 1
+
+        # Keep the last record before the cutoff, it holds the state at the cutoff
+        cutoff: float = timestamp - self.retention
+
+        while self.count > 1 and self.timestamp(1) <= cutoff:
+            self.start = (self.start + 1) % self.capacity
+            self.count -= 1
+
+        self._write_header()
+        return True
+
+    # ------------------------------------------------------
+    def bisect(self, timestamp: float) -> int:
+        """Index of the first record after timestamp."""
+
+        low: int = 0
+        high: int = self.count if self.mm is not None else 0
+
+        while low < high:
+            middle: int = (low + high) // 2
+
+            if self.timestamp(middle) <= timestamp:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    # ------------------------------------------------------
+    def state_at(self, timestamp: float) -> bool | None:
+        """State at timestamp, None if before the first record."""
+
+        if (index := self.bisect(timestamp)) == 0:
+            return None
+
+        return self.record(index - 1)[1]
+
+    # ------------------------------------------------------
+    def transitions(self, start: float, end: float) -> list[tuple[float, bool]]:
+        """Transitions after start up to and including end."""
+
+        return [
+            self.record(index)
+            for index in range(self.bisect(start), self.bisect(end))
+        ]
+
+    # ------------------------------------------------------
+    def on_duration(self, start: float, end: float) -> float:
+        """Seconds on between start and end, unknown state counts as off."""
+
+        on_duration: float = 0.0
+        is_on: bool = self.state_at(start) or False
+        last_timestamp: float = start
+
+        for timestamp, state in self.transitions(start, end):
+            if is_on:
+                on_duration += timestamp - last_timestamp
+
+            is_on = state
+            last_timestamp = timestamp
+
+        if is_on:
+            on_duration += end - last_timestamp
+
+        return on_duration
+
+    # ------------------------------------------------------
+    def duty_cycle(self, start: float, end: float) -> float:
+        """Fraction of the time between start and end the state was on."""
+
+        if end <= start:
+            return 0.0
+
+        return self.on_duration(start, end) / (end - start)
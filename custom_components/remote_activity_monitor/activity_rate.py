@@ -0,0 +1,97 @@
+"""Sliding window activity rate and duty cycle for the remote monitor."""
+
+from __future__ import annotations
+
+from array import array
+from math import floor
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class ActivityRate:
+    """Activity events and on time in a sliding window.
+
+    The window is split into fixed buckets kept in a ring of arrays. All
+    points in time are local monotonic seconds.
+    """
+
+    # ------------------------------------------------------
+    def __init__(self, window: float, buckets: int, now: float) -> None:
+        """Init."""
+
+        self.window: float = window
+        self.buckets: int = buckets
+        self.bucket_width: float = window / buckets
+        self.events: array = array("I", bytes(4 * buckets))
+        self.on_time: array = array("d", bytes(8 * buckets))
+        self.bucket: int = self._bucket_number(now)
+        self.last_time: float = now
+        self.is_on: bool = False
+
+    # ------------------------------------------------------
+    def _bucket_number(self, now: float) -> int:
+        """Absolute bucket number for a point in time."""
+
+        return floor(now / self.bucket_width)
+
+    # ------------------------------------------------------
+    def _advance(self, now: float) -> None:
+        """Clear buckets left behind by the window and add on time up to now."""
+
+        if now <= self.last_time:
+            return
+
+        bucket: int = self._bucket_number(now)
+        start: float = max(
+            self.last_time, (bucket - self.buckets + 1) * self.bucket_width
+        )
+
+        if bucket - self.bucket >= self.buckets:
+            for index in range(self.buckets):
+                self.events[index] = 0
+                self.on_time[index] = 0.0
+        else:
+            for number in range(self.bucket + 1, bucket + 1):
+                self.events[number % self.buckets] = 0
+                self.on_time[number % self.buckets] = 0.0
+
+        self.bucket = bucket
+
+        if self.is_on:
+            for number in range(self._bucket_number(start), bucket + 1):
+                on_time: float = min(now, (number + 1) * self.bucket_width) - max(
+                    start, number * self.bucket_width
+                )
+
+                if on_time > 0:
+                    self.on_time[number % self.buckets] += on_time
+
+        self.last_time = now
+
+    # ------------------------------------------------------
+    def add_event(self, now: float) -> None:
+        """Add an activity event."""
+
+        self._advance(now)
+        self.events[self.bucket % self.buckets] += 1
+
+    # ------------------------------------------------------
+    def set_state(self, now: float, is_on: bool) -> None:
+        """Set the aggregated state."""
+
+        self._advance(now)
+        self.is_on = is_on
+
+    # ------------------------------------------------------
+    def event_count(self, now: float) -> int:
+        """Activity events within the window."""
+
+        self._advance(now)
+        return sum(self.events)
+
+    # ------------------------------------------------------
+    def duty_cycle(self, now: float) -> float:
+        """Fraction of the window the state has been on."""
+
+        self._advance(now)
+        return min(sum(self.on_time) / self.window, 1.0)
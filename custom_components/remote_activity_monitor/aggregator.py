@@ -0,0 +1,275 @@
+"""Incremental aggregation of the monitored entity states."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import timedelta
+from heapq import heappop, heappush
+from time import monotonic, time
+from typing import Any
+
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import State
+
+from .const import (
+    CONF_AGGREGATION_POLICY,
+    CONF_ALL_ENTITIES_ON,
+    CONF_DURATION_RECENT,
+    CONF_ENTITY_WEIGHTS,
+    CONF_MIN_ACTIVE,
+    CONF_WEIGHT_THRESHOLD,
+    POLICY_ALL,
+    POLICY_ANY,
+    POLICY_K_OF_N,
+    POLICY_RECENT,
+    POLICY_WEIGHTED,
+)
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class ActivityAggregator:
+    """Aggregated state and most recently updated entity of the monitored entities.
+
+    Policies:
+        any       at least one entity on
+        all       no entity off
+        k_of_n    at least min_active entities on
+        weighted  sum of the weights of the entities on reaches the threshold
+        recent    an entity is on or has been on within the recent window
+
+    Every state change updates counters, the weighted sum and the recent
+    expiry heap in O(1)/O(log n), only removing the most recently updated
+    entity rescans the members.
+    """
+
+    # ------------------------------------------------------
+    def __init__(
+        self,
+        policy: str = POLICY_ANY,
+        min_active: int = 1,
+        weights: Mapping[str, float] | None = None,
+        weight_threshold: float = 0.0,
+        recent_window: timedelta | None = None,
+    ) -> None:
+        """Init."""
+
+        self.policy: str = policy
+        self.min_active: int = min_active
+        self.weights: dict[str, float] = dict(weights) if weights is not None else {}
+        self.weight_threshold: float = weight_threshold
+        self.recent_window: float = (
+            recent_window.total_seconds() if recent_window is not None else 0.0
+        )
+
+        self.states: dict[str, State | None] = {}
+        self.on_count: int = 0
+        self.off_count: int = 0
+        self.weighted_on: float = 0.0
+        # entity id -> monotonic time its recent activity expires
+        self.recent_off: dict[str, float] = {}
+        self.recent_heap: list[tuple[float, str]] = []
+        self.last_updated: State | None = None
+
+    # ------------------------------------------------------
+    def configure(self, options: Mapping[str, Any]) -> None:
+        """Configure policy from entry options, call set_members afterwards."""
+
+        self.policy = options.get(CONF_AGGREGATION_POLICY, POLICY_ANY)
+
+        if self.policy == POLICY_ANY and options.get(CONF_ALL_ENTITIES_ON, False):
+            self.policy = POLICY_ALL
+
+        self.min_active = max(int(options.get(CONF_MIN_ACTIVE, 1)), 1)
+        self.weights = {
+            str(entity_id): float(weight)
+            for entity_id, weight in (options.get(CONF_ENTITY_WEIGHTS) or {}).items()
+        }
+        self.weight_threshold = float(options.get(CONF_WEIGHT_THRESHOLD, 0.0))
+        self.recent_window = (
+            timedelta(**options[CONF_DURATION_RECENT]).total_seconds()
+            if options.get(CONF_DURATION_RECENT) is not None
+            else 0.0
+        )
+
+    # ------------------------------------------------------
+    @property
+    def members(self) -> list[str]:
+        """Monitored entity ids."""
+
+        return list(self.states)
+
+    # ------------------------------------------------------
+    @property
+    def is_on(self) -> bool:
+        """Aggregated state, missing entities and other states are ignored."""
+
+        if self.policy == POLICY_ALL:
+            return self.off_count == 0
+
+        if self.policy == POLICY_K_OF_N:
+            return self.on_count >= self.min_active
+
+        if self.policy == POLICY_WEIGHTED:
+            return self.on_count > 0 and self.weighted_on >= self.weight_threshold
+
+        if self.policy == POLICY_RECENT:
+            self.expire_recent()
+            return self.on_count > 0 or len(self.recent_off) > 0
+
+        return self.on_count > 0
+
+    # ------------------------------------------------------
+    @property
+    def next_expiry(self) -> float | None:
+        """Seconds until the recent state may change, None if nothing expires."""
+
+        if self.policy != POLICY_RECENT:
+            return None
+
+        self.expire_recent()
+
+        if len(self.recent_heap) == 0:
+            return None
+
+        return max(self.recent_heap[0][0] - monotonic(), 0.0)
+
+    # ------------------------------------------------------
+    def expire_recent(self) -> None:
+        """Drop expired recent activity, stale heap entries are dropped lazily."""
+
+        now: float = monotonic()
+
+        while len(self.recent_heap) > 0 and (
+            self.recent_heap[0][0] <= now
+            or self.recent_off.get(self.recent_heap[0][1]) != self.recent_heap[0][0]
+        ):
+            expiry, entity_id = heappop(self.recent_heap)
+
+            if self.recent_off.get(entity_id) == expiry:
+                del self.recent_off[entity_id]
+
+    # ------------------------------------------------------
+    def _count(self, entity_id: str, state: State | None, delta: int) -> None:
+        """Add state to the counts."""
+
+        if state is None:
+            return
+
+        if state.state == STATE_ON:
+            self.on_count += delta
+            self.weighted_on += delta * self.weights.get(entity_id, 1.0)
+        elif state.state == STATE_OFF:
+            self.off_count += delta
+
+    # ------------------------------------------------------
+    def _track_recent(
+        self, entity_id: str, old_state: State | None, state: State | None
+    ) -> None:
+        """Keep entities that turned off within the recent window."""
+
+        if self.recent_window <= 0:
+            return
+
+        if state is None or state.state == STATE_ON:
+            self.recent_off.pop(entity_id, None)
+            return
+
+        if old_state is not None and old_state.state != STATE_ON:
+            return
+
+        expiry: float = (
+            monotonic() + self.recent_window - (time() - state.last_changed_timestamp)
+        )
+
+        if expiry > monotonic():
+            self.recent_off[entity_id] = expiry
+            heappush(self.recent_heap, (expiry, entity_id))
+
+    # ------------------------------------------------------
+    def _find_last_updated(self) -> None:
+        """Rescan for the most recently updated entity."""
+
+        self.last_updated = max(
+            (state for state in self.states.values() if state is not None),
+            key=lambda state: state.last_updated_timestamp,
+            default=None,
+        )
+
+    # ------------------------------------------------------
+    def set_members(self, states: dict[str, State | None]) -> None:
+        """Rebuild from states."""
+
+        self.states = {}
+        self.on_count = 0
+        self.off_count = 0
+        self.weighted_on = 0.0
+        self.recent_off = {}
+        self.recent_heap = []
+        self.last_updated = None
+
+        for entity_id, state in states.items():
+            self.add_member(entity_id, state)
+
+    # ------------------------------------------------------
+    def add_member(self, entity_id: str, state: State | None) -> None:
+        """Add entity."""
+
+        if entity_id in self.states:
+            self.update(entity_id, state)
+            return
+
+        self.states[entity_id] = None
+        self.update(entity_id, state)
+
+    # ------------------------------------------------------
+    def remove_member(self, entity_id: str) -> None:
+        """Remove entity."""
+
+        if entity_id not in self.states:
+            return
+
+        old_state: State | None = self.states.pop(entity_id)
+        self._count(entity_id, old_state, -1)
+        self.recent_off.pop(entity_id, None)
+
+        if old_state is not None and old_state is self.last_updated:
+            self._find_last_updated()
+
+    # ------------------------------------------------------
+    def rename_member(self, old_entity_id: str, entity_id: str) -> None:
+        """Entity id changed, the state follows with a state change."""
+
+        if old_entity_id not in self.states:
+            return
+
+        self.remove_member(old_entity_id)
+        self.add_member(entity_id, None)
+
+    # ------------------------------------------------------
+    def update(self, entity_id: str, state: State | None) -> bool:
+        """Update state of entity, returns if the entity has been added or removed."""
+
+        if entity_id not in self.states:
+            return False
+
+        old_state: State | None = self.states[entity_id]
+        self.states[entity_id] = state
+        self._count(entity_id, old_state, -1)
+        self._count(entity_id, state, 1)
+        self._track_recent(entity_id, old_state, state)
+
+        if state is None:
+            if old_state is not None and old_state is self.last_updated:
+                self._find_last_updated()
+
+        elif (
+            self.last_updated is None
+            or state.last_updated_timestamp >= self.last_updated.last_updated_timestamp
+        ):
+            self.last_updated = state
+
+        elif old_state is not None and old_state is self.last_updated:
+            self._find_last_updated()
+
+        return (old_state is None) != (state is None)
@@ -2,11 +2,30 @@
 
 from __future__ import annotations
 
-from homeassistant.core import HomeAssistant
+from datetime import timedelta
+from importlib import import_module
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, entity_platform
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import CommonConfigEntry
-from .const import CONF_COMPONENT_TYPE, ComponentType
+from .const import (
+    ATTR_DURATION,
+    ATTR_MAX_GAP,
+    ATTR_PERCENTILE,
+    CONF_COMPONENT_TYPE,
+    DEFAULT_ANALYTICS_DURATION,
+    DEFAULT_ANALYTICS_MAX_GAP,
+    DEFAULT_ANALYTICS_PERCENTILE,
+    RECORDER_DOMAIN,
+    SERVICE_GET_ACTIVITY_ANALYTICS,
+    ComponentType,
+)
 from .main_binary_sensor import MainAcitvityMonitorBinarySensor
 from .main_on_binary_sensor import RemoteAcitvityMonitorMainOnBinarySensor
 from .remote_binary_sensor import RemoteAcitvityMonitorBinarySensor
@@ -30,3 +49,48 @@ async def async_setup_entry(
                     RemoteAcitvityMonitorMainOnBinarySensor(hass, entry),
                 ]
             )
+
+    entity_platform.async_get_current_platform().async_register_entity_service(
+        SERVICE_GET_ACTIVITY_ANALYTICS,
+        {
+            vol.Optional(
+                ATTR_DURATION, default=timedelta(days=DEFAULT_ANALYTICS_DURATION)
+            ): cv.time_period,
+            vol.Optional(
+                ATTR_MAX_GAP, default=timedelta(minutes=DEFAULT_ANALYTICS_MAX_GAP)
+            ): cv.time_period,
+            vol.Optional(
+                ATTR_PERCENTILE, default=DEFAULT_ANALYTICS_PERCENTILE
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+        },
+        async_service_get_activity_analytics,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+# ------------------------------------------------------
+async def async_service_get_activity_analytics(
+    entity: Entity, service_data: ServiceCall
+) -> dict:
+    """Get duty cycle profiles and suggested wait durations from the recorder.
+
+    The analytics and numpy are imported in the import executor on first
+    use, keeping them off the platform import and the event loop.
+    """
+
+    if RECORDER_DOMAIN not in entity.hass.config.components:
+        raise ServiceValidationError(
+            f"The recorder is needed for {SERVICE_GET_ACTIVITY_ANALYTICS}"
+        )
+
+    activity_analytics = await entity.hass.async_add_import_executor_job(
+        import_module, ".activity_analytics", __package__
+    )
+
+    return await activity_analytics.async_get_activity_analytics(
+        entity.hass,
+        entity.entity_id,
+        service_data.data[ATTR_DURATION],
+        service_data.data[ATTR_MAX_GAP],
+        service_data.data[ATTR_PERCENTILE],
+    )
@@ -0,0 +1,39 @@
+"""Clock offset estimation for a remote Home Assistant instance."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class ClockOffset:
+    """Estimate the clock offset of a remote from round trip timed exchanges.
+
+    The offset is remote time minus local time in seconds. The sample with
+    the lowest round trip time is used, as it has the smallest error bound.
+    """
+
+    # ------------------------------------------------------
+    def __init__(self, max_samples: int = 8) -> None:
+        """Init."""
+        self.samples: deque[tuple[float, float]] = deque(maxlen=max_samples)
+        self.offset: float = 0.0
+        self.rtt: float | None = None
+
+    # ------------------------------------------------------
+    def add_sample(
+        self, rtt: float, local_received: datetime, remote_time: datetime
+    ) -> None:
+        """Add a sample from an exchange answered with the remote time."""
+
+        offset: float = (remote_time - local_received).total_seconds() + rtt / 2
+        self.samples.append((rtt, offset))
+        self.rtt, self.offset = min(self.samples)
+
+    # ------------------------------------------------------
+    def remote_age(self, remote_time: datetime, local_now: datetime) -> float:
+        """Return seconds since a remote point in time, measured in remote time."""
+
+        return (local_now - remote_time).total_seconds() + self.offset
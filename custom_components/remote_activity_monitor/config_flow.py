@@ -10,6 +10,7 @@ from urllib.parse import urlparse
 import voluptuous as vol
 
 from homeassistant.auth.providers.homeassistant import InvalidAuth
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.config_entries import SOURCE_IGNORE, ConfigFlow, ConfigFlowResult
 from homeassistant.const import (
     CONF_ACCESS_TOKEN,
@@ -31,11 +32,19 @@ from homeassistant.helpers.schema_config_entry_flow import (
     SchemaFlowMenuStep,
 )
 from homeassistant.helpers.selector import (
+    AreaSelector,
+    AreaSelectorConfig,
     BooleanSelector,
     DurationSelector,
     DurationSelectorConfig,
     EntitySelector,
     EntitySelectorConfig,
+    LabelSelector,
+    LabelSelectorConfig,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    ObjectSelector,
     SelectSelector,
     SelectSelectorConfig,
     SelectSelectorMode,
@@ -45,17 +54,36 @@ from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 from homeassistant.util.uuid import random_uuid_hex
 
 from .const import (
+    CONF_AGGREGATION_POLICY,
     CONF_ALL_ENTITIES_ON,
+    CONF_AREAS,
     CONF_COMPONENT_TYPE,
+    CONF_DEVICE_CLASSES,
+    CONF_DOMAINS,
+    CONF_DURATION_RATE_WINDOW,
+    CONF_DURATION_RECENT,
     CONF_DURATION_WAIT_UPDATE,
     CONF_ENTITY_IDS,
+    CONF_ENTITY_WEIGHTS,
+    CONF_LABELS,
+    CONF_MIN_ACTIVE,
     CONF_MONITOR_ENTITY,
     CONF_MONITOR_STATE_CHANGED_TYPE,
+    CONF_RATE_UPDATE_INTERVAL,
     CONF_SECURE,
+    CONF_WEIGHT_THRESHOLD,
+    DEFAULT_MONITOR_DOMAINS,
+    DEFAULT_RATE_UPDATE_INTERVAL,
     DOMAIN,
     LOGGER,
+    POLICY_ALL,
+    POLICY_ANY,
+    POLICY_K_OF_N,
+    POLICY_RECENT,
+    POLICY_WEIGHTED,
     SERVICE_GET_REMOTE_ENTITIES,
     STATE_BOTH,
+    TRANSLATION_KEY_AGGREGATION_POLICY,
     TRANSLATION_KEY_STATE_MONTOR_TYPE,
 )
 from .rest_api import CannotConnect, EndpointMissing, RestApi
@@ -152,6 +180,89 @@ async def _create_form(
                 multiple=True,
             ),
         ),
+        vol.Optional(
+            CONF_AREAS,
+            default=handler.options.get(CONF_AREAS, []),
+        ): AreaSelector(AreaSelectorConfig(multiple=True)),
+        vol.Optional(
+            CONF_LABELS,
+            default=handler.options.get(CONF_LABELS, []),
+        ): LabelSelector(LabelSelectorConfig(multiple=True)),
+        vol.Optional(
+            CONF_DOMAINS,
+            default=handler.options.get(CONF_DOMAINS, []),
+        ): SelectSelector(
+            SelectSelectorConfig(
+                options=sorted(DEFAULT_MONITOR_DOMAINS),
+                multiple=True,
+                custom_value=True,
+                mode=SelectSelectorMode.DROPDOWN,
+            )
+        ),
+        vol.Optional(
+            CONF_DEVICE_CLASSES,
+            default=handler.options.get(CONF_DEVICE_CLASSES, []),
+        ): SelectSelector(
+            SelectSelectorConfig(
+                options=list(BinarySensorDeviceClass),
+                multiple=True,
+                custom_value=True,
+                sort=True,
+                mode=SelectSelectorMode.DROPDOWN,
+            )
+        ),
+        vol.Optional(
+            CONF_AGGREGATION_POLICY,
+            default=handler.options.get(CONF_AGGREGATION_POLICY, POLICY_ANY),
+        ): SelectSelector(
+            SelectSelectorConfig(
+                options=[
+                    POLICY_ANY,
+                    POLICY_ALL,
+                    POLICY_K_OF_N,
+                    POLICY_WEIGHTED,
+                    POLICY_RECENT,
+                ],
+                mode=SelectSelectorMode.DROPDOWN,
+                translation_key=TRANSLATION_KEY_AGGREGATION_POLICY,
+            )
+        ),
+        vol.Optional(
+            CONF_MIN_ACTIVE,
+            default=handler.options.get(CONF_MIN_ACTIVE, 1),
+        ): NumberSelector(
+            NumberSelectorConfig(min=1, step=1, mode=NumberSelectorMode.BOX)
+        ),
+        vol.Optional(
+            CONF_ENTITY_WEIGHTS,
+            default=handler.options.get(CONF_ENTITY_WEIGHTS, {}),
+        ): ObjectSelector(),
+        vol.Optional(
+            CONF_WEIGHT_THRESHOLD,
+            default=handler.options.get(CONF_WEIGHT_THRESHOLD, 0),
+        ): NumberSelector(NumberSelectorConfig(mode=NumberSelectorMode.BOX)),
+        vol.Optional(
+            CONF_DURATION_RECENT,
+            description={"suggested_value": handler.options.get(CONF_DURATION_RECENT)},
+        ): DurationSelector(
+            DurationSelectorConfig(enable_day=True, allow_negative=False)
+        ),
+        vol.Optional(
+            CONF_DURATION_RATE_WINDOW,
+            description={
+                "suggested_value": handler.options.get(CONF_DURATION_RATE_WINDOW)
+            },
+        ): DurationSelector(
+            DurationSelectorConfig(enable_day=True, allow_negative=False)
+        ),
+        vol.Optional(
+            CONF_RATE_UPDATE_INTERVAL,
+            default=handler.options.get(
+                CONF_RATE_UPDATE_INTERVAL, DEFAULT_RATE_UPDATE_INTERVAL
+            ),
+        ): NumberSelector(
+            NumberSelectorConfig(min=1, step=1, mode=NumberSelectorMode.BOX)
+        ),
     }
 
     match step:
@@ -282,11 +393,26 @@ async def _validate_input_remote(
     handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
 ) -> dict[str, Any]:
     """Validate user input for remote integration."""
-    if CONF_ENTITY_IDS not in user_input:
+    if all(
+        len(user_input.get(key, [])) == 0
+        for key in (
+            CONF_ENTITY_IDS,
+            CONF_AREAS,
+            CONF_LABELS,
+            CONF_DOMAINS,
+            CONF_DEVICE_CLASSES,
+        )
+    ):
         raise SchemaFlowError("missing_selection")
 
-    if len(user_input[CONF_ENTITY_IDS]) == 0:
-        raise SchemaFlowError("missing_selection")
+    if not isinstance(user_input.get(CONF_ENTITY_WEIGHTS, {}), dict):
+        raise SchemaFlowError("invalid_weights")
+
+    try:
+        for weight in user_input.get(CONF_ENTITY_WEIGHTS, {}).values():
+            float(weight)
+    except (TypeError, ValueError):
+        raise SchemaFlowError("invalid_weights") from None
 
     return user_input
 
@@ -14,6 +14,7 @@ TRANSLATION_KEY_REMOTE_MISSING_ENTITY = "remote_missing_entity"
 TRANSLATION_KEY_MAIN_MISSING_ENTITY = "main_missing_entity"
 TRANSLATION_KEY_MAIN_CONNECTION_ERROR = "main_connection_error"
 TRANSLATION_KEY_STATE_MONTOR_TYPE = "state_changed_type"
+TRANSLATION_KEY_AGGREGATION_POLICY = "aggregation_policy"
 TRANSLATION_KEY_MAIN_DEVICE = "main_device"
 TRANSLATION_KEY_REMOTE_DEVICE = "remote_device"
 
@@ -25,26 +26,103 @@ CONF_MONITOR_STATE_CHANGED_TYPE = "monitor_state_changed_type"
 CONF_ENTITY_IDS = "entity_ids"
 CONF_ALL_ENTITIES_ON = "all_entities_on"
 CONF_SAVE_OPTIONS = "save_options"
+CONF_DURATION_ON_DELAY = "duration_on_delay"
+CONF_DURATION_OFF_DELAY = "duration_off_delay"
+CONF_DURATION_MIN_HOLD = "duration_min_hold"
+CONF_MAX_FLIPS_PER_HOUR = "max_flips_per_hour"
+CONF_AREAS = "areas"
+CONF_LABELS = "labels"
+CONF_DOMAINS = "domains"
+CONF_DEVICE_CLASSES = "device_classes"
+CONF_AGGREGATION_POLICY = "aggregation_policy"
+CONF_MIN_ACTIVE = "min_active"
+CONF_ENTITY_WEIGHTS = "entity_weights"
+CONF_WEIGHT_THRESHOLD = "weight_threshold"
+CONF_DURATION_RECENT = "duration_recent"
+CONF_DURATION_RATE_WINDOW = "duration_rate_window"
+CONF_RATE_UPDATE_INTERVAL = "rate_update_interval"
 
 STATE_BOTH = "both"
 
+POLICY_ANY = "any"
+POLICY_ALL = "all"
+POLICY_K_OF_N = "k_of_n"
+POLICY_WEIGHTED = "weighted"
+POLICY_RECENT = "recent"
+
+# Options that are applied to running entities without reloading the entry
+HOT_RELOAD_OPTIONS = frozenset(
+    {
+        CONF_DURATION_WAIT_UPDATE,
+        CONF_MONITOR_STATE_CHANGED_TYPE,
+        CONF_DURATION_ON_DELAY,
+        CONF_DURATION_OFF_DELAY,
+        CONF_DURATION_MIN_HOLD,
+        CONF_MAX_FLIPS_PER_HOUR,
+        CONF_ENTITY_IDS,
+        CONF_ALL_ENTITIES_ON,
+        CONF_AREAS,
+        CONF_LABELS,
+        CONF_DOMAINS,
+        CONF_DEVICE_CLASSES,
+        CONF_AGGREGATION_POLICY,
+        CONF_MIN_ACTIVE,
+        CONF_ENTITY_WEIGHTS,
+        CONF_WEIGHT_THRESHOLD,
+        CONF_DURATION_RECENT,
+        CONF_DURATION_RATE_WINDOW,
+        CONF_RATE_UPDATE_INTERVAL,
+    }
+)
+
+# Domains monitored by the selectors when no domain is selected
+DEFAULT_MONITOR_DOMAINS = frozenset({"binary_sensor", "switch", "input_boolean"})
+
 POSTFIX_PAUSE_SWITCH_ENTITY = " Pause"
 POSTFIX_MAIN_ON_ENTITY = " Main on"
 
 DEFAULT_MAX_MSG_SIZE = 16 * 1024 * 1024
 DEFAULT_UPDATE_INTERVAL = 60
+DEFAULT_RATE_WINDOW = 3600
+DEFAULT_RATE_UPDATE_INTERVAL = 60
+RATE_BUCKETS = 60
+HISTORY_CAPACITY = 65536
+HISTORY_RETENTION_DAYS = 90
+DEFAULT_HISTORY_DURATION = 24  # hours
+DEFAULT_ANALYTICS_DURATION = 30  # days
+DEFAULT_ANALYTICS_MAX_GAP = 60  # minutes
+DEFAULT_ANALYTICS_PERCENTILE = 90
+RECORDER_DOMAIN = "recorder"
 HEARTBEAT_INTERVAL = 20
 HEARTBEAT_TIMEOUT = 5
+WEBSOCKET_RECONNECT_DELAY = 10
+WEBSOCKET_MESSAGE_TIMINGS = 25
+CLOCK_SYNC_INTERVAL = 300
+WAIT_MARGIN = 0.1
+ISSUE_MIN_INTERVAL = 300
+ISSUE_REASON_REST_API = "rest_api"
+ISSUE_REASON_MISSING_ENTITY = "missing_entity"
+ISSUE_REASON_WEBSOCKET_RECONNECTING = "websocket_reconnecting"
 
 SW_VERSION = "1.0"
 
 SERVICE_GET_REMOTE_ENTITIES = "get_remote_entities"
 SERVICE_MAIN_ON_SWITCH = "main_on_switch"
 SERVICE_UPDATE_MAIN_OPTIONS = "update_main_options"
+SERVICE_GET_ACTIVITY_HISTORY = "get_activity_history"
+SERVICE_GET_ACTIVITY_ANALYTICS = "get_activity_analytics"
 
 ATTR_MONITOR_ACTIVITY_ENTITY_ID = "monitor_activity_entity_id"
 ATTR_MONITOR_ACTIVITY_FRIENDLY_NAME = "monitor_activity_friendly_name"
 ATTR_MONITOR_ACTIVITY_LAST_UPDATED = "monitor_activity_last_updated"
+ATTR_ACTIVITY_EVENTS = "activity_events"
+ATTR_ACTIVITY_DUTY_CYCLE = "activity_duty_cycle"
+ATTR_ACTIVITY_WINDOW = "activity_window"
+ATTR_START_TIME = "start_time"
+ATTR_END_TIME = "end_time"
+ATTR_DURATION = "duration"
+ATTR_MAX_GAP = "max_gap"
+ATTR_PERCENTILE = "percentile"
 ATTR_REMOTE_ACTIVITY_FRIENDLY_NAME = "remote_activity_friendly_name"
 ATTR_REMOTE_ACTIVITY_ENTITY_ID = "remote_activity_entity_id"
 ATTR_REMOTE_ACTIVITY_LAST_UPDATED = "remote_activity_last_updated"
@@ -53,6 +131,8 @@ ATTR_REMOTE_ACTIVITY_PAUSE = "remote_activity_pause"
 ATTR_MAIN_MONITOR_LAST_UPDATED = "main_monitor_last_updated"
 ATTR_MAIN_MONITOR_WAIT_DURATION_LEFT = "main_monitor_wait_duration_left"
 ATTR_MAIN_MONITOR_PAUSE = "main_monitor_pause"
+ATTR_MAIN_MONITOR_ON_CALLS = "main_monitor_on_calls"
+ATTR_MAIN_MONITOR_ON_SUPPRESSED = "main_monitor_on_suppressed"
 
 
 class ComponentType(StrEnum):
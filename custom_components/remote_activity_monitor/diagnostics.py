@@ -0,0 +1,32 @@
+"""Diagnostics support for Remote activity monitor."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_ACCESS_TOKEN, CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from . import CommonConfigEntry
+from .shared import Shared
+
+TO_REDACT = {CONF_ACCESS_TOKEN, CONF_HOST}
+
+
+# ------------------------------------------------------------------
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: CommonConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    shared: Shared = entry.runtime_data.shared
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "active_issues": list(entry.runtime_data.issues.active),
+        "entities": {
+            entity_id: get_diagnostics()
+            for entity_id, get_diagnostics in shared.diagnostics.items()
+        },
+    }
@@ -10,43 +10,109 @@ External imports:
     translate: aiofiles, orjson
 """
 
-from .config_update import (
-    check_supress_config_update_listener,
-    set_supress_config_update_listener,
-)
-from .enum_ext import EnumExt
-from .handle_retries import (
-    HandleRetries,
-    HandleRetriesException,
-    RetryStopException,
-    handle_retries,
-)
-from .hass_util import (
-    ArgumentException,
-    AsyncException,
-    async_get_user_language,
-    async_hass_add_executor_job,
-    object_to_state_attr_dict,
-)
-from .json_ext import DictToObject, JsonExt
-from .storage_json import StorageJson, StoreMigrate
-from .timer_trigger import TimerTrigger, TimerTriggerErrorEnum
-from .translate import NumberSelectorConfigTranslate, Translate
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config_update import (
+        check_supress_config_update_listener,
+        set_supress_config_update_listener,
+    )
+    from .enum_ext import EnumExt
+    from .handle_retries import (
+        HandleRetries,
+        HandleRetriesException,
+        RetryEngine,
+        RetryPolicy,
+        RetryStats,
+        RetryStopException,
+        handle_retries,
+    )
+    from .hass_util import (
+        ArgumentException,
+        AsyncException,
+        async_get_user_language,
+        async_hass_add_executor_job,
+        object_to_state_attr_dict,
+    )
+    from .json_ext import DictToObject, DictView, JsonExt, KeyMapper, ListView
+    from .storage_json import StorageJson, StoreMigrate
+    from .storage_serializer import (
+        JsonPickleSerializer,
+        SchemaSerializer,
+        StorageSerializer,
+    )
+    from .timer_trigger import (
+        PeriodicScheduler,
+        TimerFinishedDispatcher,
+        TimerTrigger,
+        TimerTriggerErrorEnum,
+        TimerTriggerMissedTickPolicy,
+    )
+    from .translate import NumberSelectorConfigTranslate, Translate
+
+# Exported name -> module, the module is imported on first use
+_LAZY_IMPORTS: dict[str, str] = {
+    "ArgumentException": "hass_util",
+    "AsyncException": "hass_util",
+    "DictToObject": "json_ext",
+    "DictView": "json_ext",
+    "EnumExt": "enum_ext",
+    "HandleRetries": "handle_retries",
+    "HandleRetriesException": "handle_retries",
+    "JsonExt": "json_ext",
+    "JsonPickleSerializer": "storage_serializer",
+    "KeyMapper": "json_ext",
+    "ListView": "json_ext",
+    "NumberSelectorConfigTranslate": "translate",
+    "PeriodicScheduler": "timer_trigger",
+    "RetryEngine": "handle_retries",
+    "RetryPolicy": "handle_retries",
+    "RetryStats": "handle_retries",
+    "RetryStopException": "handle_retries",
+    "SchemaSerializer": "storage_serializer",
+    "StorageJson": "storage_json",
+    "StorageSerializer": "storage_serializer",
+    "StoreMigrate": "storage_json",
+    "TimerFinishedDispatcher": "timer_trigger",
+    "TimerTrigger": "timer_trigger",
+    "TimerTriggerErrorEnum": "timer_trigger",
+    "TimerTriggerMissedTickPolicy": "timer_trigger",
+    "Translate": "translate",
+    "async_get_user_language": "hass_util",
+    "async_hass_add_executor_job": "hass_util",
+    "check_supress_config_update_listener": "config_update",
+    "handle_retries": "handle_retries",
+    "object_to_state_attr_dict": "hass_util",
+    "set_supress_config_update_listener": "config_update",
+}
 
 __all__ = [
     "ArgumentException",
     "AsyncException",
     "DictToObject",
+    "DictView",
     "EnumExt",
     "HandleRetries",
     "HandleRetriesException",
     "JsonExt",
+    "JsonPickleSerializer",
+    "KeyMapper",
+    "ListView",
     "NumberSelectorConfigTranslate",
+    "PeriodicScheduler",
+    "RetryEngine",
+    "RetryPolicy",
+    "RetryStats",
     "RetryStopException",
+    "SchemaSerializer",
     "StorageJson",
+    "StorageSerializer",
     "StoreMigrate",
+    "TimerFinishedDispatcher",
     "TimerTrigger",
     "TimerTriggerErrorEnum",
+    "TimerTriggerMissedTickPolicy",
     "Translate",
     "async_get_user_language",
     "async_hass_add_executor_job",
@@ -55,3 +121,28 @@ __all__ = [
     "object_to_state_attr_dict",
     "set_supress_config_update_listener",
 ]
+
+
+# ------------------------------------------------------------------
+def __getattr__(name: str) -> Any:
+    """Import exported names on first use."""
+
+    if (module_name := _LAZY_IMPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = import_module(f".{module_name}", __name__)
+
+    # Bind all names of the module, importing the module binds the submodule
+    # name on the package, e.g. handle_retries
+    for export_name, export_module_name in _LAZY_IMPORTS.items():
+        if export_module_name == module_name:
+            globals()[export_name] = getattr(module, export_name)
+
+    return globals()[name]
+
+
+# ------------------------------------------------------------------
+def __dir__() -> list[str]:
+    """Module attributes including not yet imported names."""
+
+    return sorted({*globals(), *__all__})
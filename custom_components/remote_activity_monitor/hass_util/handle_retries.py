@@ -3,18 +3,29 @@
 This decorator allows you to specify the number of retries and the delay between retries.
 It can be used with both synchronous and asynchronous functions.
 
+The retry engine is built once per decorated function and keeps all per call
+state local, so overlapping calls can share it safely.
+
 External imports: None
 """
 
-# ruff: noqa: C901
-
-from asyncio import sleep as asyncio_sleep
+from asyncio import (
+    CancelledError,
+    Event,
+    get_running_loop,
+    sleep as asyncio_sleep,
+    wait_for,
+)
 from collections.abc import Callable
+from dataclasses import dataclass, fields, replace
 from functools import partial, wraps
 from inspect import iscoroutinefunction
-from time import sleep
-from types import FunctionType
+import logging
+from random import uniform
+from time import monotonic, sleep
+from typing import Any
 
+_LOGGER = logging.getLogger(__name__)
 
 # ------------------------------------------------------
 # ------------------------------------------------------
@@ -38,6 +49,268 @@ class HandleRetriesException(Exception):
     """
 
 
+# ------------------------------------------------------
+# ------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Retry policy.
+
+    The delay before retry n (0 based) is retry_delay * backoff**n, capped at
+    max_delay and spread by +/- jitter (fraction of the delay). deadline is the
+    overall time limit in seconds for all attempts. When stop_event is set,
+    a pending retry is abandoned, e.g. when a config entry is unloaded.
+    """
+
+    retries: int = 1
+    retry_delay: float = 0.0
+    raise_last_exception: bool = True
+    raise_original_exception: bool = True
+    retry_on_exceptions: list | None = None
+    stop_on_exceptions: list | None = None
+    backoff: float = 1.0
+    max_delay: float | None = None
+    jitter: float = 0.0
+    deadline: float | None = None
+    stop_event: Event | None = None
+
+    # ------------------------------------------------------
+    def __post_init__(self) -> None:
+        """Normalize values."""
+        object.__setattr__(self, "retries", self.retries if self.retries > 0 else 1)
+        object.__setattr__(
+            self, "retry_delay", self.retry_delay if self.retry_delay > 0 else 0.0
+        )
+
+    # ------------------------------------------------------
+    def delay(self, attempt: int) -> float:
+        """Return delay before the next attempt."""
+
+        delay: float = self.retry_delay * self.backoff**attempt
+
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+
+        if self.jitter > 0:
+            delay += delay * uniform(-self.jitter, self.jitter)
+
+        return max(delay, 0.0)
+
+    # ------------------------------------------------------
+    def with_parms(self, parm_dict: dict | None) -> "RetryPolicy":
+        """Return policy with parameters replaced from parm_dict."""
+
+        if parm_dict is None or not isinstance(parm_dict, dict) or len(parm_dict) == 0:
+            return self
+
+        return replace(
+            self, **{key: parm_dict[key] for key in _POLICY_FIELDS if key in parm_dict}
+        )
+
+
+_POLICY_FIELDS: tuple[str, ...] = tuple(field.name for field in fields(RetryPolicy))
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class RetryStats:
+    """Per function success and failure counters."""
+
+    __slots__ = ("calls", "failures", "retries", "successes")
+
+    def __init__(self) -> None:
+        """Init."""
+        self.calls: int = 0
+        self.successes: int = 0
+        self.failures: int = 0
+        self.retries: int = 0
+
+    # ------------------------------------------------------
+    def as_dict(self) -> dict[str, int]:
+        """Return counters as dict."""
+        return {
+            "calls": self.calls,
+            "successes": self.successes,
+            "failures": self.failures,
+            "retries": self.retries,
+        }
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class RetryEngine:
+    """Reentrant retry engine for one function."""
+
+    __slots__ = ("func", "policy", "stats", "warned_event_loop")
+
+    def __init__(self, func: Callable, policy: RetryPolicy) -> None:
+        """Init."""
+        self.func: Callable = func
+        self.policy: RetryPolicy = policy
+        self.stats: RetryStats = RetryStats()
+        self.warned_event_loop: bool = False
+
+    # ------------------------------------------------------
+    def _should_retry(
+        self,
+        err: Exception,
+        attempt: int,
+        policy: RetryPolicy,
+        delay: float,
+        deadline_at: float,
+    ) -> bool:
+        """Check exception, raise or return False if it should not be retried."""
+
+        if err.__class__ == RetryStopException:
+            self.stats.failures += 1
+            raise err
+
+        if (
+            (
+                policy.retry_on_exceptions is None
+                or err.__class__ in policy.retry_on_exceptions
+            )
+            and (
+                policy.stop_on_exceptions is None
+                or err.__class__ not in policy.stop_on_exceptions
+            )
+            and attempt < policy.retries - 1
+            and monotonic() + delay < deadline_at
+            and (policy.stop_event is None or not policy.stop_event.is_set())
+        ):
+            self.stats.retries += 1
+            return True
+
+        self.stats.failures += 1
+
+        if policy.raise_last_exception:
+            if policy.raise_original_exception:
+                raise err
+            raise HandleRetriesException(
+                f"Retry {attempt} failed for {self.func.__name__}"
+            ) from err
+
+        return False
+
+    # ------------------------------------------------------
+    def _deadline_at(self, policy: RetryPolicy) -> float:
+        """Return the monotonic deadline for a call."""
+        if policy.deadline is None:
+            return float("inf")
+        return monotonic() + policy.deadline
+
+    # ------------------------------------------------------
+    def run(self, func_self, args: tuple, kwargs: dict) -> Any:
+        """Run function with retries.
+
+        When called from the event loop thread only a single attempt is made,
+        waiting with time.sleep would block the loop. Run the function in the
+        executor to get retries.
+        """
+
+        policy: RetryPolicy = self.policy
+
+        if func_self is not None and hasattr(func_self, "set_parms_dyn"):
+            policy = policy.with_parms(func_self.set_parms_dyn())
+
+        try:
+            get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            if policy.retries > 1:
+                if not self.warned_event_loop:
+                    self.warned_event_loop = True
+                    _LOGGER.warning(
+                        "%s is called from the event loop, retries are disabled."
+                        " Run it in the executor to retry",
+                        self.func.__qualname__,
+                    )
+
+                policy = replace(policy, retries=1)
+
+        deadline_at: float = self._deadline_at(policy)
+        self.stats.calls += 1
+
+        for attempt in range(policy.retries):
+            try:
+                if func_self is None:
+                    result = self.func(*args, **kwargs)
+                else:
+                    result = self.func(func_self, *args, **kwargs)
+            except Exception as err:  # noqa: BLE001
+                delay: float = policy.delay(attempt)
+
+                if not self._should_retry(err, attempt, policy, delay, deadline_at):
+                    return None
+            else:
+                self.stats.successes += 1
+                return result
+
+            sleep(delay)
+        return None
+
+    # ------------------------------------------------------
+    async def async_run(self, func_self, args: tuple, kwargs: dict) -> Any:
+        """Run async function with retries.
+
+        Cancellation is never retried, CancelledError propagates immediately.
+        """
+
+        policy: RetryPolicy = self.policy
+
+        if func_self is not None:
+            if hasattr(func_self, "async_set_parms_dyn") and iscoroutinefunction(
+                func_self.async_set_parms_dyn
+            ):
+                policy = policy.with_parms(await func_self.async_set_parms_dyn())
+            elif hasattr(func_self, "set_parms_dyn"):
+                policy = policy.with_parms(func_self.set_parms_dyn())
+
+        deadline_at: float = self._deadline_at(policy)
+        self.stats.calls += 1
+
+        for attempt in range(policy.retries):
+            try:
+                if func_self is None:
+                    result = await self.func(*args, **kwargs)
+                else:
+                    result = await self.func(func_self, *args, **kwargs)
+            except CancelledError:
+                self.stats.failures += 1
+                raise
+            except Exception as err:  # noqa: BLE001
+                delay: float = policy.delay(attempt)
+
+                if not self._should_retry(err, attempt, policy, delay, deadline_at):
+                    return None
+                last_err: Exception = err
+            else:
+                self.stats.successes += 1
+                return result
+
+            if await self._async_sleep(policy, delay):
+                self.stats.failures += 1
+
+                if policy.raise_last_exception:
+                    raise last_err
+                return None
+        return None
+
+    # ------------------------------------------------------
+    async def _async_sleep(self, policy: RetryPolicy, delay: float) -> bool:
+        """Sleep before next attempt, return True if stopped while sleeping."""
+
+        if policy.stop_event is None:
+            await asyncio_sleep(delay)
+            return False
+
+        try:
+            await wait_for(policy.stop_event.wait(), delay)
+        except TimeoutError:
+            return False
+        return True
+
+
 # ------------------------------------------------------
 # ------------------------------------------------------
 class HandleRetries:
@@ -56,6 +329,11 @@ class HandleRetries:
         raise_original_exception: bool = True,
         retry_on_exceptions: list | None = None,
         stop_on_exceptions: list | None = None,
+        backoff: float = 1.0,
+        max_delay: float | None = None,
+        jitter: float = 0.0,
+        deadline: float | None = None,
+        stop_event: Event | None = None,
     ):
         """Init.
 
@@ -66,16 +344,26 @@ class HandleRetries:
             raise_original_exception (bool, optional): _description_. Defaults to True.
             retry_on_exceptions (list | Exception | None, optional): _description_. Defaults to None.
             stop_on_exceptions (list | Exception | None, optional): _description_. Defaults to None.
+            backoff (float, optional): Delay multiplier per retry. Defaults to 1.0.
+            max_delay (float | None, optional): Max delay between retries. Defaults to None.
+            jitter (float, optional): Random spread of the delay, fraction. Defaults to 0.0.
+            deadline (float | None, optional): Overall time limit in seconds. Defaults to None.
+            stop_event (Event | None, optional): Stop retrying when set. Defaults to None.
 
         """
-        self.retries: int = retries if retries > 0 else 1
-        self.retry_delay: float = retry_delay if retry_delay > 0 else 0.0
-        self.raise_last_exception: bool = raise_last_exception
-        self.raise_original_exception: bool = raise_original_exception
-        self.retry_on_exceptions: list | None = retry_on_exceptions
-        self.stop_on_exceptions: list | None = stop_on_exceptions
-
-        self.func_self = None
+        self.policy: RetryPolicy = RetryPolicy(
+            retries=retries,
+            retry_delay=retry_delay,
+            raise_last_exception=raise_last_exception,
+            raise_original_exception=raise_original_exception,
+            retry_on_exceptions=retry_on_exceptions,
+            stop_on_exceptions=stop_on_exceptions,
+            backoff=backoff,
+            max_delay=max_delay,
+            jitter=jitter,
+            deadline=deadline,
+            stop_event=stop_event,
+        )
 
     # ------------------------------------------------------
     def __call__(self, func):
@@ -84,158 +372,11 @@ class HandleRetries:
         Args:
             func (_type_): _description_
 
-        Raises:
-            e: _description_
-            e: _description_
-
         Returns:
             _type_: _description_
 
         """
-
-        # -------------------------
-        def decorator_wrap(func):
-            # -------------------------
-            def check_retry_on_exceptions(exp: Exception) -> bool:
-                """Check if the exception is in the retry_on_exceptions list."""
-                if self.retry_on_exceptions is None:
-                    return True
-
-                if exp.__class__ in self.retry_on_exceptions:
-                    return True
-
-                return False
-
-            # -------------------------
-            def check_stop_on_exceptions(exp: Exception) -> bool:
-                """Check if the exception is in the stop_on_exceptions list."""
-                if self.stop_on_exceptions is None:
-                    return False
-
-                if exp.__class__ in self.stop_on_exceptions:
-                    return True
-
-                return False
-
-            # -------------------------
-            def check_exceptions(exp: Exception, attempt: int) -> None:
-                """Check exceptions."""
-
-                if exp.__class__ == RetryStopException:
-                    raise exp
-                if (
-                    not check_retry_on_exceptions(exp)
-                    or check_stop_on_exceptions(exp)
-                    or attempt == self.retries - 1
-                ):
-                    if self.raise_last_exception:
-                        if self.raise_original_exception:
-                            raise exp
-                        raise HandleRetriesException(
-                            f"Retry {attempt} failed for {func.__name__}"
-                        ) from exp
-
-            # -------------------------
-            def set_parms_dyn(parm_dict: dict) -> None:
-                """Set parameters dynamic."""
-
-                if "retries" in parm_dict:
-                    self.retries = parm_dict["retries"]
-                if "retry_delay" in parm_dict:
-                    self.retry_delay = parm_dict["retry_delay"]
-                if "raise_last_exception" in parm_dict:
-                    self.raise_last_exception = parm_dict["raise_last_exception"]
-                if "raise_original_exception" in parm_dict:
-                    self.raise_original_exception = parm_dict[
-                        "raise_original_exception"
-                    ]
-                if "retry_on_exceptions" in parm_dict:
-                    self.retry_on_exceptions = parm_dict["retry_on_exceptions"]
-                if "stop_on_exceptions" in parm_dict:
-                    self.stop_on_exceptions = parm_dict["stop_on_exceptions"]
-
-            # -------------------------
-            def check_for_dyn_parms(func) -> None:
-                """Check dynamic parameters."""
-
-                if func is None:
-                    return
-
-                if hasattr(func, "set_parms_dyn"):
-                    tmp_func = func.set_parms_dyn
-                    # tmp_func = getattr(func, "set_parms_dyn")
-                    tmp_return = tmp_func()
-
-                    if (
-                        tmp_return is not None
-                        and isinstance(tmp_return, dict)
-                        and len(tmp_return) > 0
-                    ):
-                        set_parms_dyn(tmp_return)
-
-            # -------------------------
-            async def async_check_for_dyn_parms(func) -> None:
-                """Check dynamic parameters."""
-
-                if func is None:
-                    return
-
-                if hasattr(func, "async_set_parms_dyn"):
-                    # tmp_func = getattr(func, "async_set_parms_dyn")
-                    tmp_func = func.async_set_parms_dyn
-
-                    if iscoroutinefunction(tmp_func):
-                        tmp_return = await tmp_func()
-
-                        if (
-                            tmp_return is not None
-                            and isinstance(tmp_return, dict)
-                            and len(tmp_return) > 0
-                        ):
-                            set_parms_dyn(tmp_return)
-                            return
-
-                check_for_dyn_parms(func)
-
-            # -------------------------
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                check_for_dyn_parms(self.func_self)
-
-                for attempt in range(self.retries):
-                    try:
-                        if self.func_self is None:
-                            return func(*args, **kwargs)
-                        return func(self.func_self, *args, **kwargs)
-                    except Exception as err:  # noqa: BLE001
-                        check_exceptions(err, attempt)
-
-                    sleep(self.retry_delay)
-                return None
-
-            # -------------------------
-            @wraps(func)
-            async def async_wrapper(*args, **kwargs):
-                await async_check_for_dyn_parms(self.func_self)
-
-                for attempt in range(self.retries):
-                    try:
-                        if self.func_self is None:
-                            return await func(*args, **kwargs)
-                        return await func(self.func_self, *args, **kwargs)
-
-                    except Exception as err:  # noqa: BLE001
-                        check_exceptions(err, attempt)
-                    await asyncio_sleep(self.retry_delay)
-                return None
-
-            # Check if the function is a coroutine function
-            if iscoroutinefunction(func):
-                return async_wrapper
-
-            return wrapper
-
-        return decorator_wrap(func)
+        return _wrap(RetryEngine(func, self.policy), func, method=False)
 
     # ------------------------------------------------------
     def execute(
@@ -249,8 +390,7 @@ class HandleRetries:
 
         How to call: HandleRetries(retries=3, retry_delay=1).execute(func_self ,(test_func),"Hello world")
         """
-        self.func_self = func_self
-        return self.__call__(func)(*args, **kwargs)
+        return RetryEngine(func, self.policy).run(func_self, args, kwargs)
 
     # ------------------------------------------------------
     async def async_execute(
@@ -264,8 +404,47 @@ class HandleRetries:
 
         How to call: await HandleRetries(retries=3, retry_delay=1).async_execute(func_self, (async_test_func),"Hello world")
         """
-        self.func_self = func_self
-        return await self.__call__(func)(*args, **kwargs)
+        return await RetryEngine(func, self.policy).async_run(func_self, args, kwargs)
+
+
+# ------------------------------------------------------
+def _wrap(engine: RetryEngine, func, method: bool):
+    """Wrap function with a retry engine, the engine is exposed as retry_engine."""
+
+    if method:
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper_method(func_self, *args, **kwargs):
+                return await engine.async_run(func_self, args, kwargs)
+
+            wrapper = async_wrapper_method
+        else:
+
+            @wraps(func)
+            def wrapper_method(func_self, *args, **kwargs):
+                return engine.run(func_self, args, kwargs)
+
+            wrapper = wrapper_method
+
+    elif iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper_function(*args, **kwargs):
+            return await engine.async_run(None, args, kwargs)
+
+        wrapper = async_wrapper_function
+    else:
+
+        @wraps(func)
+        def wrapper_function(*args, **kwargs):
+            return engine.run(None, args, kwargs)
+
+        wrapper = wrapper_function
+
+    wrapper.retry_engine = engine
+    wrapper.retry_stats = engine.stats
+    return wrapper
 
 
 # ------------------------------------------------------
@@ -278,12 +457,18 @@ def handle_retries(
     raise_original_exception: bool = True,
     retry_on_exceptions: list | None = None,
     stop_on_exceptions: list | None = None,
+    backoff: float = 1.0,
+    max_delay: float | None = None,
+    jitter: float = 0.0,
+    deadline: float | None = None,
+    stop_event: Event | None = None,
 ):
     """Decorator to handle retries.
 
     It will retry the method/function if it raises an exception up to a specified number of times, with a specified delay.
     It can be used with both synchronous and asynchronous method/functions.
     It will raise the last exception if the number of retries is reached and raise_last_exception is True.
+    The retry engine is built once, when the function is decorated.
     """  # noqa: D401
 
     if func is None:
@@ -295,65 +480,31 @@ def handle_retries(
             raise_original_exception=raise_original_exception,
             retry_on_exceptions=retry_on_exceptions,
             stop_on_exceptions=stop_on_exceptions,
+            backoff=backoff,
+            max_delay=max_delay,
+            jitter=jitter,
+            deadline=deadline,
+            stop_event=stop_event,
         )
 
-    # -------------------------
-    def decorator_wrap(func):
-        # -------------------------
-        @wraps(func)
-        def wrapper_method(func_self, *args, **kwargs):
-            return HandleRetries(
-                retries=retries,
-                retry_delay=retry_delay,
-                raise_last_exception=raise_last_exception,
-                raise_original_exception=raise_original_exception,
-                retry_on_exceptions=retry_on_exceptions,
-                stop_on_exceptions=stop_on_exceptions,
-            ).execute(func_self, func, *args, **kwargs)
-
-        # -------------------------
-        @wraps(func)
-        async def async_wrapper_method(func_self, *args, **kwargs):
-            return await HandleRetries(
-                retries=retries,
-                retry_delay=retry_delay,
-                raise_last_exception=raise_last_exception,
-                raise_original_exception=raise_original_exception,
-                retry_on_exceptions=retry_on_exceptions,
-                stop_on_exceptions=stop_on_exceptions,
-            ).async_execute(func_self, func, *args, **kwargs)
-
-        # -------------------------
-        @wraps(func)
-        def wrapper_funktion(*args, **kwargs):
-            return HandleRetries(
-                retries=retries,
-                retry_delay=retry_delay,
-                raise_last_exception=raise_last_exception,
-                raise_original_exception=raise_original_exception,
-                retry_on_exceptions=retry_on_exceptions,
-                stop_on_exceptions=stop_on_exceptions,
-            ).execute(None, func, *args, **kwargs)
-
-        # -------------------------
-        @wraps(func)
-        async def async_wrapper_function(*args, **kwargs):
-            return await HandleRetries(
-                retries=retries,
-                retry_delay=retry_delay,
-                raise_last_exception=raise_last_exception,
-                raise_original_exception=raise_original_exception,
-                retry_on_exceptions=retry_on_exceptions,
-                stop_on_exceptions=stop_on_exceptions,
-            ).async_execute(None, func, *args, **kwargs)
-
-        if "<locals>" in func.__qualname__ or isinstance(func, FunctionType):
-            if iscoroutinefunction(func):
-                return async_wrapper_function
-            return wrapper_funktion
-
-        if iscoroutinefunction(func):
-            return async_wrapper_method
-        return wrapper_method
-
-    return decorator_wrap(func)
+    engine = RetryEngine(
+        func,
+        RetryPolicy(
+            retries=retries,
+            retry_delay=retry_delay,
+            raise_last_exception=raise_last_exception,
+            raise_original_exception=raise_original_exception,
+            retry_on_exceptions=retry_on_exceptions,
+            stop_on_exceptions=stop_on_exceptions,
+            backoff=backoff,
+            max_delay=max_delay,
+            jitter=jitter,
+            deadline=deadline,
+            stop_event=stop_event,
+        ),
+    )
+
+    # Defined in a class body, so set_parms_dyn of the instance is used
+    return _wrap(
+        engine, func, method="." in func.__qualname__.rpartition("<locals>.")[2]
+    )
@@ -5,12 +5,28 @@ from inspect import iscoroutinefunction
 
 from packaging.version import Version
 
+from homeassistant.auth import EVENT_USER_ADDED, EVENT_USER_REMOVED, EVENT_USER_UPDATED
 from homeassistant.components.frontend import storage as frontend_store
 from homeassistant.const import (
+    EVENT_CORE_CONFIG_UPDATE,
+    EVENT_HOMEASSISTANT_STOP,
     MAJOR_VERSION as HASS_MAJOR_VERSION,
     MINOR_VERSION as HASS_MINOR_VERSION,
 )
-from homeassistant.core import HomeAssistant, async_get_hass
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    async_get_hass,
+    callback,
+)
+
+# Frontend user store returns a store object instead of a (store, data) tuple
+USER_STORE_OBJECT: bool = Version(
+    f"{HASS_MAJOR_VERSION}.{HASS_MINOR_VERSION}"
+) >= Version("2025.6")
+
+USER_LANGUAGE_CACHE = "hass_util_user_language_cache"
 
 
 # ------------------------------------------------------
@@ -58,28 +74,131 @@ def object_to_state_attr_dict(
 
 
 # ------------------------------------------------------
-async def async_get_user_language() -> str:
-    """Execute a method in async mode in hass."""
+# ------------------------------------------------------
+class UserLanguageCache:
+    """Owner language, cached until the owner, user store or core config changes."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.owner_resolved: bool = False
+        self.owner_id: str | None = None
+        # owner id -> user language, None when the user has no language set
+        self.languages: dict[str, str | None] = {}
+        self.unsub_user_store: dict[str, CALLBACK_TYPE] = {}
+        # owner id -> user data before 2025.6, dropped with the cached language
+        self.user_data: dict[str, dict] = {}
+
+        self.unsub_listeners: list[CALLBACK_TYPE] = [
+            hass.bus.async_listen(event_type, self._async_owner_changed)
+            for event_type in (EVENT_USER_ADDED, EVENT_USER_UPDATED, EVENT_USER_REMOVED)
+        ]
+        self.unsub_listeners.append(
+            hass.bus.async_listen(
+                EVENT_CORE_CONFIG_UPDATE, self._async_core_config_changed
+            )
+        )
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
 
-    hass: HomeAssistant = async_get_hass()
+    # ------------------------------------------------------
+    @callback
+    def _async_stop(self, _event: Event) -> None:
+        """Unsubscribe all listeners and drop the cache."""
+
+        for unsub in (*self.unsub_listeners, *self.unsub_user_store.values()):
+            unsub()
+
+        self.unsub_listeners.clear()
+        self.unsub_user_store.clear()
+
+        if self.hass.data.get(USER_LANGUAGE_CACHE) is self:
+            self.hass.data.pop(USER_LANGUAGE_CACHE)
+
+    # ------------------------------------------------------
+    @callback
+    def _async_owner_changed(self, _event: Event) -> None:
+        """Owner may have changed."""
+
+        self.owner_resolved = False
+        self.user_data.clear()
+
+    # ------------------------------------------------------
+    @callback
+    def _async_core_config_changed(self, _event: Event) -> None:
+        """Core language may have changed."""
+
+        self.languages.clear()
+        self.user_data.clear()
+
+    # ------------------------------------------------------
+    @callback
+    def _async_user_store_changed(self, owner_id: str) -> None:
+        """User store changed."""
+
+        self.languages.pop(owner_id, None)
+        self.user_data.pop(owner_id, None)
 
-    language: str = hass.config.language
+    # ------------------------------------------------------
+    @staticmethod
+    def _language(owner_data: dict) -> str | None:
+        """Get language from user data."""
 
-    owner = await hass.auth.async_get_owner()
+        if "language" in owner_data and "language" in owner_data["language"]:
+            return owner_data["language"]["language"]
 
-    if Version(f"{HASS_MAJOR_VERSION}.{HASS_MINOR_VERSION}") < Version("2025.6"):
-        if owner is not None:
-            _, owner_data = await frontend_store.async_user_store(hass, owner.id)
+        return None
+
+    # ------------------------------------------------------
+    async def async_get_language(self) -> str:
+        """Get owner language, else the core language."""
+
+        if not self.owner_resolved:
+            owner = await self.hass.auth.async_get_owner()
+            self.owner_id = owner.id if owner is not None else None
+            self.owner_resolved = True
+
+        if self.owner_id is None:
+            return self.hass.config.language
+
+        if self.owner_id in self.languages:
+            language = self.languages[self.owner_id]
+            return language if language is not None else self.hass.config.language
+
+        if USER_STORE_OBJECT:
+            user_store = await frontend_store.async_user_store(self.hass, self.owner_id)
+            language = self._language(user_store.data)
+
+            if self.owner_id not in self.unsub_user_store:
+                owner_id: str = self.owner_id
+                self.unsub_user_store[owner_id] = user_store.async_subscribe(
+                    "language",
+                    lambda *_: self._async_user_store_changed(owner_id),
+                )
+
+            self.languages[self.owner_id] = language
+        else:
+            if (owner_data := self.user_data.get(self.owner_id)) is None:
+                _, owner_data = await frontend_store.async_user_store(
+                    self.hass, self.owner_id
+                )
+                self.user_data[self.owner_id] = owner_data
+
+            language = self._language(owner_data)
+
+        return language if language is not None else self.hass.config.language
+
+
+# ------------------------------------------------------
+async def async_get_user_language() -> str:
+    """Get the language of the owner, else the core language."""
+
+    hass: HomeAssistant = async_get_hass()
 
-            if "language" in owner_data and "language" in owner_data["language"]:
-                language = owner_data["language"]["language"]
-    elif owner is not None:
-        owner_data = await frontend_store.async_user_store(hass, owner.id)
+    if (cache := hass.data.get(USER_LANGUAGE_CACHE)) is None:
+        cache = hass.data[USER_LANGUAGE_CACHE] = UserLanguageCache(hass)
 
-        owner_data = await frontend_store.async_user_store(hass, owner.id)
-        if "language" in owner_data.data and "language" in owner_data.data["language"]:
-            language = owner_data.data["language"]["language"]
-    return language
+    return await cache.async_get_language()
 
 
 # ------------------------------------------------------
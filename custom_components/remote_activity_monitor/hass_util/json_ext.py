@@ -1,9 +1,197 @@
-"""Json extended."""
+"""Json extended.
 
+External imports: orjson
+"""
+
+from collections.abc import Iterable
 from contextlib import suppress
 from datetime import datetime
-from json import loads
 from re import compile
+from typing import Any
+
+from orjson import loads
+
+KEY_MAPPER_CACHE_SIZE = 32
+
+# Shortest is YYYY-MM-DDTHH:MM:SS
+ISO8601_MIN_LENGTH = 19
+ISO8601_MAX_LENGTH = 64
+ISO8601_FIRST_CHARS = frozenset("-0123456789")
+ISO8601_LAST_CHARS = frozenset("0123456789Z")
+KEY_MAPPER_MEMO_SIZE = 4096
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class KeyMapper:
+    """Compiled key mapping table.
+
+    Keys in the mapping table are matched like this, first match in
+    insertion order wins after an exact match:
+        "*x*"  key contains x
+        "*x"   key starts with x
+        "x*"   key ends with x
+    The first occurrence of x is replaced with the mapped value.
+    """
+
+    _END = ""
+
+    def __init__(self, map_keys: dict) -> None:
+        """Init."""
+
+        self.map_keys: dict = map_keys
+        self._prefix_trie: dict = {}
+        self._suffix_trie: dict = {}
+        self._contains: list[tuple[int, str, Any]] = []
+        self._memo: dict[str, str] = {}
+
+        for index, (key, value) in enumerate(map_keys.items()):
+            if not isinstance(key, str):
+                continue
+
+            if key.startswith("*") and key.endswith("*") and len(key) >= 2:
+                self._contains.append((index, key[1:-1], value))
+            elif key.startswith("*"):
+                self._add_trie(self._prefix_trie, key[1:], index, value)
+            elif key.endswith("*"):
+                self._add_trie(self._suffix_trie, key[-2::-1], index, value)
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def _add_trie(cls, trie: dict, chars: str, index: int, value: Any) -> None:
+        """Add pattern to trie, keeping the first pattern for duplicates."""
+
+        node: dict = trie
+
+        for char in chars:
+            node = node.setdefault(char, {})
+
+        node.setdefault(cls._END, (index, value))
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def _search_trie(
+        cls, trie: dict, chars: str, best: tuple[int, int, Any] | None, length: int
+    ) -> tuple[int, int, Any] | None:
+        """Find the pattern with the lowest index matching the start of chars.
+
+        Returns index, match length and value.
+        """
+
+        node: dict = trie
+        depth: int = 0
+
+        while True:
+            if (match := node.get(cls._END)) is not None and (
+                best is None or match[0] < best[0]
+            ):
+                best = (match[0], depth, match[1])
+
+            if depth == length or (node := node.get(chars[depth])) is None:
+                return best
+
+            depth += 1
+
+    # ------------------------------------------------------------------
+    def _lookup(self, check_key: str) -> str:
+        """Map key without memo."""
+
+        if check_key in self.map_keys:
+            return self.map_keys[check_key]
+
+        length: int = len(check_key)
+        best: tuple[int, str, Any] | None = None
+
+        if (
+            prefix := self._search_trie(self._prefix_trie, check_key, None, length)
+        ) is not None:
+            best = (prefix[0], check_key[: prefix[1]], prefix[2])
+
+        if (
+            suffix := self._search_trie(
+                self._suffix_trie, check_key[::-1], None, length
+            )
+        ) is not None and (best is None or suffix[0] < best[0]):
+            best = (suffix[0], check_key[length - suffix[1] :], suffix[2])
+
+        for index, part, value in self._contains:
+            if best is not None and index > best[0]:
+                break
+
+            if part in check_key:
+                best = (index, part, value)
+                break
+
+        if best is None:
+            return check_key
+
+        return check_key.replace(best[1], best[2], 1)
+
+    # ------------------------------------------------------------------
+    def map_key(self, check_key):
+        """Map key."""
+
+        if (mapped := self._memo.get(check_key)) is not None:
+            return mapped
+
+        if not isinstance(check_key, str):
+            return self.map_keys.get(check_key, check_key)
+
+        mapped = self._lookup(check_key)
+
+        if len(self._memo) >= KEY_MAPPER_MEMO_SIZE:
+            self._memo.clear()
+
+        self._memo[check_key] = mapped
+        return mapped
+
+    # ------------------------------------------------------------------
+    def change_nested_keys(self, data, in_place: bool = False):
+        """Change nested keys, optional in place without copying.
+
+        Without in_place dicts and lists are always copied, also when there
+        is nothing to map.
+        """
+
+        if in_place and len(self.map_keys) == 0:
+            return data
+
+        if isinstance(data, dict):
+            if not in_place:
+                return {
+                    self.map_key(key): self.change_nested_keys(value)
+                    for key, value in data.items()
+                }
+
+            changed: bool = False
+
+            for key, value in data.items():
+                if isinstance(value, dict | list):
+                    self.change_nested_keys(value, True)
+
+                if not changed and self.map_key(key) != key:
+                    changed = True
+
+            if changed:
+                items: list = list(data.items())
+                data.clear()
+
+                for key, value in items:
+                    data[self.map_key(key)] = value
+
+            return data
+
+        if isinstance(data, list):
+            if not in_place:
+                return [self.change_nested_keys(item) for item in data]
+
+            for item in data:
+                if isinstance(item, dict | list):
+                    self.change_nested_keys(item, True)
+
+            return data
+
+        return data
 
 
 # ------------------------------------------------------------------
@@ -15,26 +203,61 @@ class JsonExt:
         r"^(-?(?:[1-9][0-9]*)?[0-9]{4})-(1[0-2]|0[1-9])-(3[01]|0[1-9]|[12][0-9])T(2[0-3]|[01][0-9]):([0-5][0-9]):([0-5][0-9])(\.[0-9]+)?(Z|[+-](?:2[0-3]|[01][0-9]):[0-5][0-9])?$"
     ).match
 
-    def __init__(self) -> None:
-        """Init."""
+    def __init__(self, timestamp_keys: Iterable[str] | None = None) -> None:
+        """Init.
+
+        timestamp_keys limits datetime decoding to values of these keys,
+        None decodes every string that looks like a ISO8601 value.
+        """
+        self._timestamp_keys: frozenset[str] | None = (
+            frozenset(timestamp_keys) if timestamp_keys is not None else None
+        )
         self._global_map_keys: dict = {}
+        self._global_key_mapper: KeyMapper = KeyMapper({})
+        self._key_mappers: dict[tuple, KeyMapper] = {}
 
     # ------------------------------------------------------------------
     def validate_iso8601(self, str_val):
         """Validate if a String is a ISO8601 value or not."""
         try:
-            if self._match_iso8601(str_val) is not None:
+            if (
+                ISO8601_MIN_LENGTH <= len(str_val) <= ISO8601_MAX_LENGTH
+                and str_val[0] in ISO8601_FIRST_CHARS
+                and str_val[-1] in ISO8601_LAST_CHARS
+                and self._match_iso8601(str_val) is not None
+            ):
                 return True
         except:  # noqa: E722
             pass
         return False
 
+    # ------------------------------------------------------------------
+    def _to_datetime(self, value: Any) -> Any:
+        """Return value as datetime if it is a ISO8601 string."""
+
+        if isinstance(value, str) and self.validate_iso8601(value):
+            with suppress(ValueError, AttributeError, TypeError):
+                return datetime.fromisoformat(value)
+
+        return value
+
     # ------------------------------------------------------------------
     def _decoder(self, obj):
-        for key, value in obj.items():
-            if isinstance(value, str) and self.validate_iso8601(value):
-                with suppress(ValueError, AttributeError, TypeError):
-                    obj[key] = datetime.fromisoformat(value)
+        """Decode datetime values in place."""
+
+        if isinstance(obj, dict):
+            timestamp_keys: frozenset[str] | None = self._timestamp_keys
+
+            for key, value in obj.items():
+                if isinstance(value, dict | list):
+                    self._decoder(value)
+                elif timestamp_keys is None or key in timestamp_keys:
+                    obj[key] = self._to_datetime(value)
+
+        elif isinstance(obj, list):
+            for value in obj:
+                if isinstance(value, dict | list):
+                    self._decoder(value)
 
         return obj
 
@@ -42,53 +265,46 @@ class JsonExt:
     def set_global_map_keys(self, global_map_keys: dict = {}):
         """Set global map keys."""
         self._global_map_keys = global_map_keys
+        self._global_key_mapper = KeyMapper(dict(global_map_keys))
+        self._key_mappers.clear()
 
     # ------------------------------------------------------------------
-    def change_nested_keys(self, data, map_keys: dict = {}):
-        """Change nested keys."""
+    def _get_key_mapper(self, map_keys: dict, use_global: bool = False) -> KeyMapper:
+        """Get compiled key mapper, cached per mapping table."""
 
-        # ----------------------------------------
-        def map_key(check_key: str):
-            if len(map_keys) == 0:
-                return check_key
-
-            if check_key in map_keys:
-                return map_keys[check_key]
-
-            for key, value in map_keys.items():
-                if (
-                    key.startswith("*")
-                    and key.endswith("*")
-                    and check_key.find(key[1:-1]) >= 0
-                ):
-                    return check_key.replace(key[1:-1], value, 1)
-                if key.startswith("*") and check_key.startswith(key[1:]):
-                    return check_key.replace(key[1:], value, 1)
-                if key.endswith("*") and check_key.endswith(key[:-1]):
-                    return check_key.replace(key[:-1], value, 1)
-            return check_key
+        if len(map_keys) == 0:
+            return self._global_key_mapper if use_global else KeyMapper({})
 
-        # ----------------------------------------
+        try:
+            cache_key: tuple = (use_global, *map_keys.items())
+            hash(cache_key)
+        except TypeError:
+            return KeyMapper(
+                {**self._global_map_keys, **map_keys} if use_global else map_keys
+            )
 
-        if isinstance(data, dict):
-            new_dict = {}
+        if (key_mapper := self._key_mappers.get(cache_key)) is None:
+            if len(self._key_mappers) >= KEY_MAPPER_CACHE_SIZE:
+                self._key_mappers.pop(next(iter(self._key_mappers)))
 
-            for key, value in data.items():
-                new_value = self.change_nested_keys(value, map_keys)
+            key_mapper = self._key_mappers[cache_key] = KeyMapper(
+                {**self._global_map_keys, **map_keys} if use_global else dict(map_keys)
+            )
 
-                new_dict[map_key(key)] = new_value
-            return new_dict
+        return key_mapper
 
-        if isinstance(data, list):
-            return [self.change_nested_keys(item, map_keys) for item in data]
-        return data
+    # ------------------------------------------------------------------
+    def change_nested_keys(self, data, map_keys: dict = {}, in_place: bool = False):
+        """Change nested keys."""
+
+        return self._get_key_mapper(map_keys).change_nested_keys(data, in_place)
 
     # ------------------------------------------------------------------
-    def json_str_to_dict(self, json_str: str, map_keys: dict = {}) -> dict:
+    def json_str_to_dict(self, json_str: str | bytes, map_keys: dict = {}) -> dict:
         """Json str to dict."""
-        tmp_dict = loads(json_str, object_hook=self._decoder)
+        tmp_dict = self._decoder(loads(json_str))
 
-        return self.change_nested_keys(tmp_dict, {**self._global_map_keys, **map_keys})
+        return self._get_key_mapper(map_keys, True).change_nested_keys(tmp_dict, True)
 
 
 # ------------------------------------------------------------------
@@ -119,3 +335,192 @@ class DictToObject:
                 )
             else:
                 setattr(self, key, value)
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+def _view(value: Any) -> Any:
+    """Wrap dict and list values in a read-only view."""
+
+    if isinstance(value, dict):
+        return DictView(value)
+
+    if isinstance(value, list):
+        return ListView(value)
+
+    return value
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class DictView:
+    """Read-only attribute view of a dict.
+
+    Nested dicts and lists are wrapped when accessed and the wrappers are
+    cached, the dict itself is not copied.
+    """
+
+    __slots__ = ("_children", "_data")
+
+    def __init__(self, dictionary: dict) -> None:
+        """Init."""
+
+        object.__setattr__(self, "_data", dictionary)
+        object.__setattr__(self, "_children", None)
+
+    # ------------------------------------------------------------------
+    def _child(self, key: Any) -> Any:
+        """Get value for key, wrapping and caching dicts and lists."""
+
+        value = self._data[key]
+
+        if not isinstance(value, dict | list):
+            return value
+
+        if self._children is None:
+            object.__setattr__(self, "_children", {})
+
+        if (child := self._children.get(key)) is None or child._data is not value:
+            child = self._children[key] = _view(value)
+
+        return child
+
+    # ------------------------------------------------------------------
+    def __getattr__(self, name: str) -> Any:
+        """Get attribute."""
+
+        try:
+            return self._child(name)
+        except KeyError:
+            raise AttributeError(name) from None
+
+    # ------------------------------------------------------------------
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Read only."""
+
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    # ------------------------------------------------------------------
+    def __delattr__(self, name: str) -> None:
+        """Read only."""
+
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    # ------------------------------------------------------------------
+    def __getitem__(self, key: Any) -> Any:
+        """Get item."""
+
+        return self._child(key)
+
+    # ------------------------------------------------------------------
+    def __contains__(self, key: Any) -> bool:
+        """Contains."""
+
+        return key in self._data
+
+    # ------------------------------------------------------------------
+    def __iter__(self):
+        """Iterate keys."""
+
+        return iter(self._data)
+
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        """Len."""
+
+        return len(self._data)
+
+    # ------------------------------------------------------------------
+    def __dir__(self) -> list[str]:
+        """Dir."""
+
+        return [key for key in self._data if isinstance(key, str)]
+
+    # ------------------------------------------------------------------
+    def __repr__(self) -> str:
+        """Repr."""
+
+        return f"{type(self).__name__}({self._data!r})"
+
+    # ------------------------------------------------------------------
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get value for key or default."""
+
+        return self._child(key) if key in self._data else default
+
+    # ------------------------------------------------------------------
+    def to_dict(self) -> dict:
+        """Return the wrapped dict."""
+
+        return self._data
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class ListView:
+    """Read-only view of a list, wrapping dict and list items when accessed."""
+
+    __slots__ = ("_children", "_data")
+
+    def __init__(self, items: list) -> None:
+        """Init."""
+
+        object.__setattr__(self, "_data", items)
+        object.__setattr__(self, "_children", None)
+
+    # ------------------------------------------------------------------
+    def _child(self, index: int) -> Any:
+        """Get item for index, wrapping and caching dicts and lists."""
+
+        value = self._data[index]
+
+        if not isinstance(value, dict | list):
+            return value
+
+        if self._children is None:
+            object.__setattr__(self, "_children", {})
+
+        if (child := self._children.get(index)) is None or child._data is not value:
+            child = self._children[index] = _view(value)
+
+        return child
+
+    # ------------------------------------------------------------------
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Read only."""
+
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    # ------------------------------------------------------------------
+    def __getitem__(self, index: int | slice) -> Any:
+        """Get item."""
+
+        if isinstance(index, slice):
+            return [self._child(i) for i in range(*index.indices(len(self._data)))]
+
+        return self._child(index)
+
+    # ------------------------------------------------------------------
+    def __iter__(self):
+        """Iterate items."""
+
+        for index in range(len(self._data)):
+            yield self._child(index)
+
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        """Len."""
+
+        return len(self._data)
+
+    # ------------------------------------------------------------------
+    def __repr__(self) -> str:
+        """Repr."""
+
+        return f"{type(self).__name__}({self._data!r})"
+
+    # ------------------------------------------------------------------
+    def to_list(self) -> list:
+        """Return the wrapped list."""
+
+        return self._data
@@ -3,14 +3,49 @@
 External imports: jsonpickle
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from copy import deepcopy
+from datetime import datetime
 import inspect
+from time import perf_counter
 from typing import Any
 
-import jsonpickle
-
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .storage_serializer import (
+    JsonPickleSerializer,
+    SchemaSerializer,
+    StorageSerializer,
+)
+
+# Serializers tried when reading data written by another serializer
+STORAGE_SERIALIZERS: tuple[type[StorageSerializer], ...] = (
+    JsonPickleSerializer,
+    SchemaSerializer,
+)
+
+# Attributes used by StorageJson itself, never written
+STORAGE_INTERNAL_ATTRIBUTES = (
+    "write_hidden_attributes___",
+    "hass___",
+    "store___",
+    "DICT_KEY___",
+    "base_class___",
+    "serializer___",
+    "write_delay___",
+    "write_dirty___",
+    "write_extra_data___",
+    "write_unsub___",
+    "write_unsub_final___",
+    "write_stats___",
+    "lazy_attributes___",
+    "lazy_data___",
+    "read_stats___",
+)
 
 
 # ------------------------------------------------------------------
@@ -58,10 +93,35 @@ class StorageJson:
         version: int = 1,
         minor_version: int = 1,
         async_migrate_func: Callable[[int, int, Any], Any] | None = None,
+        write_delay: float = 0,
+        serializer: StorageSerializer | None = None,
+        lazy_attributes: Iterable[str] = (),
     ) -> None:
-        """Init."""
+        """Init.
+
+        write_delay > 0 coalesces writes within the delay into one write,
+        pending writes are flushed when Home Assistant stops.
+
+        serializer defaults to jsonpickle. Data written by another
+        serializer is read transparently and converted on the next write.
+
+        lazy_attributes are decoded on first access instead of when read,
+        only used with the schema serializer. A lazy attribute can't have a
+        class level default, it would hide the stored value.
+        """
+
+        lazy_attributes = frozenset(lazy_attributes)
 
-        self.DICT_KEY___ = "jsonpickle"
+        for name in lazy_attributes:
+            if hasattr(type(self), name):
+                raise ValueError(
+                    f"Lazy attribute '{name}' can't have a class level default"
+                )
+
+        self.serializer___: StorageSerializer = (
+            serializer if serializer is not None else JsonPickleSerializer()
+        )
+        self.DICT_KEY___ = self.serializer___.dict_key
         self.write_hidden_attributes___: bool = False
         self.hass___ = hass
         self.store___ = StoreMigrate(
@@ -72,74 +132,294 @@ class StorageJson:
         )
         self.store___.custom_migrate_func = async_migrate_func
         self.base_class___ = self.__class__ is StorageJson
+        self.write_delay___: float = write_delay
+        self.write_dirty___: bool = False
+        self.write_extra_data___: dict = {}
+        self.write_unsub___: CALLBACK_TYPE | None = None
+        self.write_unsub_final___: CALLBACK_TYPE | None = None
+        self.write_stats___: dict[str, Any] = {
+            "writes": 0,
+            "coalesced_writes": 0,
+            "encode_time_last_ms": 0.0,
+            "encode_time_total_ms": 0.0,
+            "last_write": None,
+        }
+        self.lazy_attributes___: frozenset[str] = lazy_attributes
+        self.lazy_data___: dict[str, Any] = {}
+        self.read_stats___: dict[str, Any] = {
+            "load_time_ms": 0.0,
+            "decode_time_ms": 0.0,
+            "hydrations": 0,
+            "hydrate_time_ms": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    def __getattr__(self, name: str) -> Any:
+        """Hydrate lazy attribute on first access."""
+
+        lazy_data: dict[str, Any] | None = self.__dict__.get("lazy_data___")
+
+        if lazy_data is None or name not in lazy_data:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        start: float = perf_counter()
+        value = self.serializer___.decode_attribute(
+            type(self), name, lazy_data.pop(name)
+        )
+        self.__dict__[name] = value
+        self.read_stats___["hydrations"] += 1
+        self.read_stats___["hydrate_time_ms"] += (perf_counter() - start) * 1000
+
+        return value
+
+    # ------------------------------------------------------------------
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set attribute, an assigned lazy attribute replaces the stored value."""
+
+        if (lazy_data := self.__dict__.get("lazy_data___")) and name in lazy_data:
+            del lazy_data[name]
+
+        object.__setattr__(self, name, value)
+
+    # ------------------------------------------------------------------
+    def __delattr__(self, name: str) -> None:
+        """Delete attribute, a deleted lazy attribute is not written again."""
+
+        if (lazy_data := self.__dict__.get("lazy_data___")) and name in lazy_data:
+            del lazy_data[name]
+            self.__dict__.pop(name, None)
+            return
+
+        object.__delattr__(self, name)
 
     # ------------------------------------------------------------------
     async def async_read_settings(self) -> dict | None:
         """read_settings."""
 
         tmp_dict: dict = None
+        tmp_attributes: dict | None = None
+        lazy_data: dict[str, Any] = {}
 
+        start: float = perf_counter()
         data = await self.store___.async_load()
+        self.read_stats___["load_time_ms"] = (perf_counter() - start) * 1000
 
         if data is None:
             return None
 
+        start = perf_counter()
+
         if type(data) is dict:
-            if self.DICT_KEY___ in data:
-                jsonpickle.set_encoder_options("json", ensure_ascii=False)
-                tmp_obj = self.decode_data(data[self.DICT_KEY___])
-                del data[self.DICT_KEY___]
+            for serializer in self.serializers_for_read():
+                if serializer.dict_key in data:
+                    encoded = data.pop(serializer.dict_key)
+
+                    if (
+                        serializer is self.serializer___
+                        and isinstance(serializer, SchemaSerializer)
+                        and isinstance(encoded, dict)
+                        and len(self.lazy_attributes___) > 0
+                    ):
+                        encoded = dict(encoded)
+                        lazy_data = {
+                            name: encoded.pop(name)
+                            for name in self.lazy_attributes___
+                            if name in encoded
+                        }
+
+                    tmp_attributes = await self.hass___.async_add_executor_job(
+                        self.decode_data, encoded, serializer
+                    )
+                    break
 
             if len(data) > 0:
                 tmp_dict = data
         else:
-            tmp_obj = self.decode_data(data)
+            tmp_attributes = await self.hass___.async_add_executor_job(
+                self.decode_data, data, JsonPickleSerializer()
+            )
+
+        self.read_stats___["decode_time_ms"] = (perf_counter() - start) * 1000
+
+        if not self.base_class___ and tmp_attributes is not None:
+            self.__dict__.update(tmp_attributes)
 
-        if not self.base_class___:
-            if not hasattr(tmp_obj, "__dict__"):
-                return tmp_dict
-            self.__dict__.update(tmp_obj.__dict__)
+            for name in lazy_data:
+                self.__dict__.pop(name, None)
+
+            self.lazy_data___ = lazy_data
 
         return tmp_dict
 
     # ------------------------------------------------------------------
-    def decode_data(self, data: Any):
-        """Decode data."""
-        return jsonpickle.decode(data)
+    def serializers_for_read(self) -> list[StorageSerializer]:
+        """Configured serializer first, then the known serializers."""
+
+        return [
+            self.serializer___,
+            *(
+                serializer_class()
+                for serializer_class in STORAGE_SERIALIZERS
+                if serializer_class.dict_key != self.serializer___.dict_key
+            ),
+        ]
+
+    # ------------------------------------------------------------------
+    def decode_data(
+        self, data: Any, serializer: StorageSerializer | None = None
+    ) -> dict | None:
+        """Decode data to attributes."""
+
+        if serializer is None:
+            serializer = self.serializer___
+
+        return serializer.decode(data, self)
 
     # ------------------------------------------------------------------
     async def async_write_settings(self, extra_data: dict = {}) -> None:
-        """Write settings."""
+        """Write settings.
 
-        jsonpickle.set_encoder_options("json", ensure_ascii=False)
+        With a write delay the object is marked dirty and written when the
+        delay expires.
+        """
+
+        if self.write_delay___ <= 0:
+            await self._async_write(extra_data)
+            return
+
+        if self.write_dirty___:
+            self.write_stats___["coalesced_writes"] += 1
+
+        self.write_dirty___ = True
+        self.write_extra_data___.update(extra_data)
+
+        if self.write_unsub_final___ is None:
+            self.write_unsub_final___ = self.hass___.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+            )
+
+        if self.write_unsub___ is None:
+            self.write_unsub___ = async_call_later(
+                self.hass___, self.write_delay___, self._async_write_later
+            )
+
+    # ------------------------------------------------------------------
+    async def async_flush_settings(self) -> None:
+        """Write pending settings now."""
+
+        if self.write_unsub___ is not None:
+            self.write_unsub___()
+            self.write_unsub___ = None
+
+        if not self.write_dirty___:
+            return
+
+        extra_data: dict = self.write_extra_data___
+        self.write_dirty___ = False
+        self.write_extra_data___ = {}
+        await self._async_write(extra_data)
+
+    # ------------------------------------------------------------------
+    async def _async_write_later(self, _now: datetime) -> None:
+        """Write when the write delay expires."""
+
+        self.write_unsub___ = None
+        await self.async_flush_settings()
+
+    # ------------------------------------------------------------------
+    async def _async_final_write(self, _event: Event) -> None:
+        """Flush pending settings on shutdown."""
+
+        self.write_unsub_final___ = None
+        await self.async_flush_settings()
+
+    # ------------------------------------------------------------------
+    async def _async_write(self, extra_data: dict) -> None:
+        """Snapshot on the event loop, encode the snapshot in the executor and save."""
 
         if self.base_class___:
             await self.store___.async_save(extra_data)
 
         else:
-            await self.store___.async_save(
-                {self.DICT_KEY___: self.encode_data(self), **extra_data}
+            start: float = perf_counter()
+            encoded = await self.hass___.async_add_executor_job(
+                self.encode_data, self.write_snapshot(), dict(self.lazy_data___)
             )
+            encode_time: float = (perf_counter() - start) * 1000
+            self.write_stats___["encode_time_last_ms"] = encode_time
+            self.write_stats___["encode_time_total_ms"] += encode_time
+
+            await self.store___.async_save({self.DICT_KEY___: encoded, **extra_data})
+
+        self.write_stats___["writes"] += 1
+        self.write_stats___["last_write"] = dt_util.now().isoformat()
 
     # ------------------------------------------------------------------
-    def encode_data(self, data: Any):
-        """Encode data."""
-        return jsonpickle.encode(data, unpicklable=True)
+    def write_stats(self) -> dict[str, Any]:
+        """Write statistics."""
+
+        return {**self.write_stats___, "pending": self.write_dirty___}
+
+    # ------------------------------------------------------------------
+    def read_stats(self) -> dict[str, Any]:
+        """Read statistics."""
+
+        return {**self.read_stats___, "lazy_pending": len(self.lazy_data___)}
+
+    # ------------------------------------------------------------------
+    def write_snapshot(self) -> Any:
+        """Detached copy of the attributes to write, taken on the event loop.
+
+        The executor only encodes the copy, so attributes changed on the loop
+        while encoding can't tear the written data.
+        """
+
+        snapshot = object.__new__(type(self))
+        snapshot.__dict__.update(self.__getstate__())
+        # Hidden attributes are already removed from the copy
+        snapshot.__dict__["write_hidden_attributes___"] = True
+
+        return snapshot
+
+    # ------------------------------------------------------------------
+    def encode_data(self, data: Any, lazy_data: dict[str, Any] | None = None):
+        """Encode data, lazy attributes not yet hydrated are written as read."""
+
+        if lazy_data and isinstance(self.serializer___, SchemaSerializer):
+            return {
+                **lazy_data,
+                **self.serializer___.encode(data, exclude=lazy_data.keys()),
+            }
+
+        return self.serializer___.encode(data)
 
     # ------------------------------------------------------------------
     async def async_remove_settings(self) -> None:
         """Remove settings."""
+
+        if self.write_unsub___ is not None:
+            self.write_unsub___()
+            self.write_unsub___ = None
+
+        if self.write_unsub_final___ is not None:
+            self.write_unsub_final___()
+            self.write_unsub_final___ = None
+
+        self.write_dirty___ = False
+        self.write_extra_data___ = {}
         await self.store___.async_remove()
 
     # ------------------------------------------------------------------
     def __getstate__(self) -> dict:
-        """Get state."""
+        """Get state, a deep copy so removing hidden attributes can't touch self."""
         tmp_dict = self.__dict__.copy()
-        del tmp_dict["write_hidden_attributes___"]
-        del tmp_dict["hass___"]
-        del tmp_dict["store___"]
-        del tmp_dict["DICT_KEY___"]
-        del tmp_dict["base_class___"]
+
+        for key in STORAGE_INTERNAL_ATTRIBUTES:
+            tmp_dict.pop(key, None)
+
+        tmp_dict = deepcopy(tmp_dict)
 
         if self.write_hidden_attributes___ is False:
             try:
@@ -0,0 +1,273 @@
+"""Storage serializers.
+
+External imports: jsonpickle
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Collection
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from types import NoneType, UnionType
+from typing import Any, ClassVar, Union, get_args, get_origin, get_type_hints
+
+import jsonpickle
+
+jsonpickle.set_encoder_options("json", ensure_ascii=False)
+
+
+# ------------------------------------------------------------------
+def is_hidden_attribute(name: str) -> bool:
+    """Hidden attributes ends with ___ and are never written."""
+
+    return len(name) > 3 and name[-3:] == "___"
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class StorageSerializer(ABC):
+    """Storage serializer base class.
+
+    The encoded data is stored under dict_key, so data written by another
+    serializer can be recognized when read.
+    """
+
+    dict_key: str = ""
+
+    # ------------------------------------------------------------------
+    @abstractmethod
+    def encode(self, obj: Any) -> Any:
+        """Encode object to json compatible data."""
+
+    # ------------------------------------------------------------------
+    @abstractmethod
+    def decode(self, data: Any, obj: Any) -> dict | None:
+        """Decode data to attributes for obj."""
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class JsonPickleSerializer(StorageSerializer):
+    """Jsonpickle serializer, stores type tags for every object."""
+
+    dict_key: str = "jsonpickle"
+
+    # ------------------------------------------------------------------
+    def encode(self, obj: Any) -> Any:
+        """Encode object."""
+        return jsonpickle.encode(obj, unpicklable=True)
+
+    # ------------------------------------------------------------------
+    def decode(self, data: Any, obj: Any) -> dict | None:
+        """Decode data."""
+
+        tmp_obj = jsonpickle.decode(data)
+
+        if not hasattr(tmp_obj, "__dict__"):
+            return None
+
+        return tmp_obj.__dict__
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class SchemaSerializer(StorageSerializer):
+    """Compact serializer driven by declared types.
+
+    The attributes written are the annotated attributes of the storage
+    class, or the instance attributes when none are annotated. Dataclasses,
+    classes with __slots__, enums, datetimes, lists and dicts are rebuilt
+    from the type hints when read, no type tags are stored.
+    """
+
+    dict_key: str = "schema"
+
+    def __init__(self) -> None:
+        """Init."""
+
+        self._type_hints: dict[type, dict[str, Any]] = {}
+
+    # ------------------------------------------------------------------
+    def type_hints(self, cls: type) -> dict[str, Any]:
+        """Get type hints for class, cached."""
+
+        if (hints := self._type_hints.get(cls)) is None:
+            try:
+                hints = get_type_hints(cls)
+            except (NameError, TypeError):
+                hints = {}
+
+            hints = self._type_hints[cls] = {
+                name: hint
+                for name, hint in hints.items()
+                if not is_hidden_attribute(name)
+                and not name.startswith("__")
+                and get_origin(hint) is not ClassVar
+                and hint is not ClassVar
+            }
+
+        return hints
+
+    # ------------------------------------------------------------------
+    def attribute_names(self, obj: Any, exclude: Collection[str] = ()) -> list[str]:
+        """Attribute names to write for obj."""
+
+        if is_dataclass(obj):
+            return [field.name for field in fields(obj) if field.name not in exclude]
+
+        if len(hints := self.type_hints(type(obj))) > 0:
+            return [
+                name for name in hints if name not in exclude and hasattr(obj, name)
+            ]
+
+        if hasattr(obj, "__dict__"):
+            return [
+                name
+                for name in vars(obj)
+                if not is_hidden_attribute(name) and not name.startswith("__")
+            ]
+
+        return [
+            name
+            for cls in type(obj).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if not is_hidden_attribute(name) and hasattr(obj, name)
+        ]
+
+    # ------------------------------------------------------------------
+    def encode(self, obj: Any, exclude: Collection[str] = ()) -> Any:
+        """Encode object."""
+
+        return {
+            name: self.encode_value(getattr(obj, name))
+            for name in self.attribute_names(obj, exclude)
+            if name not in exclude
+        }
+
+    # ------------------------------------------------------------------
+    def encode_value(self, value: Any) -> Any:
+        """Encode value."""
+
+        if value is None or isinstance(value, bool | int | float | str):
+            return value
+
+        if isinstance(value, Enum):
+            return value.value
+
+        if isinstance(value, datetime | date | time):
+            return value.isoformat()
+
+        if isinstance(value, timedelta):
+            return value.total_seconds()
+
+        if isinstance(value, dict):
+            return {key: self.encode_value(item) for key, item in value.items()}
+
+        if isinstance(value, list | tuple | set | frozenset):
+            return [self.encode_value(item) for item in value]
+
+        return self.encode(value)
+
+    # ------------------------------------------------------------------
+    def decode(self, data: Any, obj: Any) -> dict | None:
+        """Decode data."""
+
+        if not isinstance(data, dict):
+            return None
+
+        hints: dict[str, Any] = self.type_hints(type(obj))
+
+        return {
+            name: self.decode_value(value, hints.get(name, Any))
+            for name, value in data.items()
+        }
+
+    # ------------------------------------------------------------------
+    def decode_attribute(self, cls: type, name: str, value: Any) -> Any:
+        """Decode a single attribute of cls."""
+
+        return self.decode_value(value, self.type_hints(cls).get(name, Any))
+
+    # ------------------------------------------------------------------
+    def decode_value(self, value: Any, hint: Any) -> Any:  # noqa: C901
+        """Decode value using type hint."""
+
+        if value is None or hint is Any:
+            return value
+
+        origin = get_origin(hint)
+
+        if origin is Union or origin is UnionType:
+            for arg in get_args(hint):
+                if arg is NoneType:
+                    continue
+                try:
+                    return self.decode_value(value, arg)
+                except (TypeError, ValueError, AttributeError):
+                    continue
+            return value
+
+        if origin in (list, set, frozenset, tuple):
+            args = get_args(hint)
+            item_hint = args[0] if len(args) > 0 else Any
+            items = [self.decode_value(item, item_hint) for item in value]
+            return items if origin is list else origin(items)
+
+        if origin is dict:
+            args = get_args(hint)
+            item_hint = args[1] if len(args) > 1 else Any
+            return {
+                key: self.decode_value(item, item_hint) for key, item in value.items()
+            }
+
+        if not isinstance(hint, type):
+            return value
+
+        if issubclass(hint, Enum):
+            return hint(value)
+
+        if issubclass(hint, datetime):
+            return datetime.fromisoformat(value)
+
+        if issubclass(hint, date):
+            return date.fromisoformat(value)
+
+        if issubclass(hint, time):
+            return time.fromisoformat(value)
+
+        if issubclass(hint, timedelta):
+            return timedelta(seconds=value)
+
+        if isinstance(value, dict) and hint is not dict:
+            return self.decode_object(value, hint)
+
+        return value
+
+    # ------------------------------------------------------------------
+    def decode_object(self, data: dict, cls: type) -> Any:
+        """Create object of cls from data."""
+
+        hints: dict[str, Any] = self.type_hints(cls)
+        values: dict[str, Any] = {
+            name: self.decode_value(value, hints.get(name, Any))
+            for name, value in data.items()
+        }
+
+        if is_dataclass(cls):
+            init_names = {field.name for field in fields(cls) if field.init}
+            obj = cls(
+                **{key: value for key, value in values.items() if key in init_names}
+            )
+
+            for name, value in values.items():
+                if name not in init_names:
+                    object.__setattr__(obj, name, value)
+
+            return obj
+
+        obj = cls.__new__(cls)
+
+        for name, value in values.items():
+            object.__setattr__(obj, name, value)
+
+        return obj
@@ -3,17 +3,32 @@
 External imports: None
 """
 
+from asyncio import Task
 from datetime import datetime, timedelta
 from enum import Enum
+from heapq import heappop, heappush
 import inspect
+from itertools import count
+from math import floor
+from typing import Any
 
 from homeassistant.const import ATTR_ENTITY_ID
-from homeassistant.core import Event, State, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers import start
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.util import Callable, dt as dt_util
 
+EVENT_TIMER_FINISHED = "timer.finished"
+TIMER_FINISHED_DISPATCHER = "hass_util_timer_finished_dispatcher"
+PERIODIC_SCHEDULER = "hass_util_periodic_scheduler"
+
 # ------------------------------------------------------
 # ------------------------------------------------------
 
@@ -32,6 +47,190 @@ class TimerTriggerErrorEnum(Enum):
         return self != TimerTriggerErrorEnum.NONE
 
 
+# ------------------------------------------------------
+# ------------------------------------------------------
+class TimerTriggerMissedTickPolicy(Enum):
+    """What to do with ticks missed while late or while the callback runs."""
+
+    SKIP = 0
+    CATCH_UP = 1
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class PeriodicScheduler:
+    """One timer heap per hass for the periodic timer triggers.
+
+    Only the earliest due tick is armed in hass. Times are utc timestamps.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.heap: list[tuple[float, int, TimerTrigger]] = []
+        self.sequence = count()
+        self.armed_due: float | None = None
+        self.unsub_timer: CALLBACK_TYPE | None = None
+        self.firing: bool = False
+
+    # ------------------------------------------------------
+    @classmethod
+    @callback
+    def async_get(cls, hass: HomeAssistant) -> "PeriodicScheduler":
+        """Get the scheduler for hass."""
+
+        if (scheduler := hass.data.get(PERIODIC_SCHEDULER)) is None:
+            scheduler = hass.data[PERIODIC_SCHEDULER] = cls(hass)
+
+        return scheduler
+
+    # ------------------------------------------------------
+    @callback
+    def async_schedule(self, trigger: "TimerTrigger", due: float) -> None:
+        """Schedule the next tick of trigger, replacing a scheduled tick."""
+
+        trigger.tick_sequence = next(self.sequence)
+        heappush(self.heap, (due, trigger.tick_sequence, trigger))
+        self._async_arm()
+
+    # ------------------------------------------------------
+    @callback
+    def async_cancel(self, trigger: "TimerTrigger") -> None:
+        """Cancel the scheduled tick of trigger."""
+
+        trigger.tick_sequence = None
+        self._async_arm()
+
+    # ------------------------------------------------------
+    @staticmethod
+    def _valid(entry: tuple[float, int, "TimerTrigger"]) -> bool:
+        """Cancelled and replaced ticks are removed lazily."""
+
+        return entry[2].tick_sequence == entry[1]
+
+    # ------------------------------------------------------
+    @callback
+    def _async_arm(self) -> None:
+        """Arm hass timer for the earliest tick."""
+
+        if self.firing:
+            return
+
+        while len(self.heap) > 0 and not self._valid(self.heap[0]):
+            heappop(self.heap)
+
+        due: float | None = self.heap[0][0] if len(self.heap) > 0 else None
+
+        if due == self.armed_due:
+            return
+
+        if self.unsub_timer is not None:
+            self.unsub_timer()
+            self.unsub_timer = None
+
+        self.armed_due = due
+
+        if due is not None:
+            self.unsub_timer = async_track_point_in_utc_time(
+                self.hass, self._async_fire, dt_util.utc_from_timestamp(due)
+            )
+
+    # ------------------------------------------------------
+    @callback
+    def _async_fire(self, _now: datetime) -> None:
+        """Run due ticks."""
+
+        self.unsub_timer = None
+        self.armed_due = None
+        now: float = dt_util.utcnow().timestamp()
+        self.firing = True
+
+        try:
+            while len(self.heap) > 0 and self.heap[0][0] <= now:
+                entry = heappop(self.heap)
+
+                if self._valid(entry):
+                    entry[2].tick_sequence = None
+                    entry[2].async_tick(entry[0], now)
+        finally:
+            self.firing = False
+
+        self._async_arm()
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class TimerFinishedDispatcher:
+    """One timer.finished listener per hass, dispatching to the timer triggers."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.triggers: dict[str, list[TimerTrigger]] = {}
+        self.restarting: set[str] = set()
+        self.unsub_listener: CALLBACK_TYPE | None = None
+
+    # ------------------------------------------------------
+    @classmethod
+    @callback
+    def async_get(cls, hass: HomeAssistant) -> "TimerFinishedDispatcher":
+        """Get the dispatcher for hass."""
+
+        if (dispatcher := hass.data.get(TIMER_FINISHED_DISPATCHER)) is None:
+            dispatcher = hass.data[TIMER_FINISHED_DISPATCHER] = cls(hass)
+
+        return dispatcher
+
+    # ------------------------------------------------------
+    @callback
+    def async_register(self, trigger: "TimerTrigger") -> CALLBACK_TYPE:
+        """Register trigger for its timer entity, returns unregister."""
+
+        self.triggers.setdefault(trigger.timer_entity, []).append(trigger)
+
+        if self.unsub_listener is None:
+            self.unsub_listener = self.hass.bus.async_listen(
+                EVENT_TIMER_FINISHED,
+                self._async_timer_finished,
+                event_filter=self._async_filter,
+            )
+
+        # ------------------------------------------------------
+        @callback
+        def async_unregister() -> None:
+            if (triggers := self.triggers.get(trigger.timer_entity)) is None:
+                return
+
+            if trigger in triggers:
+                triggers.remove(trigger)
+
+            if len(triggers) == 0:
+                del self.triggers[trigger.timer_entity]
+
+            if len(self.triggers) == 0 and self.unsub_listener is not None:
+                self.unsub_listener()
+                self.unsub_listener = None
+
+        return async_unregister
+
+    # ------------------------------------------------------
+    @callback
+    def _async_filter(self, event_data: dict) -> bool:
+        """Only timers with triggers."""
+
+        return event_data.get(ATTR_ENTITY_ID) in self.triggers
+
+    # ------------------------------------------------------
+    @callback
+    def _async_timer_finished(self, event: Event) -> None:
+        """Dispatch to the triggers of the timer."""
+
+        for trigger in tuple(self.triggers.get(event.data.get(ATTR_ENTITY_ID), ())):
+            self.hass.async_create_task(trigger.async_handle_timer_finished(event))
+
+
 # ------------------------------------------------------
 # ------------------------------------------------------
 class TimerTrigger:
@@ -41,8 +240,6 @@ class TimerTrigger:
 
     """
 
-    restarting_timer: bool = False
-
     def __init__(
         self,
         entity: Entity,
@@ -50,8 +247,15 @@ class TimerTrigger:
         duration: timedelta | None = None,
         callback_trigger: Callable[[TimerTriggerErrorEnum], None] = None,
         auto_restart: bool = True,
+        missed_tick_policy: TimerTriggerMissedTickPolicy = (
+            TimerTriggerMissedTickPolicy.SKIP
+        ),
     ) -> None:
-        """Init."""
+        """Init.
+
+        With a duration the callback is called at a fixed rate anchored to
+        the start time, independent of how long the callback takes.
+        """
 
         if (timer_entity == "" and duration is None) or (
             timer_entity == ""
@@ -73,7 +277,20 @@ class TimerTrigger:
 
         self.error: TimerTriggerErrorEnum = TimerTriggerErrorEnum.NONE
         self.timer_state: State
-        self.unsub_async_track_point_in_utc_time: Callable[[], None] | None = None
+
+        self.missed_tick_policy: TimerTriggerMissedTickPolicy = missed_tick_policy
+        self.tick_start: float | None = None
+        self.tick_sequence: int | None = None
+        self.tick_pending: int = 0
+        self.tick_running: bool = False
+        self.tick_task: Task | None = None
+        self.tick_stats: dict[str, Any] = {
+            "ticks": 0,
+            "missed_ticks": 0,
+            "last_lateness_ms": 0.0,
+            "max_lateness_ms": 0.0,
+            "total_lateness_ms": 0.0,
+        }
 
         self.entity.async_on_remove(
             start.async_at_started(self.entity.hass, self.async_hass_started)
@@ -105,64 +322,120 @@ class TimerTrigger:
             return False
 
         state: State = self.entity.hass.states.get(self.timer_entity)
+        restarting: set[str] = TimerFinishedDispatcher.async_get(
+            self.entity.hass
+        ).restarting
 
         if (
-            state.state == "idle"
-            and not TimerTrigger.restarting_timer
+            state is not None
+            and state.state == "idle"
+            and self.timer_entity not in restarting
             and self.auto_restart
         ):
-            TimerTrigger.restarting_timer = True
-
-            await self.entity.hass.services.async_call(
-                "timer",
-                "start",
-                service_data={ATTR_ENTITY_ID: self.timer_entity},
-                blocking=True,
-            )
-            TimerTrigger.restarting_timer = False
+            restarting.add(self.timer_entity)
+
+            try:
+                await self.entity.hass.services.async_call(
+                    "timer",
+                    "start",
+                    service_data={ATTR_ENTITY_ID: self.timer_entity},
+                    blocking=True,
+                )
+            finally:
+                restarting.discard(self.timer_entity)
         return True
 
     # ------------------------------------------------------------------
-    async def async_point_in_time_listener(self, time_date: datetime) -> None:
-        """Point in time listener."""
+    @callback
+    def async_tick(self, due: float, now: float) -> None:
+        """Tick due, schedule the next tick and run the callback."""
 
         if self.error:
             return
 
-        if self.unsub_async_track_point_in_utc_time:
-            self.unsub_async_track_point_in_utc_time()
-            self.unsub_async_track_point_in_utc_time = None
+        period: float = self.duration.total_seconds()
+        lateness: float = max(now - due, 0) * 1000
 
-        if inspect.iscoroutinefunction(self.callback_trigger):
-            await self.callback_trigger(self.error)
+        self.tick_stats["ticks"] += 1
+        self.tick_stats["last_lateness_ms"] = lateness
+        self.tick_stats["max_lateness_ms"] = max(
+            self.tick_stats["max_lateness_ms"], lateness
+        )
+        self.tick_stats["total_lateness_ms"] += lateness
+
+        if self.missed_tick_policy == TimerTriggerMissedTickPolicy.CATCH_UP:
+            self.tick_pending += 1
+            next_due: float = due + period
         else:
-            self.callback_trigger(self.error)
+            missed: int = floor((now - due) / period)
+            self.tick_stats["missed_ticks"] += missed
+            next_due = due + (missed + 1) * period
+
+            if self.tick_running:
+                self.tick_stats["missed_ticks"] += 1
+            else:
+                self.tick_pending = 1
+
+        PeriodicScheduler.async_get(self.entity.hass).async_schedule(self, next_due)
+
+        if not self.tick_running and self.tick_pending > 0:
+            self.tick_running = True
+            self.tick_task = self.entity.hass.async_create_task(self.async_run_ticks())
 
-        self.point_in_time_listener_start()
+    # ------------------------------------------------------------------
+    async def async_run_ticks(self) -> None:
+        """Run the callback for pending ticks."""
+
+        try:
+            while self.tick_pending > 0 and not self.error:
+                self.tick_pending -= 1
+
+                if inspect.iscoroutinefunction(self.callback_trigger):
+                    await self.callback_trigger(self.error)
+                else:
+                    self.callback_trigger(self.error)
+        finally:
+            self.tick_running = False
+            self.tick_task = None
 
     # ------------------------------------------------------------------
-    def point_in_time_listener_start(self) -> None:
-        """Point in time listener start."""
+    def tick_statistics(self) -> dict[str, Any]:
+        """Tick lateness statistics."""
+
+        return {
+            **self.tick_stats,
+            "mean_lateness_ms": self.tick_stats["total_lateness_ms"]
+            / max(self.tick_stats["ticks"], 1),
+            "pending_ticks": self.tick_pending,
+        }
+
+    # ------------------------------------------------------------------
+    def point_in_time_listener_start(self, start_time: datetime | None = None) -> None:
+        """Start fixed rate ticks, anchored to start time or now."""
 
         if self.error:
             return
-        self.unsub_async_track_point_in_utc_time = async_track_point_in_utc_time(
-            self.entity.hass,
-            self.async_point_in_time_listener,
-            dt_util.utcnow() + self.duration,
+
+        self.tick_start = (
+            start_time if start_time is not None else dt_util.utcnow()
+        ).timestamp()
+        PeriodicScheduler.async_get(self.entity.hass).async_schedule(
+            self, self.tick_start + self.duration.total_seconds()
         )
 
     # ------------------------------------------------------------------
-    @callback
     async def async_handle_timer_finished(self, event: Event) -> None:
         """Handle timer finished."""
 
+        if event.data.get(ATTR_ENTITY_ID) != self.timer_entity:
+            return
+
         if inspect.iscoroutinefunction(self.callback_trigger):
             await self.callback_trigger(self.error)
         else:
             self.callback_trigger(self.error)
 
-        if not self.error and event.data[ATTR_ENTITY_ID] == self.timer_entity:
+        if not self.error:
             if self.auto_restart:
                 if await self.async_validate_timer():
                     await self.async_restart_timer()
@@ -174,9 +447,9 @@ class TimerTrigger:
         if self.timer_entity != "":
             if await self.async_validate_timer():
                 self.entity.async_on_remove(
-                    self.entity.hass.bus.async_listen(
-                        "timer.finished", self.async_handle_timer_finished
-                    )
+                    TimerFinishedDispatcher.async_get(
+                        self.entity.hass
+                    ).async_register(self)
                 )
 
                 if self.auto_restart:
@@ -184,17 +457,17 @@ class TimerTrigger:
 
         else:
             self.entity.async_on_remove(self.async_remove_from_hass)
-
-            self.unsub_async_track_point_in_utc_time = async_track_point_in_utc_time(
-                self.entity.hass,
-                self.async_point_in_time_listener,
-                dt_util.utcnow() + self.duration,
-            )
+            self.point_in_time_listener_start()
 
     # ------------------------------------------------------
     @callback
     def async_remove_from_hass(self) -> None:
         """Handle removal from Hass."""
-        if self.unsub_async_track_point_in_utc_time:
-            self.unsub_async_track_point_in_utc_time()
-            self.unsub_async_track_point_in_utc_time = None
+
+        PeriodicScheduler.async_get(self.entity.hass).async_cancel(self)
+        self.tick_pending = 0
+
+        # A callback still running must not call into the removed entity
+        if self.tick_task is not None:
+            self.tick_task.cancel()
+            self.tick_task = None
@@ -3,6 +3,8 @@
 External imports: aiofiles, orjson
 """
 
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any, Literal
 
@@ -12,7 +14,9 @@ import orjson
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.selector import NumberSelectorConfig, NumberSelectorMode
 
-from . import async_get_user_language
+from .hass_util import async_get_user_language
+
+TRANSLATE_CACHE_SIZE = 8
 
 
 # ------------------------------------------------------------------
@@ -77,8 +81,12 @@ class Translate:
     External imports: orjson
     """
 
-    __filename: str = ""
-    __json_dict: dict[str, Any] = {}
+    # (language, file name, load only) -> flattened dict
+    __cache: OrderedDict[tuple[str, str, str], dict[str, Any]] = OrderedDict()
+    # (language, file name, load only) -> format of templates with placeholders
+    __templates: dict[tuple[str, str, str], dict[str, Callable[..., str]]] = {}
+    # translation file path -> flattened dict
+    __files: OrderedDict[str, dict[str, Any]] = OrderedDict()
     acive_language: str = ""
 
     def __init__(self, hass: HomeAssistant, load_only: str = "") -> None:
@@ -104,20 +112,47 @@ class Translate:
         if language is None:
             language = await async_get_user_language()
 
-        await self.__async_check_language_loaded(
-            str(language), file_name=file_name, load_only=load_only
-        )
+        cache_key: tuple[str, str, str] = (str(language), file_name, load_only)
+
+        if (json_dict := Translate.__cache.get(cache_key)) is None:
+            json_dict = await self.__async_load_language(*cache_key)
+        else:
+            Translate.__cache.move_to_end(cache_key)
+
+        Translate.acive_language = str(language)
 
         if len(kvargs) == 0:
-            return Translate.__json_dict.get(key, default)
+            return json_dict.get(key, default)
+
+        if (template := Translate.__templates[cache_key].get(key)) is not None:
+            return template(**kvargs)
 
-        return str(Translate.__json_dict.get(key, default)).format(**kvargs)
+        return str(json_dict.get(key, default)).format(**kvargs)
 
     # ------------------------------------------------------------------
-    async def __async_check_language_loaded(
-        self, language: str, file_name: str = ".json", load_only: str = ""
+    async def async_preload(
+        self,
+        languages: Iterable[str] | None = None,
+        file_name: str = ".json",
+        load_only: str = "",
     ) -> None:
-        """Check language."""
+        """Load languages into the cache, the user language if None."""
+
+        if load_only == "":
+            load_only = self.load_only
+
+        if languages is None:
+            languages = [await async_get_user_language()]
+
+        for language in languages:
+            if (str(language), file_name, load_only) not in Translate.__cache:
+                await self.__async_load_language(str(language), file_name, load_only)
+
+    # ------------------------------------------------------------------
+    async def __async_load_language(
+        self, language: str, file_name: str = ".json", load_only: str = ""
+    ) -> dict[str, Any]:
+        """Load language into the cache."""
 
         # ------------------------------------------------------------------
         def recursive_flatten(
@@ -145,14 +180,40 @@ class Translate:
                 Path(Path(__file__).parent.parent) / "translations" / ("en" + file_name)
             )
 
-            if not filename.is_file():
-                return
+        cache_key: tuple[str, str, str] = (language, file_name, load_only)
+        json_dict: dict[str, Any] = {}
+
+        if filename.is_file():
+            if (file_dict := Translate.__files.get(str(filename))) is None:
+                async with aiofiles.open(str(filename)) as json_file:
+                    file_dict = recursive_flatten(
+                        "", orjson.loads(await json_file.read())
+                    )
+
+                Translate.__files[str(filename)] = file_dict
+
+                if len(Translate.__files) > TRANSLATE_CACHE_SIZE:
+                    Translate.__files.popitem(last=False)
+
+            json_dict = (
+                {
+                    key: value
+                    for key, value in file_dict.items()
+                    if key.startswith(load_only)
+                }
+                if load_only != ""
+                else file_dict
+            )
+
+        Translate.__cache[cache_key] = json_dict
+        Translate.__templates[cache_key] = {
+            key: value.format
+            for key, value in json_dict.items()
+            if isinstance(value, str) and "{" in value
+        }
 
-        if Translate.__filename != str(filename):
-            Translate.__filename = str(filename)
-            Translate.acive_language = language
+        if len(Translate.__cache) > TRANSLATE_CACHE_SIZE:
+            old_key, _ = Translate.__cache.popitem(last=False)
+            del Translate.__templates[old_key]
 
-            async with aiofiles.open(str(filename)) as json_file:
-                Translate.__json_dict = recursive_flatten(
-                    "", orjson.loads(await json_file.read()), load_only
-                )
+        return json_dict
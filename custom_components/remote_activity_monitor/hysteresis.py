@@ -0,0 +1,84 @@
+"""Hysteresis for the main activity monitor state."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import timedelta
+
+FLIP_RATE_PERIOD = 3600.0
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class Hysteresis:
+    """Separate on/off delay, minimum hold time and max flip rate for the main state.
+
+    All points in time are local monotonic seconds.
+    """
+
+    # ------------------------------------------------------
+    def __init__(
+        self,
+        on_delay: timedelta | None = None,
+        off_delay: timedelta | None = None,
+        min_hold: timedelta | None = None,
+        max_flips_per_hour: int = 0,
+    ) -> None:
+        """Init.
+
+        on_delay/off_delay set to None falls back to the common wait duration.
+        """
+        self.on_delay: timedelta | None = on_delay
+        self.off_delay: timedelta | None = off_delay
+        self.min_hold: timedelta = min_hold if min_hold is not None else timedelta()
+        self.max_flips_per_hour: int = max(max_flips_per_hour, 0)
+
+        self.last_flip: float | None = None
+        self.flips: deque[float] = deque()
+
+    # ------------------------------------------------------
+    def delay(self, remote_state_on: bool) -> timedelta | None:
+        """Return the configured delay for a remote state, None if not configured."""
+
+        return self.on_delay if remote_state_on else self.off_delay
+
+    # ------------------------------------------------------
+    def _flip_rate_wait(self, now: float) -> float:
+        """Return seconds left before the flip rate allows another flip."""
+
+        if self.max_flips_per_hour == 0:
+            return 0.0
+
+        while len(self.flips) > 0 and now - self.flips[0] >= FLIP_RATE_PERIOD:
+            self.flips.popleft()
+
+        if len(self.flips) < self.max_flips_per_hour:
+            return 0.0
+
+        return self.flips[0] + FLIP_RATE_PERIOD - now
+
+    # ------------------------------------------------------
+    def remaining_wait(
+        self, delay: timedelta, remote_changed: float, now: float
+    ) -> timedelta:
+        """Return time left before the main state may flip, zero if it may flip now."""
+
+        wait: float = max(
+            delay.total_seconds() - (now - remote_changed),
+            self._flip_rate_wait(now),
+            0.0,
+        )
+
+        if self.last_flip is not None:
+            wait = max(wait, self.min_hold.total_seconds() - (now - self.last_flip))
+
+        return timedelta(seconds=wait)
+
+    # ------------------------------------------------------
+    def register_flip(self, now: float) -> None:
+        """Register that the main state has flipped."""
+
+        self.last_flip = now
+
+        if self.max_flips_per_hour > 0:
+            self.flips.append(now)
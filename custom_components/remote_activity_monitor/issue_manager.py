@@ -0,0 +1,178 @@
+"""Repair issues for a config entry."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+from time import monotonic
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, DOMAIN_NAME, ISSUE_MIN_INTERVAL
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class IssueManager:
+    """Deterministic, deduplicated and rate limited repair issues for a config entry.
+
+    Issue ids are built from the entry id and a reason, so a recurring
+    problem updates one issue instead of adding a new one on every retry.
+    An issue created within min_interval of the last creation, also after
+    it has been deleted, is deferred until the interval has passed.
+    """
+
+    # ------------------------------------------------------
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        min_interval: float = ISSUE_MIN_INTERVAL,
+    ) -> None:
+        """Init."""
+        self.hass: HomeAssistant = hass
+        self.entry_id: str = entry_id
+        self.min_interval: float = min_interval
+
+        self.active: dict[str, tuple[str, dict | None]] = {}
+        self.last_created: dict[str, float] = {}
+        self.deferred: dict[str, tuple[str, dict | None]] = {}
+        self.unsub_deferred: dict[str, CALLBACK_TYPE] = {}
+
+    # ------------------------------------------------------
+    def issue_id(self, reason: str) -> str:
+        """Get issue id for a reason."""
+
+        return f"{self.entry_id}_{reason}"
+
+    # ------------------------------------------------------
+    @callback
+    def async_create_issue(
+        self,
+        reason: str,
+        translation_key: str,
+        translation_placeholders: dict | None = None,
+    ) -> str:
+        """Create issue, unless the same issue is active or was created recently."""
+
+        issue_id: str = self.issue_id(reason)
+        issue: tuple[str, dict | None] = (translation_key, translation_placeholders)
+
+        if self.active.get(issue_id) == issue:
+            self.async_cancel_deferred(issue_id)
+            return issue_id
+
+        wait: float = (
+            self.last_created.get(issue_id, -self.min_interval)
+            + self.min_interval
+            - monotonic()
+        )
+
+        if wait > 0:
+            self.deferred[issue_id] = issue
+
+            if issue_id not in self.unsub_deferred:
+                self.unsub_deferred[issue_id] = async_call_later(
+                    self.hass, wait, self._async_create_deferred(issue_id)
+                )
+
+            return issue_id
+
+        self._async_create(issue_id, issue)
+        return issue_id
+
+    # ------------------------------------------------------
+    def _async_create_deferred(self, issue_id: str) -> Callable[[datetime], None]:
+        """Callback creating a deferred issue."""
+
+        @callback
+        def _async_create_later(_now: datetime) -> None:
+            self.unsub_deferred.pop(issue_id, None)
+
+            if (issue := self.deferred.pop(issue_id, None)) is not None:
+                self._async_create(issue_id, issue)
+
+        return _async_create_later
+
+    # ------------------------------------------------------
+    @callback
+    def _async_create(self, issue_id: str, issue: tuple[str, dict | None]) -> None:
+        """Create issue in the issue registry."""
+
+        translation_key, translation_placeholders = issue
+
+        ir.async_create_issue(
+            self.hass,
+            DOMAIN,
+            issue_id,
+            issue_domain=DOMAIN,
+            is_fixable=False,
+            severity=ir.IssueSeverity.WARNING,
+            translation_key=translation_key,
+            translation_placeholders=translation_placeholders,
+        )
+        self.active[issue_id] = issue
+        self.last_created[issue_id] = monotonic()
+
+    # ------------------------------------------------------
+    @callback
+    def async_cancel_deferred(self, issue_id: str | None = None) -> None:
+        """Cancel a deferred issue, or all deferred issues."""
+
+        for deferred_id in (
+            [issue_id] if issue_id is not None else list(self.unsub_deferred)
+        ):
+            self.deferred.pop(deferred_id, None)
+
+            if (unsub := self.unsub_deferred.pop(deferred_id, None)) is not None:
+                unsub()
+
+    # ------------------------------------------------------
+    @callback
+    def async_delete_issue(self, reason: str) -> None:
+        """Delete issue when the cause is resolved.
+
+        The creation time is kept, so the rate limit also covers creating
+        the issue again.
+        """
+
+        issue_id: str = self.issue_id(reason)
+
+        self.async_cancel_deferred(issue_id)
+        self.active.pop(issue_id, None)
+        ir.async_delete_issue(self.hass, DOMAIN, issue_id)
+
+    # ------------------------------------------------------
+    @callback
+    def async_delete_issues_with_prefix(self, reason_prefix: str) -> None:
+        """Delete all issues where the reason starts with prefix."""
+
+        issue_id_prefix: str = self.issue_id(reason_prefix)
+
+        for issue_id in list(self.unsub_deferred):
+            if issue_id.startswith(issue_id_prefix):
+                self.async_cancel_deferred(issue_id)
+
+        for domain, issue_id in list(ir.async_get(self.hass).issues):
+            if domain == DOMAIN and issue_id.startswith(issue_id_prefix):
+                self.active.pop(issue_id, None)
+                ir.async_delete_issue(self.hass, DOMAIN, issue_id)
+
+    # ------------------------------------------------------
+    @callback
+    def async_delete_all_issues(self) -> None:
+        """Delete all issues for the config entry."""
+
+        self.async_delete_issues_with_prefix("")
+
+
+# ------------------------------------------------------
+@callback
+def async_delete_legacy_issues(hass: HomeAssistant) -> None:
+    """Delete issues created with timestamp based ids by earlier versions."""
+
+    for domain, issue_id in list(ir.async_get(hass).issues):
+        if domain == DOMAIN and issue_id.startswith(DOMAIN_NAME):
+            ir.async_delete_issue(hass, DOMAIN, issue_id)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timedelta
+from time import monotonic
 from typing import Any
 
 import voluptuous as vol
@@ -23,13 +24,18 @@ from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import (
     config_validation as cv,
     entity_platform,
-    issue_registry as ir,
     start,
 )
 from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.event import (
     EventStateChangedData,
     async_track_state_change_event,
+    async_track_time_interval,
+)
+from homeassistant.helpers.restore_state import (
+    ExtraStoredData,
+    RestoredExtraData,
+    RestoreEntity,
 )
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
@@ -37,6 +43,8 @@ from homeassistant.util import dt as dt_util
 from . import CommonConfigEntry
 from .const import (
     ATTR_MAIN_MONITOR_LAST_UPDATED,
+    ATTR_MAIN_MONITOR_ON_CALLS,
+    ATTR_MAIN_MONITOR_ON_SUPPRESSED,
     ATTR_MAIN_MONITOR_PAUSE,
     ATTR_MAIN_MONITOR_WAIT_DURATION_LEFT,
     ATTR_MONITOR_ACTIVITY_ENTITY_ID,
@@ -46,14 +54,21 @@ from .const import (
     ATTR_REMOTE_ACTIVITY_FRIENDLY_NAME,
     ATTR_REMOTE_ACTIVITY_LAST_UPDATED,
     ATTR_REMOTE_ACTIVITY_PAUSE,
+    CLOCK_SYNC_INTERVAL,
+    CONF_DURATION_MIN_HOLD,
+    CONF_DURATION_OFF_DELAY,
+    CONF_DURATION_ON_DELAY,
     CONF_DURATION_WAIT_UPDATE,
+    CONF_MAX_FLIPS_PER_HOUR,
     CONF_MONITOR_ENTITY,
     CONF_MONITOR_STATE_CHANGED_TYPE,
     CONF_SAVE_OPTIONS,
     CONF_SECURE,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
-    DOMAIN_NAME,
+    ISSUE_REASON_MISSING_ENTITY,
+    ISSUE_REASON_REST_API,
+    ISSUE_REASON_WEBSOCKET_RECONNECTING,
     LOGGER,
     POSTFIX_MAIN_ON_ENTITY,
     POSTFIX_PAUSE_SWITCH_ENTITY,
@@ -63,8 +78,12 @@ from .const import (
     STATE_BOTH,
     TRANSLATION_KEY,
     TRANSLATION_KEY_MAIN_MISSING_ENTITY,
+    WAIT_MARGIN,
 )
+from .clock_offset import ClockOffset
 from .entity import ComponentEntityMain
+from .hysteresis import Hysteresis
+from .issue_manager import IssueManager
 from .rest_api import CannotConnect, EndpointMissing, InvalidAuth, RestApi
 from .shared import Shared
 from .websocket_api import ConnectionStateType, RemoteWebsocketConnection
@@ -72,7 +91,9 @@ from .websocket_api import ConnectionStateType, RemoteWebsocketConnection
 
 # ------------------------------------------------------
 # ------------------------------------------------------
-class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
+class MainAcitvityMonitorBinarySensor(
+    ComponentEntityMain, BinarySensorEntity, RestoreEntity
+):
     """Binary sensor class for the main activity monitor."""
 
     _unrecorded_attributes = frozenset({MATCH_ALL})
@@ -93,9 +114,12 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
         self.remote_friendly_name: str = ""
         self.remote_entity_id: str = ""
         self.remote_last_updated: datetime = dt_util.now()
+        self.remote_changed: float = monotonic()
+        self.clock_offset: ClockOffset = ClockOffset()
         self.remote_pause: bool = False
 
         self.shared: Shared = entry.runtime_data.shared
+        self.issues: IssueManager = entry.runtime_data.issues
 
         self.remote_binary_sensor_name: str = entry.options.get(CONF_MONITOR_ENTITY)
         self.main_on_binary_sensor_name: str = entry.options.get(
@@ -110,17 +134,20 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
 
         self.main_last_updated: datetime = dt_util.now()
 
-        self.duration_wait_update: timedelta = timedelta()
         self.websocket_subscribe_trigger_retry_count: int = 0
         self.websocket_reconnecting_count: int = 0
-        self.websocket_reconnecting_issue_id: str = ""
-
-        if (duration := entry.options.get(CONF_DURATION_WAIT_UPDATE, None)) is not None:
-            self.duration_wait_update = timedelta(**duration)
 
-        self.monitor_state_changed_type: str = entry.options.get(
-            CONF_MONITOR_STATE_CHANGED_TYPE, STATE_BOTH
-        )
+        self.duration_wait_update: timedelta = timedelta()
+        self.monitor_state_changed_type: str = STATE_BOTH
+        self.hysteresis: Hysteresis = Hysteresis()
+        self.load_options()
+        self.main_on_pending: bool = False
+        self.main_on_calls_count: int = 0
+        self.main_on_suppressed_count: int = 0
+        self.refresh_count: int = 0
+        self.trigger_event_count: int = 0
+        self.trigger_event_skipped_count: int = 0
+        self.websocket_subscription_id: int | None = None
 
         self.coordinator: DataUpdateCoordinator = DataUpdateCoordinator(
             self.hass,
@@ -140,6 +167,7 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
                 self.entry.options.get(CONF_ACCESS_TOKEN),
                 self.entry.options.get(CONF_SECURE),
                 self.entry.options.get(CONF_VERIFY_SSL),
+                self.entry,
             )
         )
 
@@ -150,11 +178,59 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
             {
                 vol.Optional(CONF_DURATION_WAIT_UPDATE): cv.time_period,
                 vol.Optional(CONF_MONITOR_STATE_CHANGED_TYPE): cv.string,
+                vol.Optional(CONF_DURATION_ON_DELAY): vol.Any(None, cv.time_period),
+                vol.Optional(CONF_DURATION_OFF_DELAY): vol.Any(None, cv.time_period),
+                vol.Optional(CONF_DURATION_MIN_HOLD): cv.time_period,
+                vol.Optional(CONF_MAX_FLIPS_PER_HOUR): vol.All(
+                    vol.Coerce(int), vol.Range(min=0)
+                ),
                 vol.Required(CONF_SAVE_OPTIONS): cv.boolean,
             },
             self.async_service_update_main_options,
         )
 
+    # ------------------------------------------------------------------
+    def load_options(self) -> None:
+        """Load options which can change while running."""
+
+        self.duration_wait_update = self.options_timedelta(
+            CONF_DURATION_WAIT_UPDATE
+        ) or timedelta()
+
+        self.monitor_state_changed_type = self.entry.options.get(
+            CONF_MONITOR_STATE_CHANGED_TYPE, STATE_BOTH
+        )
+
+        self.hysteresis.on_delay = (
+            self.options_timedelta(CONF_DURATION_ON_DELAY) or None
+        )
+        self.hysteresis.off_delay = (
+            self.options_timedelta(CONF_DURATION_OFF_DELAY) or None
+        )
+        self.hysteresis.min_hold = self.options_timedelta(
+            CONF_DURATION_MIN_HOLD
+        ) or timedelta()
+        self.hysteresis.max_flips_per_hour = max(
+            self.entry.options.get(CONF_MAX_FLIPS_PER_HOUR, 0), 0
+        )
+
+    # ------------------------------------------------------------------
+    async def async_options_updated(self) -> None:
+        """Apply changed options in place."""
+
+        LOGGER.debug("Options updated, applying without reload")
+        self.load_options()
+        await self.coordinator.async_refresh()
+
+    # ------------------------------------------------------------------
+    def options_timedelta(self, key: str) -> timedelta | None:
+        """Get duration option as timedelta."""
+
+        if (duration := self.entry.options.get(key, None)) is not None:
+            return timedelta(**duration)
+
+        return None
+
     # ------------------------------------------------------------------
     async def async_service_update_main_options(
         self, entity: MainAcitvityMonitorBinarySensor, service_data: ServiceCall
@@ -181,6 +257,22 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
             CONF_DURATION_WAIT_UPDATE, timedelta()
         )
 
+        # 0 or null disables the delay, the wait duration is used instead
+        if CONF_DURATION_ON_DELAY in service_data.data:
+            entity.hysteresis.on_delay = (
+                service_data.data[CONF_DURATION_ON_DELAY] or None
+            )
+        if CONF_DURATION_OFF_DELAY in service_data.data:
+            entity.hysteresis.off_delay = (
+                service_data.data[CONF_DURATION_OFF_DELAY] or None
+            )
+        entity.hysteresis.min_hold = service_data.data.get(
+            CONF_DURATION_MIN_HOLD, entity.hysteresis.min_hold
+        )
+        entity.hysteresis.max_flips_per_hour = service_data.data.get(
+            CONF_MAX_FLIPS_PER_HOUR, entity.hysteresis.max_flips_per_hour
+        )
+
         if service_data.data.get(CONF_SAVE_OPTIONS, False):
             tmp_entry_options: dict[str, Any] = entity.entry.options.copy()
             tmp_entry_options[CONF_MONITOR_STATE_CHANGED_TYPE] = (
@@ -190,6 +282,26 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
                 entity.duration_wait_update
             )
 
+            if entity.hysteresis.on_delay is not None:
+                tmp_entry_options[CONF_DURATION_ON_DELAY] = timedelta_to_dict(
+                    entity.hysteresis.on_delay
+                )
+            else:
+                tmp_entry_options.pop(CONF_DURATION_ON_DELAY, None)
+
+            if entity.hysteresis.off_delay is not None:
+                tmp_entry_options[CONF_DURATION_OFF_DELAY] = timedelta_to_dict(
+                    entity.hysteresis.off_delay
+                )
+            else:
+                tmp_entry_options.pop(CONF_DURATION_OFF_DELAY, None)
+            tmp_entry_options[CONF_DURATION_MIN_HOLD] = timedelta_to_dict(
+                entity.hysteresis.min_hold
+            )
+            tmp_entry_options[CONF_MAX_FLIPS_PER_HOUR] = (
+                entity.hysteresis.max_flips_per_hour
+            )
+
             entity.update_settings(tmp_entry_options)
 
         await entity.coordinator.async_refresh()
@@ -216,54 +328,69 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
         return remote_state
 
     # ------------------------------------------------------
-    async def check_set_state(self, is_state: bool | None = None) -> None:
-        """Check and set state."""
+    def wait_delay(self, remote_state_on: bool) -> timedelta:
+        """Get the delay before the main state follows the remote state."""
 
-        if self.remote_state_on is is_state or is_state is None:
-            if self.duration_wait_update.total_seconds() == 0 or (
-                self.duration_wait_update.total_seconds() > 0
-                and dt_util.now()
-                >= (self.remote_last_updated + self.duration_wait_update)
-            ):
-                LOGGER.debug("Setting main state")
-                self.main_state_on = self.map_remote_state_for_changed_type(
-                    self.remote_state_on
-                )
-                self.main_last_updated = dt_util.now()
-                self.coordinator.update_interval = timedelta(
-                    seconds=DEFAULT_UPDATE_INTERVAL
-                )
+        if (delay := self.hysteresis.delay(remote_state_on)) is not None:
+            return delay
 
-                await self.async_websocket_update_main_on()
-            else:  # The state is correct, but the wait duration is not yet expired
-                LOGGER.debug("The state is correct, set wait duration")
+        if self.monitor_state_changed_type in (
+            STATE_BOTH,
+            STATE_ON if remote_state_on else STATE_OFF,
+        ):
+            return self.duration_wait_update
 
-                wait_duration: timedelta = (
-                    self.duration_wait_update + timedelta(seconds=1)
-                ) - (dt_util.now() - self.remote_last_updated)
+        return timedelta()
 
-                if wait_duration.total_seconds() > 0:
-                    self.coordinator.update_interval = wait_duration
-                else:  # To low, use default
-                    self.coordinator.update_interval = timedelta(
-                        seconds=DEFAULT_UPDATE_INTERVAL
-                    )
+    # ------------------------------------------------------
+    async def check_set_state(self) -> None:
+        """Check and set state."""
 
-        else:  # The state is not correct
-            LOGGER.debug("The state is not correct, reset wait duration to default")
-            self.coordinator.update_interval = timedelta(
-                seconds=DEFAULT_UPDATE_INTERVAL
-            )
+        now: float = monotonic()
+
+        wait_duration: timedelta = self.hysteresis.remaining_wait(
+            self.wait_delay(self.remote_state_on), self.remote_changed, now
+        )
+
+        if wait_duration.total_seconds() <= 0:
+            LOGGER.debug("Setting main state")
+            self.main_on_pending = False
             self.main_state_on = self.map_remote_state_for_changed_type(
                 self.remote_state_on
             )
             self.main_last_updated = dt_util.now()
+            self.hysteresis.register_flip(now)
+            self.coordinator.update_interval = timedelta(
+                seconds=DEFAULT_UPDATE_INTERVAL
+            )
+
             await self.async_websocket_update_main_on()
+        else:  # The wait duration, hold time or flip rate is not yet expired
+            LOGGER.debug("The state is correct, set wait duration")
+            self.main_on_pending = True
+            self.coordinator.update_interval = wait_duration + timedelta(
+                seconds=WAIT_MARGIN
+            )
+
+    # ------------------------------------------------------
+    def set_remote_last_updated(self, remote_last_updated: datetime) -> None:
+        """Set remote last updated and anchor it on local monotonic time.
+
+        The age of the remote change is measured in remote time using the
+        estimated clock offset, so waits are not affected by clock skew.
+        """
+
+        self.remote_last_updated = dt_util.as_local(remote_last_updated)
+        self.remote_changed = monotonic() - max(
+            self.clock_offset.remote_age(remote_last_updated, dt_util.utcnow()), 0.0
+        )
 
     # ------------------------------------------------------
     async def async_refresh(self) -> None:
         """Refresh."""
 
+        self.refresh_count += 1
+
         if self.main_pause or self.remote_pause:
             self.main_state_on = False
             self.async_write_ha_state()
@@ -273,15 +400,16 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
             self.remote_state_on
         ):  # No need to update
             LOGGER.debug("No need to update, set wait duration to default")
+
+            if self.main_on_pending:  # The remote flipped back while waiting
+                self.main_on_pending = False
+                self.main_on_suppressed_count += 1
             self.coordinator.update_interval = timedelta(
                 seconds=DEFAULT_UPDATE_INTERVAL
             )
             return
 
-        if self.monitor_state_changed_type == STATE_BOTH:
-            await self.check_set_state()
-        else:
-            await self.check_set_state(self.monitor_state_changed_type == STATE_ON)
+        await self.check_set_state()
 
     # ------------------------------------------------------
     async def async_will_remove_from_hass(self) -> None:
@@ -306,6 +434,8 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
     async def async_added_to_hass(self) -> None:
         """Complete device setup after being added to hass."""
 
+        await self.async_restore_last_data()
+
         await self.coordinator.async_config_entry_first_refresh()
 
         self.async_on_remove(
@@ -322,10 +452,120 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
 
         self.async_on_remove(start.async_at_started(self.hass, self.hass_started))
 
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self.async_websocket_clock_sync,
+                timedelta(seconds=CLOCK_SYNC_INTERVAL),
+            )
+        )
+
+        self.shared.options_listeners.append(self.async_options_updated)
+        self.async_on_remove(
+            lambda: self.shared.options_listeners.remove(self.async_options_updated)
+        )
+
+        self.shared.diagnostics[self.entity_id] = self.diagnostics
+        self.async_on_remove(
+            lambda: self.shared.diagnostics.pop(self.entity_id, None)
+        )
+
+    # ------------------------------------------------------
+    def diagnostics(self) -> dict[str, Any]:
+        """Entity internals and hot path counters for diagnostics."""
+
+        return {
+            "remote_entity": self.remote_binary_sensor_name,
+            "remote_state_on": self.remote_state_on,
+            "remote_last_updated": self.remote_last_updated.isoformat(),
+            "remote_pause": self.remote_pause,
+            "main_state_on": self.main_state_on,
+            "main_last_updated": self.main_last_updated.isoformat(),
+            "main_pause": self.main_pause,
+            "main_on_pending": self.main_on_pending,
+            "update_interval": str(self.coordinator.update_interval),
+            "duration_wait_update": str(self.duration_wait_update),
+            "monitor_state_changed_type": self.monitor_state_changed_type,
+            "hysteresis": {
+                "on_delay": str(self.hysteresis.on_delay),
+                "off_delay": str(self.hysteresis.off_delay),
+                "min_hold": str(self.hysteresis.min_hold),
+                "max_flips_per_hour": self.hysteresis.max_flips_per_hour,
+                "flips_last_hour": len(self.hysteresis.flips),
+            },
+            "refresh_count": self.refresh_count,
+            "trigger_event_count": self.trigger_event_count,
+            "trigger_event_skipped_count": self.trigger_event_skipped_count,
+            "main_on_calls_count": self.main_on_calls_count,
+            "main_on_suppressed_count": self.main_on_suppressed_count,
+            "websocket_reconnecting_count": self.websocket_reconnecting_count,
+            "websocket_subscribe_trigger_retry_count": (
+                self.websocket_subscribe_trigger_retry_count
+            ),
+            "websocket_subscription_id": self.websocket_subscription_id,
+            "clock_offset": self.clock_offset.offset,
+            "clock_offset_rtt": self.clock_offset.rtt,
+            "websocket": self.websocket_connection.diagnostics(),
+        }
+
+    # ------------------------------------------------------
+    async def async_restore_last_data(self) -> None:
+        """Restore last known state, the network refresh reconciles it later."""
+
+        if (last_extra_data := await self.async_get_last_extra_data()) is None:
+            return
+
+        data: dict[str, Any] = last_extra_data.as_dict()
+
+        try:
+            self.remote_state_on = data["remote_state_on"]
+            self.remote_entity_id = data["remote_entity_id"]
+            self.remote_friendly_name = data["remote_friendly_name"]
+            self.set_remote_last_updated(
+                datetime.fromisoformat(data["remote_last_updated"])
+            )
+            self.remote_pause = data["remote_pause"]
+            self.main_state_on = data["main_state_on"]
+            self.main_last_updated = dt_util.as_local(
+                datetime.fromisoformat(data["main_last_updated"])
+            )
+            self.main_pause = data["main_pause"]
+        except (KeyError, TypeError, ValueError):
+            LOGGER.debug("Unable to restore last state for %s", self.entity_id)
+
+    # ------------------------------------------------------
+    @property
+    def extra_restore_state_data(self) -> ExtraStoredData:
+        """Return entity specific state data to be restored."""
+
+        return RestoredExtraData(
+            {
+                "remote_state_on": self.remote_state_on,
+                "remote_entity_id": self.remote_entity_id,
+                "remote_friendly_name": self.remote_friendly_name,
+                "remote_last_updated": self.remote_last_updated.isoformat(),
+                "remote_pause": self.remote_pause,
+                "main_state_on": self.main_state_on,
+                "main_last_updated": self.main_last_updated.isoformat(),
+                "main_pause": self.main_pause,
+            }
+        )
+
     # ------------------------------------------------------
     async def hass_started(self, _event: Event) -> None:
         """Hass started."""
 
+        # Owned by the entry, so REST retries are cancelled on unload
+        self.entry.async_create_background_task(
+            self.hass,
+            self.async_start_remote_connection(),
+            f"remote_activity_monitor start {self.entity_id}",
+        )
+
+    # ------------------------------------------------------
+    async def async_start_remote_connection(self) -> None:
+        """Bootstrap remote state via rest api and connect the websocket."""
+
         if await self.async_restapi_service_get_remote_entity():
             await self.websocket_connection.async_connect(
                 self.async_websocket_on_connected,
@@ -350,6 +590,13 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
             LOGGER.debug("Not connected, not updating main on switch")
             return
 
+        self.main_on_calls_count += 1
+        LOGGER.debug(
+            "Main on switch calls: %d, suppressed flips: %d",
+            self.main_on_calls_count,
+            self.main_on_suppressed_count,
+        )
+
         await self.websocket_connection.async_call(
             self.async_websocket_service_call_response,
             "call_service",
@@ -372,19 +619,29 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
         try:
             remote_entyties: list = None
 
-            remote_entyties: list = (
-                await RestApi().async_post_service(
-                    self.hass,
-                    self.entry.options.get(CONF_HOST),
-                    self.entry.options.get(CONF_PORT),
-                    self.entry.options.get(CONF_ACCESS_TOKEN),
-                    self.entry.options.get(CONF_SECURE),
-                    self.entry.options.get(CONF_VERIFY_SSL),
-                    DOMAIN,
-                    SERVICE_GET_REMOTE_ENTITIES,
-                    True,
+            sent: float = monotonic()
+            response: dict = await RestApi(
+                self.entry.runtime_data.stop_event
+            ).async_post_service(
+                self.hass,
+                self.entry.options.get(CONF_HOST),
+                self.entry.options.get(CONF_PORT),
+                self.entry.options.get(CONF_ACCESS_TOKEN),
+                self.entry.options.get(CONF_SECURE),
+                self.entry.options.get(CONF_VERIFY_SSL),
+                DOMAIN,
+                SERVICE_GET_REMOTE_ENTITIES,
+                True,
+            )
+            remote_entyties: list = response["remotes"]
+
+            # First clock sample, so the bootstrap is anchored with an offset
+            if (utc_now := response.get("utc_now")) is not None:
+                self.clock_offset.add_sample(
+                    monotonic() - sent,
+                    dt_util.utcnow(),
+                    datetime.fromisoformat(utc_now),
                 )
-            )["remotes"]
 
         except (
             # BadResponse,
@@ -400,28 +657,37 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
             LOGGER.error("Error connecting to restapi to get remote entities", err)
             last_err = str(CannotConnect)  # "cannot_connect"
 
+        # Retries were stopped by the entry unload, nothing to report
+        if self.entry.runtime_data.stop_event.is_set():
+            return False
+
         if last_err != "":
-            await self.async_create_issue_entity(
+            self.async_create_issue_entity(
+                ISSUE_REASON_REST_API,
                 self.remote_binary_sensor_name,
                 "main_" + last_err,
             )
 
             return False
 
+        self.issues.async_delete_issue(ISSUE_REASON_REST_API)
+
         for remote_entity in remote_entyties:
             if remote_entity["entity_id"] == self.remote_binary_sensor_name:
                 self.remote_state_on = remote_entity["state"] == STATE_ON
                 self.remote_entity_id = remote_entity["entity_id"]
                 self.remote_friendly_name = remote_entity["name"]
-                self.remote_last_updated = dt_util.as_local(
+                self.set_remote_last_updated(
                     datetime.fromisoformat(remote_entity["last_updated"])
                 )
 
+                self.issues.async_delete_issue(ISSUE_REASON_MISSING_ENTITY)
                 await self.coordinator.async_refresh()
                 return True
 
         # No hit on entiy, create an issue
-        await self.async_create_issue_entity(
+        self.async_create_issue_entity(
+            ISSUE_REASON_MISSING_ENTITY,
             self.remote_binary_sensor_name,
             TRANSLATION_KEY_MAIN_MISSING_ENTITY,
         )
@@ -440,26 +706,21 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
             case ConnectionStateType.STATE_RECONNECTING:
                 self.websocket_reconnecting_count += 1
 
-                if (
-                    self.websocket_reconnecting_count >= 60  # Wait 10 minutes
-                    and self.websocket_reconnecting_issue_id == ""
-                ):
-                    self.websocket_reconnecting_issue_id = (
-                        await self.async_create_issue(
-                            "main_websocket_reconnecting",
-                            {
-                                "entity": self.remote_binary_sensor_name,
-                                "integration": self.entity_id,
-                                "url": url,
-                            },
-                        )
+                if self.websocket_reconnecting_count >= 60:  # Wait 10 minutes
+                    self.issues.async_create_issue(
+                        ISSUE_REASON_WEBSOCKET_RECONNECTING,
+                        "main_websocket_reconnecting",
+                        {
+                            "entity": self.remote_binary_sensor_name,
+                            "integration": self.entity_id,
+                            "url": url,
+                        },
                     )
 
             case ConnectionStateType.STATE_CONNECTED:
-                if self.websocket_reconnecting_issue_id != "":
-                    await self.async_delete_issue(self.websocket_reconnecting_issue_id)
+                if self.websocket_reconnecting_count > 0:
+                    self.issues.async_delete_issue(ISSUE_REASON_WEBSOCKET_RECONNECTING)
                 self.websocket_reconnecting_count = 0
-                self.websocket_reconnecting_issue_id = ""
 
     # ------------------------------------------------------------------
     async def async_websocket_on_connected(self) -> None:
@@ -471,18 +732,69 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
 
         LOGGER.debug("Host connection established, subscribing to trigger")
 
+        await self.async_websocket_clock_sync()
+
         self.websocket_subscribe_trigger_retry_count = 0
         await self.async_websocket_subscribe_trigger_event()
 
         await self.async_websocket_update_main_on()
 
+    # ------------------------------------------------------------------
+    async def async_websocket_clock_sync(self, _now: datetime | None = None) -> None:
+        """Estimate the remote clock offset from a round trip timed service call."""
+
+        if (
+            self.websocket_connection.connection_state
+            != ConnectionStateType.STATE_CONNECTED
+        ):
+            return
+
+        sent: float = monotonic()
+
+        # ------------------------------------------------------------------
+        def handle_response(message: dict) -> None:
+            """Handle the service call response."""
+
+            rtt: float = monotonic() - sent
+            self.websocket_connection.remove_handler(message["id"])
+
+            if message.get("success") is not True:
+                return
+
+            response: dict = message["result"].get("response") or {}
+
+            if (utc_now := response.get("utc_now")) is None:
+                return  # Remote is an older version without clock info
+
+            offset: float = self.clock_offset.offset
+            self.clock_offset.add_sample(
+                rtt, dt_util.utcnow(), datetime.fromisoformat(utc_now)
+            )
+
+            # Re-anchor the remote change on the better offset estimate
+            if self.clock_offset.offset != offset:
+                self.set_remote_last_updated(self.remote_last_updated)
+            LOGGER.debug(
+                "Remote clock offset %.3f s, rtt %.3f s",
+                self.clock_offset.offset,
+                self.clock_offset.rtt,
+            )
+
+        await self.websocket_connection.async_call(
+            handle_response,
+            "call_service",
+            domain=DOMAIN,
+            service=SERVICE_GET_REMOTE_ENTITIES,
+            return_response=True,
+        )
+
     # ------------------------------------------------------------------
     async def async_websocket_subscribe_trigger_event(self) -> None:
         """Subscribe to trigger event."""
 
         await asyncio.sleep(5)
 
-        await self.websocket_connection.async_call(
+        self.websocket_subscription_id = await self.websocket_connection.async_call(
             self.async_websocket_handle_trigger_event_message,
             "subscribe_trigger",
             trigger={
@@ -512,6 +824,7 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
                         )
 
             case "event":
+                self.trigger_event_count += 1
                 to_state: dict = message["event"]["variables"]["trigger"]["to_state"]
 
                 if to_state[ATTR_ENTITY_ID] == self.remote_binary_sensor_name:
@@ -525,9 +838,27 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
         self,
         to_state: dict,
     ) -> None:
-        """Handle trigger binary sensor."""
+        """Handle trigger binary sensor.
+
+        Attribute only changes, like the published activity rate, don't
+        change what the main monitor evaluates and are skipped.
+        """
 
         to_remote_state_on: bool = to_state["state"] == "on"
+        to_last_updated: datetime = datetime.fromisoformat(
+            to_state["attributes"][ATTR_MONITOR_ACTIVITY_LAST_UPDATED]
+        )
+
+        if (
+            to_remote_state_on == self.remote_state_on
+            and to_last_updated == self.remote_last_updated
+            and to_state["attributes"][ATTR_MONITOR_ACTIVITY_ENTITY_ID]
+            == self.remote_entity_id
+            and to_state["attributes"][ATTR_MONITOR_ACTIVITY_FRIENDLY_NAME]
+            == self.remote_friendly_name
+        ):
+            self.trigger_event_skipped_count += 1
+            return
 
         # Wait duration is not yet expired for the last event, should we reset the state
         if (
@@ -544,11 +875,7 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
         self.remote_friendly_name = to_state["attributes"][
             ATTR_MONITOR_ACTIVITY_FRIENDLY_NAME
         ]
-        self.remote_last_updated = dt_util.as_local(
-            datetime.fromisoformat(
-                to_state["attributes"][ATTR_MONITOR_ACTIVITY_LAST_UPDATED]
-            )
-        )
+        self.set_remote_last_updated(to_last_updated)
 
         await self.coordinator.async_refresh()
 
@@ -561,12 +888,14 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
         await self.coordinator.async_refresh()
 
     # ------------------------------------------------------------------
-    async def async_create_issue_entity(
-        self, entity_id: str, translation_key: str
+    @callback
+    def async_create_issue_entity(
+        self, reason: str, entity_id: str, translation_key: str
     ) -> str:
         """Create issue on entity."""
 
-        return await self.async_create_issue(
+        return self.issues.async_create_issue(
+            reason,
             translation_key,
             {
                 "entity": entity_id,
@@ -574,33 +903,6 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
             },
         )
 
-    # ------------------------------------------------------------------
-    async def async_create_issue(
-        self, translation_key: str, translation_placeholders: dict | None = None
-    ) -> str:
-        """Create issue."""
-
-        tmp_issue_id: str = DOMAIN_NAME + datetime.now().isoformat()
-
-        ir.async_create_issue(
-            self.hass,
-            DOMAIN,
-            tmp_issue_id,
-            issue_domain=DOMAIN,
-            is_fixable=False,
-            severity=ir.IssueSeverity.WARNING,
-            translation_key=translation_key,
-            translation_placeholders=translation_placeholders,
-        )
-
-        return tmp_issue_id
-
-    # ------------------------------------------------------------------
-    async def async_delete_issue(self, issue_id: str) -> None:
-        """Delete issue."""
-
-        ir.async_delete_issue(self.hass, DOMAIN, DOMAIN_NAME + issue_id)
-
     # ------------------------------------------------------
     @property
     def name(self) -> str:
@@ -655,19 +957,22 @@ class MainAcitvityMonitorBinarySensor(ComponentEntityMain, BinarySensorEntity):
             ATTR_REMOTE_ACTIVITY_PAUSE: self.remote_pause,
             ATTR_MAIN_MONITOR_LAST_UPDATED: self.main_last_updated,
             ATTR_MAIN_MONITOR_PAUSE: self.main_pause,
+            # Cross instance calls sent and remote flips absorbed by the hysteresis
+            ATTR_MAIN_MONITOR_ON_CALLS: self.main_on_calls_count,
+            ATTR_MAIN_MONITOR_ON_SUPPRESSED: self.main_on_suppressed_count,
         }
 
         tmp_duration = (
-            self.duration_wait_update + self.remote_last_updated - dt_util.now()
+            self.hysteresis.remaining_wait(
+                self.wait_delay(self.remote_state_on),
+                self.remote_changed,
+                monotonic(),
+            )
+            if self.main_on_pending
+            else timedelta()
         )
         tmp_duration = tmp_duration - timedelta(microseconds=tmp_duration.microseconds)
 
-        if (
-            tmp_duration.total_seconds() < 0
-            or self.duration_wait_update.total_seconds() == 0
-        ):
-            tmp_duration = timedelta()
-
         attr[ATTR_MAIN_MONITOR_WAIT_DURATION_LEFT] = str(tmp_duration)
 
         return attr
@@ -5,9 +5,11 @@ from __future__ import annotations
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.const import STATE_ON
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import EntityPlatform
+from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from . import CommonConfigEntry
@@ -24,7 +26,7 @@ from .entity import ComponentEntityRemote
 # ------------------------------------------------------
 # ------------------------------------------------------
 class RemoteAcitvityMonitorMainOnBinarySensor(
-    ComponentEntityRemote, BinarySensorEntity
+    ComponentEntityRemote, BinarySensorEntity, RestoreEntity
 ):
     """Binary sensor class for Remote activity monitor."""
 
@@ -69,6 +71,15 @@ class RemoteAcitvityMonitorMainOnBinarySensor(
         entity.main_on = service_data.data.get(SERVICE_MAIN_ON_SWITCH, False)
         entity.async_write_ha_state()
 
+    # ------------------------------------------------------
+    async def async_added_to_hass(self) -> None:
+        """Restore last state, the main updates it when connected."""
+
+        await super().async_added_to_hass()
+
+        if (last_state := await self.async_get_last_state()) is not None:
+            self.main_on = last_state.state == STATE_ON
+
     # ------------------------------------------------------
     async def async_refresh(self) -> None:
         """Refresh dummy."""
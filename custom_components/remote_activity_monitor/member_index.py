@@ -0,0 +1,177 @@
+"""Monitored entities resolved from an entity list and registry selectors."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from .const import (
+    CONF_AREAS,
+    CONF_DEVICE_CLASSES,
+    CONF_DOMAINS,
+    CONF_LABELS,
+    DEFAULT_MONITOR_DOMAINS,
+)
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class MemberSelectors:
+    """Selectors, all given kinds must match and one value within a kind."""
+
+    areas: frozenset[str] = frozenset()
+    labels: frozenset[str] = frozenset()
+    domains: frozenset[str] = frozenset()
+    device_classes: frozenset[str] = frozenset()
+
+    # ------------------------------------------------------
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> MemberSelectors:
+        """Selectors from entry options."""
+
+        return cls(
+            frozenset(options.get(CONF_AREAS, [])),
+            frozenset(options.get(CONF_LABELS, [])),
+            frozenset(options.get(CONF_DOMAINS, [])),
+            frozenset(options.get(CONF_DEVICE_CLASSES, [])),
+        )
+
+    # ------------------------------------------------------
+    @property
+    def active(self) -> bool:
+        """If any selector is given."""
+
+        return (
+            len(self.areas) > 0
+            or len(self.labels) > 0
+            or len(self.domains) > 0
+            or len(self.device_classes) > 0
+        )
+
+    # ------------------------------------------------------
+    @property
+    def uses_device(self) -> bool:
+        """If membership depends on device area or labels."""
+
+        return len(self.areas) > 0 or len(self.labels) > 0
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class MemberIndex:
+    """Precomputed set of monitored entities.
+
+    The explicit entity list is always monitored. Entities matching the
+    selectors are resolved once from the registries and kept up to date one
+    entity or device at a time from registry updates.
+    """
+
+    # ------------------------------------------------------
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity_ids: list[str],
+        selectors: MemberSelectors,
+    ) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.entity_ids: list[str] = entity_ids
+        self.selectors: MemberSelectors = selectors
+        self.matched: set[str] = set()
+
+        if selectors.active:
+            self.matched = {
+                entry.entity_id
+                for entry in er.async_get(hass).entities.values()
+                if self.matches(entry)
+            }
+
+    # ------------------------------------------------------
+    @property
+    def members(self) -> list[str]:
+        """Monitored entity ids, the entity list first."""
+
+        return [
+            *self.entity_ids,
+            *sorted(self.matched.difference(self.entity_ids)),
+        ]
+
+    # ------------------------------------------------------
+    def matches(self, entry: er.RegistryEntry) -> bool:
+        """If the registry entry matches the selectors."""
+
+        selectors: MemberSelectors = self.selectors
+
+        if entry.disabled_by is not None:
+            return False
+
+        if entry.domain not in (selectors.domains or DEFAULT_MONITOR_DOMAINS):
+            return False
+
+        if len(selectors.device_classes) > 0 and (
+            entry.device_class or entry.original_device_class
+        ) not in selectors.device_classes:
+            return False
+
+        if not selectors.uses_device:
+            return True
+
+        device: dr.DeviceEntry | None = (
+            dr.async_get(self.hass).async_get(entry.device_id)
+            if entry.device_id is not None
+            else None
+        )
+
+        if len(selectors.areas) > 0 and (
+            entry.area_id or (device.area_id if device is not None else None)
+        ) not in selectors.areas:
+            return False
+
+        if len(selectors.labels) > 0 and selectors.labels.isdisjoint(
+            entry.labels | (device.labels if device is not None else set())
+        ):
+            return False
+
+        return True
+
+    # ------------------------------------------------------
+    def update_entity(self, entity_id: str, old_entity_id: str | None = None) -> None:
+        """Reevaluate one entity after a registry change."""
+
+        if old_entity_id is not None:
+            self.matched.discard(old_entity_id)
+            self.entity_ids = [
+                entity_id if entity == old_entity_id else entity
+                for entity in self.entity_ids
+            ]
+
+        if not self.selectors.active:
+            return
+
+        entry: er.RegistryEntry | None = er.async_get(self.hass).async_get(entity_id)
+
+        if entry is not None and self.matches(entry):
+            self.matched.add(entity_id)
+        else:
+            self.matched.discard(entity_id)
+
+    # ------------------------------------------------------
+    def update_device(self, device_id: str) -> None:
+        """Reevaluate the entities of a device after a registry change."""
+
+        if not self.selectors.uses_device:
+            return
+
+        for entry in er.async_entries_for_device(
+            er.async_get(self.hass), device_id, include_disabled_entities=True
+        ):
+            if self.matches(entry):
+                self.matched.add(entry.entity_id)
+            else:
+                self.matched.discard(entry.entity_id)
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
+from time import monotonic, time
+from typing import Any
+
+import voluptuous as vol
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import MATCH_ALL, STATE_OFF, STATE_ON
+from homeassistant.const import ATTR_ENTITY_ID, MATCH_ALL, STATE_OFF, STATE_ON
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Event,
     HomeAssistant,
     ServiceCall,
@@ -16,34 +21,67 @@ from homeassistant.core import (
     SupportsResponse,
     callback,
 )
-from homeassistant.helpers import entity_registry as er, issue_registry as ir, start
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_platform,
+    entity_registry as er,
+    start,
+)
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.event import (
     EventStateChangedData,
+    async_call_later,
     async_track_state_change_event,
+    async_track_time_interval,
 )
 from homeassistant.helpers.instance_id import async_get as async_get_instance_id
+from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
+from .activity_history import ActivityHistory, history_path
+from .activity_rate import ActivityRate
+from .aggregator import ActivityAggregator
 from .const import (
+    ATTR_ACTIVITY_DUTY_CYCLE,
+    ATTR_ACTIVITY_EVENTS,
+    ATTR_ACTIVITY_WINDOW,
+    ATTR_DURATION,
+    ATTR_END_TIME,
     ATTR_MONITOR_ACTIVITY_ENTITY_ID,
     ATTR_MONITOR_ACTIVITY_FRIENDLY_NAME,
     ATTR_MONITOR_ACTIVITY_LAST_UPDATED,
-    CONF_ALL_ENTITIES_ON,
+    ATTR_START_TIME,
+    CONF_DURATION_RATE_WINDOW,
     CONF_ENTITY_IDS,
+    CONF_RATE_UPDATE_INTERVAL,
+    DEFAULT_HISTORY_DURATION,
+    DEFAULT_RATE_UPDATE_INTERVAL,
+    DEFAULT_RATE_WINDOW,
     DOMAIN,
-    DOMAIN_NAME,
+    HISTORY_CAPACITY,
+    HISTORY_RETENTION_DAYS,
+    ISSUE_REASON_MISSING_ENTITY,
     LOGGER,
+    RATE_BUCKETS,
+    SERVICE_GET_ACTIVITY_HISTORY,
     SERVICE_GET_REMOTE_ENTITIES,
     TRANSLATION_KEY,
     TRANSLATION_KEY_REMOTE_MISSING_ENTITY,
 )
 from .entity import ComponentEntityRemote
+from .issue_manager import IssueManager
+from .member_index import MemberIndex, MemberSelectors
+from .shared import Shared
 
 
 # ------------------------------------------------------
 # ------------------------------------------------------
-class RemoteAcitvityMonitorBinarySensor(ComponentEntityRemote, BinarySensorEntity):
+class RemoteAcitvityMonitorBinarySensor(
+    ComponentEntityRemote, BinarySensorEntity, RestoreEntity
+):
     """Binary sensor class for Remote activity monitor."""
 
     class_entity_list: list[RemoteAcitvityMonitorBinarySensor] = []
@@ -60,6 +98,8 @@ class RemoteAcitvityMonitorBinarySensor(ComponentEntityRemote, BinarySensorEntit
 
         self.entry: ConfigEntry = entry
         self.hass = hass
+        self.issues: IssueManager = entry.runtime_data.issues
+        self.shared: Shared = entry.runtime_data.shared
 
         self.coordinator: DataUpdateCoordinator = DataUpdateCoordinator(
             self.hass,
@@ -76,10 +116,30 @@ class RemoteAcitvityMonitorBinarySensor(ComponentEntityRemote, BinarySensorEntit
         self.remote_friendly_name: str = ""
         self.remote_entity_id: str = ""
         self.remote_last_updated: datetime = dt_util.now()
+        self.state_event_count: int = 0
+        self.evaluation_count: int = 0
+
+        self.member_index: MemberIndex = self.create_member_index()
+        self.monitor_activity_entities: list[str] = self.member_index.members
+        self.unsub_state_listener: CALLBACK_TYPE | None = None
+        self.aggregator: ActivityAggregator = ActivityAggregator()
+        self.aggregator.configure(entry.options)
+        self.unsub_recent_expiry: CALLBACK_TYPE | None = None
+        self.registry_event_count: int = 0
+        # Restored state is kept until the members are reconciled when hass is started
+        self.aggregate_ready: bool = False
+
+        self.rate_options: tuple[float, float] = self.get_rate_options()
+        self.activity_rate: ActivityRate = ActivityRate(
+            self.rate_options[0], RATE_BUCKETS, monotonic()
+        )
+        self.rate_attributes: dict[str, Any] = {}
+        self.unsub_rate_interval: CALLBACK_TYPE | None = None
 
-        registry = er.async_get(hass)
-        self.monitor_activity_entities: list[str] = er.async_validate_entity_ids(
-            registry, entry.options[CONF_ENTITY_IDS]
+        self.history: ActivityHistory = ActivityHistory(
+            history_path(hass, entry.entry_id),
+            HISTORY_CAPACITY,
+            timedelta(days=HISTORY_RETENTION_DAYS).total_seconds(),
         )
 
         self.hass.services.async_register(
@@ -89,6 +149,79 @@ class RemoteAcitvityMonitorBinarySensor(ComponentEntityRemote, BinarySensorEntit
             supports_response=SupportsResponse.ONLY,
         )
 
+        self.platform: EntityPlatform = entity_platform.async_get_current_platform()
+
+        self.platform.async_register_entity_service(
+            SERVICE_GET_ACTIVITY_HISTORY,
+            {
+                vol.Optional(ATTR_START_TIME): cv.datetime,
+                vol.Optional(ATTR_END_TIME): cv.datetime,
+                vol.Optional(ATTR_DURATION): cv.time_period,
+            },
+            self.async_service_get_activity_history,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+    # ------------------------------------------------------------------
+    async def async_service_get_activity_history(
+        self, entity: RemoteAcitvityMonitorBinarySensor, service_data: ServiceCall
+    ) -> ServiceResponse:
+        """Get transitions and duty cycle within a time range from the history."""
+
+        def as_utc(value: datetime) -> datetime:
+            """Naive datetimes are local time."""
+
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=dt_util.get_default_time_zone())
+
+            return dt_util.as_utc(value)
+
+        if not isinstance(entity, RemoteAcitvityMonitorBinarySensor):
+            raise ServiceValidationError(
+                f"{entity.entity_id} is not a remote activity monitor"
+            )
+
+        now: datetime = dt_util.utcnow()
+        end: datetime = min(as_utc(service_data.data.get(ATTR_END_TIME, now)), now)
+        start: datetime = (
+            as_utc(service_data.data[ATTR_START_TIME])
+            if ATTR_START_TIME in service_data.data
+            else end
+            - service_data.data.get(
+                ATTR_DURATION, timedelta(hours=DEFAULT_HISTORY_DURATION)
+            )
+        )
+        start_timestamp: float = start.timestamp()
+        end_timestamp: float = max(end.timestamp(), start_timestamp)
+        state_at_start: bool | None = entity.history.state_at(start_timestamp)
+
+        return {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "state_at_start": (
+                None
+                if state_at_start is None
+                else STATE_ON
+                if state_at_start
+                else STATE_OFF
+            ),
+            "on_duration": round(
+                entity.history.on_duration(start_timestamp, end_timestamp), 1
+            ),
+            "duty_cycle": round(
+                entity.history.duty_cycle(start_timestamp, end_timestamp), 4
+            ),
+            "transitions": [
+                {
+                    "time": dt_util.utc_from_timestamp(timestamp).isoformat(),
+                    "state": STATE_ON if is_on else STATE_OFF,
+                }
+                for timestamp, is_on in entity.history.transitions(
+                    start_timestamp, end_timestamp
+                )
+            ],
+        }
+
     # ------------------------------------------------------------------
     async def async_get_remote_entities(self, call: ServiceCall) -> ServiceResponse:
         """Get active remote entities."""
@@ -109,13 +242,17 @@ class RemoteAcitvityMonitorBinarySensor(ComponentEntityRemote, BinarySensorEntit
                     }
                 )
 
-        return {"remotes": remotes}
+        return {"remotes": remotes, "utc_now": dt_util.utcnow().isoformat()}
 
     # ------------------------------------------------------
     async def async_will_remove_from_hass(self) -> None:
         """When removed from hass."""
 
         RemoteAcitvityMonitorBinarySensor.class_entity_list.remove(self)
+        await self.hass.async_add_executor_job(self.history.close)
+
+        if len(RemoteAcitvityMonitorBinarySensor.class_entity_list) == 0:
+            self.hass.services.async_remove(DOMAIN, SERVICE_GET_REMOTE_ENTITIES)
 
     # ------------------------------------------------------
     @callback
@@ -125,49 +262,259 @@ class RemoteAcitvityMonitorBinarySensor(ComponentEntityRemote, BinarySensorEntit
     ) -> None:
         """Handle state changes on the observed device."""
 
-        if event.data["new_state"] is None:
-            return
+        self.state_event_count += 1
+        entity_id: str = event.data["entity_id"]
+        old_state: State | None = event.data["old_state"]
+        new_state: State | None = event.data["new_state"]
 
-        await self.check_entities_state()
+        if (
+            old_state is not None
+            and old_state.state != STATE_ON
+            and new_state is not None
+            and new_state.state == STATE_ON
+        ):
+            self.activity_rate.add_event(monotonic())
+
+        if self.aggregator.update(entity_id, new_state) and new_state is not None:
+            self.issues.async_delete_issue(f"{ISSUE_REASON_MISSING_ENTITY}_{entity_id}")
+
+        self.evaluation_count += 1
+        self.apply_aggregated_state()
 
         await self.coordinator.async_refresh()
 
     # ------------------------------------------------------
     async def check_entities_state(self) -> None:
-        """Check entities state."""
+        """Check entities state, rebuilds the aggregated state."""
+
+        self.evaluation_count += 1
+        self.aggregator.configure(self.entry.options)
+        self.aggregator.set_members(
+            {
+                entity: self.hass.states.get(entity)
+                for entity in self.monitor_activity_entities
+            }
+        )
+        self.aggregate_ready = True
+        self.apply_aggregated_state()
 
-        last_updated_timestamp: float = 0.0
-        last_updated: datetime = dt_util.now()
-        entity_name: str = ""
-        entity_id: str = ""
+    # ------------------------------------------------------
+    @callback
+    def apply_aggregated_state(self) -> None:
+        """Set remote state from the aggregated state."""
 
-        self.remote_state = self.entry.options.get(CONF_ALL_ENTITIES_ON, False) is True
+        if not self.aggregate_ready:
+            return
 
-        for entity in self.monitor_activity_entities:
-            state: State | None = self.hass.states.get(entity)
+        self.remote_state = self.aggregator.is_on
+        self.activity_rate.set_state(monotonic(), self.remote_state)
+        self.history.append(time(), self.remote_state)
+
+        if (state := self.aggregator.last_updated) is not None:
+            self.remote_last_updated = state.last_updated
+            self.remote_friendly_name = state.name
+            self.remote_entity_id = state.entity_id
+
+        self.cancel_recent_expiry()
+
+        if (next_expiry := self.aggregator.next_expiry) is not None:
+            self.unsub_recent_expiry = async_call_later(
+                self.hass, next_expiry, self.async_recent_expired
+            )
+
+    # ------------------------------------------------------
+    @callback
+    def cancel_recent_expiry(self) -> None:
+        """Cancel the recent activity expiry timer."""
+
+        if self.unsub_recent_expiry is not None:
+            self.unsub_recent_expiry()
+            self.unsub_recent_expiry = None
+
+    # ------------------------------------------------------
+    async def async_recent_expired(self, _now: datetime) -> None:
+        """Recent activity of an entity expired."""
 
-            if state is not None:
-                if state.last_updated_timestamp > last_updated_timestamp:
-                    last_updated_timestamp = state.last_updated_timestamp
-                    last_updated = state.last_updated
-                    entity_name = state.name
-                    entity_id = state.entity_id
-
-                if (
-                    self.entry.options.get(CONF_ALL_ENTITIES_ON, False) is True
-                    and state.state == STATE_OFF
-                ):
-                    self.remote_state = False
-                elif (
-                    self.entry.options.get(CONF_ALL_ENTITIES_ON, False) is False
-                    and state.state == STATE_ON
-                ):
-                    self.remote_state = True
-
-        if last_updated_timestamp > 0.0:
-            self.remote_last_updated = last_updated
-            self.remote_friendly_name = entity_name
-            self.remote_entity_id = entity_id
+        self.unsub_recent_expiry = None
+        self.evaluation_count += 1
+        self.apply_aggregated_state()
+        await self.coordinator.async_refresh()
+
+    # ------------------------------------------------------
+    def get_rate_options(self) -> tuple[float, float]:
+        """Activity rate window and update interval in seconds from the options."""
+
+        return (
+            timedelta(**self.entry.options[CONF_DURATION_RATE_WINDOW]).total_seconds()
+            if self.entry.options.get(CONF_DURATION_RATE_WINDOW)
+            else DEFAULT_RATE_WINDOW,
+            float(
+                self.entry.options.get(
+                    CONF_RATE_UPDATE_INTERVAL, DEFAULT_RATE_UPDATE_INTERVAL
+                )
+            ),
+        )
+
+    # ------------------------------------------------------
+    def update_rate_attributes(self) -> bool:
+        """Update the activity rate attributes, returns if they changed."""
+
+        now: float = monotonic()
+        rate_attributes: dict[str, Any] = {
+            ATTR_ACTIVITY_EVENTS: self.activity_rate.event_count(now),
+            ATTR_ACTIVITY_DUTY_CYCLE: round(self.activity_rate.duty_cycle(now), 3),
+            ATTR_ACTIVITY_WINDOW: int(self.activity_rate.window),
+        }
+
+        if rate_attributes == self.rate_attributes:
+            return False
+
+        self.rate_attributes = rate_attributes
+        return True
+
+    # ------------------------------------------------------
+    @callback
+    def async_rate_interval(self, _now: datetime) -> None:
+        """Publish the activity rate at the update interval."""
+
+        if self.update_rate_attributes():
+            self.async_write_ha_state()
+
+    # ------------------------------------------------------
+    @callback
+    def track_rate_interval(self) -> None:
+        """Start publishing the activity rate."""
+
+        self.cancel_rate_interval()
+        self.update_rate_attributes()
+        self.unsub_rate_interval = async_track_time_interval(
+            self.hass,
+            self.async_rate_interval,
+            timedelta(seconds=self.rate_options[1]),
+        )
+
+    # ------------------------------------------------------
+    @callback
+    def cancel_rate_interval(self) -> None:
+        """Stop publishing the activity rate."""
+
+        if self.unsub_rate_interval is not None:
+            self.unsub_rate_interval()
+            self.unsub_rate_interval = None
+
+    # ------------------------------------------------------
+    def create_member_index(self) -> MemberIndex:
+        """Create member index from the entry options."""
+
+        return MemberIndex(
+            self.hass,
+            er.async_validate_entity_ids(
+                er.async_get(self.hass), self.entry.options.get(CONF_ENTITY_IDS, [])
+            ),
+            MemberSelectors.from_options(self.entry.options),
+        )
+
+    # ------------------------------------------------------
+    @callback
+    def async_apply_members(self) -> None:
+        """Apply changed members of the member index in place."""
+
+        members: list[str] = self.member_index.members
+
+        if members == self.monitor_activity_entities:
+            return
+
+        for entity in set(self.monitor_activity_entities).difference(members):
+            self.aggregator.remove_member(entity)
+            self.issues.async_delete_issue(f"{ISSUE_REASON_MISSING_ENTITY}_{entity}")
+
+        for entity in set(members).difference(self.monitor_activity_entities):
+            self.aggregator.add_member(entity, self.hass.states.get(entity))
+
+        self.monitor_activity_entities = members
+        self.track_monitor_activity_entities()
+
+    # ------------------------------------------------------
+    @callback
+    def _entity_registry_filter(
+        self, event_data: er.EventEntityRegistryUpdatedData
+    ) -> bool:
+        """Only registry changes of monitored entities, or all with selectors."""
+
+        if self.member_index.selectors.active:
+            return True
+
+        if event_data["action"] == "update":
+            return event_data.get("old_entity_id") in self.aggregator.states
+
+        return event_data[ATTR_ENTITY_ID] in self.aggregator.states
+
+    # ------------------------------------------------------
+    async def async_entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Entity renamed, removed, created or changed in the entity registry."""
+
+        self.registry_event_count += 1
+        entity_id: str = event.data[ATTR_ENTITY_ID]
+        old_entity_id: str | None = (
+            event.data.get("old_entity_id")
+            if event.data["action"] == "update"
+            else None
+        )
+
+        if event.data["action"] == "remove":
+            if entity_id in self.member_index.entity_ids:
+                self.async_create_issue_entity(
+                    entity_id, TRANSLATION_KEY_REMOTE_MISSING_ENTITY
+                )
+
+        self.member_index.update_entity(entity_id, old_entity_id)
+        self.async_apply_members()
+
+        if old_entity_id is not None:
+            if old_entity_id in self.entry.options.get(CONF_ENTITY_IDS, []):
+                self.shared.supress_update_listener = True
+                self.hass.config_entries.async_update_entry(
+                    self.entry,
+                    options={
+                        **self.entry.options,
+                        CONF_ENTITY_IDS: [
+                            entity_id if entity == old_entity_id else entity
+                            for entity in self.entry.options[CONF_ENTITY_IDS]
+                        ],
+                    },
+                )
+
+        self.apply_aggregated_state()
+        await self.coordinator.async_refresh()
+
+    # ------------------------------------------------------
+    @callback
+    def _device_registry_filter(
+        self, event_data: dr.EventDeviceRegistryUpdatedData
+    ) -> bool:
+        """Only area or label changes of devices when selected on."""
+
+        return (
+            self.member_index.selectors.uses_device
+            and event_data["action"] == "update"
+            and (
+                "area_id" in event_data["changes"] or "labels" in event_data["changes"]
+            )
+        )
+
+    # ------------------------------------------------------
+    async def async_device_registry_updated(
+        self, event: Event[dr.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Device area or labels changed."""
+
+        self.registry_event_count += 1
+        self.member_index.update_device(event.data["device_id"])
+        self.async_apply_members()
+        self.apply_aggregated_state()
+        await self.coordinator.async_refresh()
 
     # ------------------------------------------------------
     async def hass_started(self, _event: Event) -> None:
@@ -182,15 +529,39 @@ class RemoteAcitvityMonitorBinarySensor(ComponentEntityRemote, BinarySensorEntit
     async def async_added_to_hass(self) -> None:
         """Complete device setup after being added to hass."""
 
+        await self.async_restore_last_state()
+        await self.hass.async_add_executor_job(self.history.open)
+
         await self.coordinator.async_config_entry_first_refresh()
 
         RemoteAcitvityMonitorBinarySensor.class_entity_list.append(self)
 
+        self.aggregator.set_members(
+            {
+                entity: self.hass.states.get(entity)
+                for entity in self.monitor_activity_entities
+            }
+        )
+        self.track_monitor_activity_entities()
+        self.async_on_remove(self.untrack_monitor_activity_entities)
+        self.async_on_remove(self.cancel_recent_expiry)
+
+        self.track_rate_interval()
+        self.async_on_remove(self.cancel_rate_interval)
+
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED,
+                self.async_entity_registry_updated,
+                event_filter=self._entity_registry_filter,
+            )
+        )
+
         self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                self.monitor_activity_entities,
-                self.sensor_state_listener,
+            self.hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED,
+                self.async_device_registry_updated,
+                event_filter=self._device_registry_filter,
             )
         )
 
@@ -200,44 +571,141 @@ class RemoteAcitvityMonitorBinarySensor(ComponentEntityRemote, BinarySensorEntit
 
         self.async_on_remove(start.async_at_started(self.hass, self.hass_started))
 
+        self.shared.options_listeners.append(self.async_options_updated)
+        self.async_on_remove(
+            lambda: self.shared.options_listeners.remove(self.async_options_updated)
+        )
+
+        self.shared.diagnostics[self.entity_id] = self.diagnostics
+        self.async_on_remove(
+            lambda: self.shared.diagnostics.pop(self.entity_id, None)
+        )
+
+    # ------------------------------------------------------
+    def diagnostics(self) -> dict[str, Any]:
+        """Entity internals and hot path counters for diagnostics."""
+
+        return {
+            "monitored_entities": len(self.monitor_activity_entities),
+            "selected_entities": len(self.member_index.matched),
+            "on_count": self.aggregator.on_count,
+            "off_count": self.aggregator.off_count,
+            "aggregation_policy": self.aggregator.policy,
+            "weighted_on": self.aggregator.weighted_on,
+            "recent_count": len(self.aggregator.recent_off),
+            **self.rate_attributes,
+            "registry_event_count": self.registry_event_count,
+            "history_count": self.history.count,
+            "remote_state": self.remote_state,
+            "remote_entity_id": self.remote_entity_id,
+            "remote_last_updated": self.remote_last_updated.isoformat(),
+            "state_event_count": self.state_event_count,
+            "evaluation_count": self.evaluation_count,
+        }
+
+    # ------------------------------------------------------
+    @callback
+    def track_monitor_activity_entities(self) -> None:
+        """Track state changes of the monitored entities."""
+
+        self.untrack_monitor_activity_entities()
+        self.unsub_state_listener = async_track_state_change_event(
+            self.hass,
+            self.monitor_activity_entities,
+            self.sensor_state_listener,
+        )
+
+    # ------------------------------------------------------
+    @callback
+    def untrack_monitor_activity_entities(self) -> None:
+        """Stop tracking the monitored entities."""
+
+        if self.unsub_state_listener is not None:
+            self.unsub_state_listener()
+            self.unsub_state_listener = None
+
+    # ------------------------------------------------------
+    async def async_options_updated(self) -> None:
+        """Apply changed members, aggregation and activity rate options in place."""
+
+        self.member_index = self.create_member_index()
+
+        if self.member_index.members != self.monitor_activity_entities:
+            self.async_apply_members()
+            await self.async_verify_entity_exist()
+
+        await self.check_entities_state()
+
+        if (rate_options := self.get_rate_options()) != self.rate_options:
+            self.rate_options = rate_options
+            self.activity_rate = ActivityRate(
+                rate_options[0], RATE_BUCKETS, monotonic()
+            )
+            self.activity_rate.set_state(monotonic(), self.remote_state)
+            self.track_rate_interval()
+
+        self.async_write_ha_state()
+
+    # ------------------------------------------------------
+    async def async_restore_last_state(self) -> None:
+        """Restore last known state, it is reconciled when hass is started."""
+
+        if (last_state := await self.async_get_last_state()) is None:
+            return
+
+        self.remote_state = last_state.state == STATE_ON
+        self.remote_friendly_name = last_state.attributes.get(
+            ATTR_MONITOR_ACTIVITY_FRIENDLY_NAME, ""
+        )
+        self.remote_entity_id = last_state.attributes.get(
+            ATTR_MONITOR_ACTIVITY_ENTITY_ID, ""
+        )
+
+        if (
+            last_updated := dt_util.parse_datetime(
+                str(last_state.attributes.get(ATTR_MONITOR_ACTIVITY_LAST_UPDATED, ""))
+            )
+        ) is not None:
+            self.remote_last_updated = dt_util.as_local(last_updated)
+
     # ------------------------------------------------------
     async def async_verify_entity_exist(
         self,
     ) -> bool:
         """Verify entity exist."""
 
-        for entity in self.monitor_activity_entities:
+        all_exist: bool = True
+
+        for entity in self.member_index.entity_ids:
             state: State | None = self.hass.states.get(entity)
 
             if state is None:
-                await self.async_create_issue_entity(
+                self.async_create_issue_entity(
                     entity,
                     TRANSLATION_KEY_REMOTE_MISSING_ENTITY,
                 )
                 self.coordinator.update_interval = None
-                return False
+                all_exist = False
+            else:
+                self.issues.async_delete_issue(
+                    f"{ISSUE_REASON_MISSING_ENTITY}_{entity}"
+                )
 
-        return True
+        return all_exist
 
     # ------------------------------------------------------
     async def async_refresh(self) -> None:
         """Refresh dummy."""
 
     # ------------------------------------------------------------------
-    async def async_create_issue_entity(
-        self, entity_id: str, translation_key: str
-    ) -> None:
+    @callback
+    def async_create_issue_entity(self, entity_id: str, translation_key: str) -> str:
         """Create issue on entity."""
 
-        ir.async_create_issue(
-            self.hass,
-            DOMAIN,
-            DOMAIN_NAME + datetime.now().isoformat(),
-            issue_domain=DOMAIN,
-            is_fixable=False,
-            severity=ir.IssueSeverity.WARNING,
-            translation_key=translation_key,
-            translation_placeholders={
+        return self.issues.async_create_issue(
+            f"{ISSUE_REASON_MISSING_ENTITY}_{entity_id}",
+            translation_key,
+            {
                 "entity": entity_id,
                 "integration": self.entity_id,
             },
@@ -291,6 +759,7 @@ class RemoteAcitvityMonitorBinarySensor(ComponentEntityRemote, BinarySensorEntit
             ATTR_MONITOR_ACTIVITY_FRIENDLY_NAME: self.remote_friendly_name,
             ATTR_MONITOR_ACTIVITY_ENTITY_ID: self.remote_entity_id,
             ATTR_MONITOR_ACTIVITY_LAST_UPDATED: self.remote_last_updated.isoformat(),
+            **self.rate_attributes,
         }
 
     # ------------------------------------------------------
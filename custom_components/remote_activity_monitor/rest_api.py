@@ -1,6 +1,7 @@
 """Rest api connection to Home Assistant."""
 # borrowed from https://github.com/custom-components/remote_homeassistant
 
+from asyncio import Event
 from typing import Any
 
 from aiohttp import ClientSession
@@ -63,24 +64,44 @@ class EndpointMissing(exceptions.HomeAssistantError):
 # ------------------------------------------------------
 # ------------------------------------------------------
 class RestApi:
-    """Home Assistant REST API."""
+    """Home Assistant REST API.
 
-    # -------------------------
-    # @handle_retries(retries=5, retry_delay=10)
-    # async def async_post(
-    #     self, session: ClientSession, url: str, headers: dict, return_response: bool
-    # ) -> list[dict[str, Any]] | None:
-    #     """Post to hass rest api."""
-    #     async with session.post(url, headers=headers) as resp:
-    #         self._check_resp_status(resp.status)
+    A pending retry is abandoned when stop_event is set.
+    """
 
-    #         json = await resp.json()
+    # ------------------------------------------------------
+    def __init__(self, stop_event: Event | None = None) -> None:
+        """Init."""
+        self.stop_event: Event | None = stop_event
+
+    # ------------------------------------------------------
+    def set_parms_dyn(self) -> dict:
+        """Retry parameters for a call."""
+        return {"stop_event": self.stop_event}
+
+    # ------------------------------------------------------
+    @handle_retries(
+        retries=5,
+        retry_delay=5,
+        backoff=2,
+        max_delay=30,
+        jitter=0.1,
+        stop_on_exceptions=[InvalidAuth, EndpointMissing],
+    )
+    async def async_post(
+        self, session: ClientSession, url: str, headers: dict, return_response: bool
+    ) -> list[dict[str, Any]] | None:
+        """Post to hass rest api."""
+        async with session.post(url, headers=headers) as resp:
+            self._check_resp_status(resp.status)
+
+            json = await resp.json()
 
-    #         if return_response and (
-    #             not isinstance(json, dict) or "service_response" not in json
-    #         ):
-    #             raise BadResponse(f"Bad response data: {json}")
-    #     return json["service_response"] if return_response else None
+            if return_response and (
+                not isinstance(json, dict) or "service_response" not in json
+            ):
+                raise BadResponse(f"Bad response data: {json}")
+        return json["service_response"] if return_response else None
 
     # ------------------------------------------------------
     async def async_post_service(
@@ -97,23 +118,6 @@ class RestApi:
     ) -> list[dict[str, Any]] | None:
         """Post to hass rest api."""
 
-        # -------------------------
-        @handle_retries(retries=5, retry_delay=10)
-        async def async_post() -> list[dict[str, Any]] | None:
-            """Post to hass rest api."""
-            async with session.post(url, headers=headers) as resp:
-                self._check_resp_status(resp.status)
-
-                json = await resp.json()
-
-                if return_response and (
-                    not isinstance(json, dict) or "service_response" not in json
-                ):
-                    raise BadResponse(f"Bad response data: {json}")
-            return json["service_response"] if return_response else None
-
-        # -------------------------
-
         url = f"{'https' if secure else 'http'}://{host}:{port}/api/services/{domain}/{service}{'?return_response=true' if return_response else ''}"
 
         headers = {
@@ -122,7 +126,7 @@ class RestApi:
         }
         session: ClientSession = async_get_clientsession(hass, verify_ssl)
 
-        return await async_post()
+        return await self.async_post(session, url, headers, return_response)
 
     # ------------------------------------------------------
     def _check_resp_status(self, status: int) -> None:
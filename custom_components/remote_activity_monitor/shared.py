@@ -1,9 +1,15 @@
 """Shared functions/classes."""
 
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
 
 class Shared:
     """Shared."""
 
-    def __init__(self):
+    def __init__(self, options: Mapping[str, Any] | None = None):
         """Init."""
         self.supress_update_listener: bool = False
+        self.options: dict[str, Any] = dict(options) if options is not None else {}
+        self.options_listeners: list[Callable[[], Awaitable[None]]] = []
+        self.diagnostics: dict[str, Callable[[], dict[str, Any]]] = {}
@@ -4,10 +4,12 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_ON
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import (
     CONF_COMPONENT_TYPE,
@@ -38,7 +40,7 @@ async def async_setup_entry(
 
 # ------------------------------------------------------
 # ------------------------------------------------------
-class RemotePauseSwitch(SwitchEntity):
+class RemotePauseSwitch(SwitchEntity, RestoreEntity):
     """Implement the Remote activity monitor switch entity."""
 
     def __init__(
@@ -63,6 +65,13 @@ class RemotePauseSwitch(SwitchEntity):
             translation_key=TRANSLATION_KEY_REMOTE_DEVICE,
         )
 
+    # ------------------------------------------------------
+    async def async_added_to_hass(self) -> None:
+        """Restore pause state."""
+
+        if (last_state := await self.async_get_last_state()) is not None:
+            self.pause = last_state.state == STATE_ON
+
     @property
     # ------------------------------------------------------
     def is_on(self) -> bool:
@@ -107,7 +116,7 @@ class RemotePauseSwitch(SwitchEntity):
 
 # ------------------------------------------------------
 # ------------------------------------------------------
-class MainPauseSwitch(SwitchEntity):
+class MainPauseSwitch(SwitchEntity, RestoreEntity):
     """Implement the Main activity monitor switch entity."""
 
     def __init__(
@@ -132,6 +141,13 @@ class MainPauseSwitch(SwitchEntity):
             translation_key=TRANSLATION_KEY_MAIN_DEVICE,
         )
 
+    # ------------------------------------------------------
+    async def async_added_to_hass(self) -> None:
+        """Restore pause state."""
+
+        if (last_state := await self.async_get_last_state()) is not None:
+            self.pause = last_state.state == STATE_ON
+
     @property
     # ------------------------------------------------------
     def is_on(self) -> bool:
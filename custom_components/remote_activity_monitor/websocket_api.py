@@ -2,20 +2,32 @@
 # Inspiration and parts borrowed from https://github.com/custom-components/remote_homeassistant
 
 import asyncio
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Coroutine
 import contextlib
 from enum import StrEnum
 import inspect
+from time import perf_counter
+from typing import Any
 
 import aiohttp
 from aiohttp import ClientWebSocketResponse
 
 import homeassistant.components.websocket_api.auth as api
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import dt as dt_util
 
-from .const import DEFAULT_MAX_MSG_SIZE, HEARTBEAT_INTERVAL, HEARTBEAT_TIMEOUT, LOGGER
+from .const import (
+    DEFAULT_MAX_MSG_SIZE,
+    HEARTBEAT_INTERVAL,
+    HEARTBEAT_TIMEOUT,
+    LOGGER,
+    WEBSOCKET_MESSAGE_TIMINGS,
+    WEBSOCKET_RECONNECT_DELAY,
+)
 
 
 # ------------------------------------------------------
@@ -46,9 +58,15 @@ class RemoteWebsocketConnection:
         access_token: str,
         secure: bool = False,
         verify_ssl: bool = False,
+        entry: ConfigEntry | None = None,
     ) -> None:
-        """Initialize the connection."""
+        """Initialize the connection.
+
+        Background tasks are owned by entry, if given, so they are cancelled
+        when the entry is unloaded.
+        """
         self._hass: HomeAssistant = hass
+        self._entry: ConfigEntry | None = entry
         self._host: str = host
         self._port: int = port
         self._access_token: str = access_token
@@ -64,11 +82,21 @@ class RemoteWebsocketConnection:
 
         self._connection: ClientWebSocketResponse | None = None
         self._heartbeat_task = None
+        self._tasks: set[asyncio.Task] = set()
+        self._unsub_stop: CALLBACK_TYPE | None = None
         self._is_stopping: bool = False
         self._handlers: dict = {}
 
         self.__id: int = 1
 
+        self.reconnect_count: int = 0
+        self.last_connected: str | None = None
+        self.messages_sent: int = 0
+        self.messages_received: int = 0
+        self.message_timings: deque[dict[str, Any]] = deque(
+            maxlen=WEBSOCKET_MESSAGE_TIMINGS
+        )
+
     # ------------------------------------------------------
     async def async_connection_state_changed_event(self, state: ConnectionStateType):
         """Report connection state and Change."""
@@ -81,6 +109,26 @@ class RemoteWebsocketConnection:
             else:
                 self._on_connection_state_changed(state, self._get_url())
 
+    # ------------------------------------------------------
+    @callback
+    def _create_task(self, target: Coroutine, name: str) -> asyncio.Task:
+        """Create a tracked background task, cancelled on stop/unload."""
+
+        if self._entry is not None:
+            task = self._entry.async_create_background_task(self._hass, target, name)
+        else:
+            task = self._hass.async_create_background_task(target, name)
+
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    # ------------------------------------------------------
+    async def _async_stop_handler(self, _event: Event) -> None:
+        """Stop when Home Assistant is shutting down."""
+        self._unsub_stop = None
+        await self.async_stop()
+
     # ------------------------------------------------------
     @callback
     def _get_url(self) -> str:
@@ -102,11 +150,6 @@ class RemoteWebsocketConnection:
         self._on_disconnected = on_disconnected
         self._on_connection_state_changed = on_connection_state_changed
 
-        # ------------------------------------------------------
-        async def _async_stop_handler(event):
-            """Stop when Home Assistant is shutting down."""
-            await self.async_stop()
-
         url = self._get_url()
 
         session = async_get_clientsession(self._hass, self._verify_ssl)
@@ -126,20 +169,31 @@ class RemoteWebsocketConnection:
                     url, max_msg_size=DEFAULT_MAX_MSG_SIZE
                 )
             except aiohttp.client_exceptions.ClientError:
-                LOGGER.error("Could not connect to %s, retry in 10 seconds...", url)
+                LOGGER.error(
+                    "Could not connect to %s, retry in %d seconds...",
+                    url,
+                    WEBSOCKET_RECONNECT_DELAY,
+                )
+                self.reconnect_count += 1
                 await self.async_connection_state_changed_event(
                     ConnectionStateType.STATE_RECONNECTING
                 )
-                await asyncio.sleep(10)
+                await asyncio.sleep(WEBSOCKET_RECONNECT_DELAY)
             else:
                 LOGGER.info("Connected to home-assistant websocket at %s", url)
+                self.last_connected = dt_util.now().isoformat()
                 break
 
-        self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_handler)
+        if self._unsub_stop is None:
+            self._unsub_stop = self._hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._async_stop_handler
+            )
 
-        asyncio.ensure_future(self._async_recv())  # noqa: RUF006
+        self._create_task(self._async_recv(), "remote_activity_monitor websocket recv")
 
-        self._heartbeat_task = self._hass.loop.create_task(self._async_heartbeat_loop())
+        self._heartbeat_task = self._create_task(
+            self._async_heartbeat_loop(), "remote_activity_monitor websocket heartbeat"
+        )
 
     # ------------------------------------------------------
     async def _async_heartbeat_loop(self):
@@ -165,16 +219,28 @@ class RemoteWebsocketConnection:
                 LOGGER.warning("heartbeat failed")
 
                 # Schedule closing on event loop to avoid deadlock
-                asyncio.ensure_future(self._connection.close())  # noqa: RUF006
-                # self._background_tasks.add(tmp_task)
+                self._create_task(
+                    self._connection.close(), "remote_activity_monitor websocket close"
+                )
                 break
 
     # ------------------------------------------------------
     async def async_stop(self):
-        """Stop connection."""
+        """Stop connection and cancel all background tasks."""
         self._is_stopping = True
+
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+
         await self._async_disconnected()
 
+        current_task: asyncio.Task | None = asyncio.current_task()
+
+        for task in list(self._tasks):
+            if task is not current_task:
+                task.cancel()
+
         if self._connection is not None:
             await self._connection.close()
 
@@ -185,11 +251,11 @@ class RemoteWebsocketConnection:
         return _id
 
     # ------------------------------------------------------
-    async def async_call(self, handler, message_type, **extra_args) -> None:
-        """Call a websocket on the remote instance."""
+    async def async_call(self, handler, message_type, **extra_args) -> int | None:
+        """Call a websocket on the remote instance, returns the message id."""
         if self._connection is None:
             LOGGER.error("No remote websocket connection")
-            return
+            return None
 
         _id = self._next_id()
         self._handlers[_id] = handler
@@ -198,12 +264,19 @@ class RemoteWebsocketConnection:
             tmp_message = {"id": _id, "type": message_type, **extra_args}
             LOGGER.debug("Sending: %s", tmp_message)
 
-            await self._connection.send_json(
-                {"id": _id, "type": message_type, **extra_args}
-            )
+            await self._connection.send_json(tmp_message)
+            self.messages_sent += 1
         except aiohttp.client_exceptions.ClientError as err:
             LOGGER.error("remote websocket connection closed: %s", err)
             await self._async_disconnected()
+            return None
+
+        return _id
+
+    # ------------------------------------------------------
+    def remove_handler(self, _id: int) -> None:
+        """Remove handler for a message id when no more replies are expected."""
+        self._handlers.pop(_id, None)
 
     # ------------------------------------------------------
     async def _async_disconnected(self):
@@ -227,15 +300,14 @@ class RemoteWebsocketConnection:
         self._heartbeat_task = None
 
         if not self._is_stopping:
-            asyncio.ensure_future(  # noqa: RUF006
+            self._create_task(
                 self.async_connect(
                     self._on_connected,
                     self._on_disconnected,
                     self._on_connection_state_changed,
-                )
+                ),
+                "remote_activity_monitor websocket reconnect",
             )
-            # todo: Skal background task nulstilles?
-            # self._background_tasks.add(tmp_task)
 
     # ------------------------------------------------------
     async def _async_recv(self):
@@ -276,6 +348,9 @@ class RemoteWebsocketConnection:
 
             LOGGER.debug("received: %s", message)
 
+            self.messages_received += 1
+            handle_start: float = perf_counter()
+
             if message["type"] == api.TYPE_AUTH_OK:
                 await self.async_connection_state_changed_event(
                     ConnectionStateType.STATE_CONNECTED
@@ -283,7 +358,11 @@ class RemoteWebsocketConnection:
 
                 if self._on_connected is not None:
                     if inspect.iscoroutinefunction(self._on_connected):
-                        await self._on_connected()
+                        # Run as task, so the receive loop can answer heartbeats
+                        self._create_task(
+                            self._on_connected(),
+                            "remote_activity_monitor websocket on connected",
+                        )
                     else:
                         self._on_connected()
 
@@ -321,4 +400,35 @@ class RemoteWebsocketConnection:
                     else:
                         handler(message)
 
+            self.message_timings.append(
+                {
+                    "type": message["type"],
+                    "id": message.get("id"),
+                    "handle_ms": round((perf_counter() - handle_start) * 1000, 3),
+                }
+            )
+
         await self._async_disconnected()
+
+    # ------------------------------------------------------
+    def diagnostics(self) -> dict[str, Any]:
+        """Connection internals for diagnostics."""
+
+        return {
+            "connection_state": self.connection_state,
+            "secure": self._secure,
+            "verify_ssl": self._verify_ssl,
+            "is_stopping": self._is_stopping,
+            "reconnect_count": self.reconnect_count,
+            "reconnect_delay": WEBSOCKET_RECONNECT_DELAY,
+            "heartbeat_interval": HEARTBEAT_INTERVAL,
+            "heartbeat_running": self._heartbeat_task is not None,
+            "background_tasks": len(self._tasks),
+            "stop_listener": self._unsub_stop is not None,
+            "last_connected": self.last_connected,
+            "handlers": len(self._handlers),
+            "next_id": self.__id,
+            "messages_sent": self.messages_sent,
+            "messages_received": self.messages_received,
+            "message_timings": list(self.message_timings),
+        }